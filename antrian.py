@@ -0,0 +1,619 @@
+import time
+import warnings
+from collections import deque
+from dataclasses import dataclass
+from heapq import heappop, heappush
+
+import numpy as np
+
+from optimasi import CSRMatrix
+from statistik import gamma_cdf, gammaln, t_ppf
+
+# =============== RUMUS ERLANG ===============
+# Semua fungsi di-broadcast atas array (lam, mu, c, K) sehingga analisis what-if
+# banyak jumlah server cukup satu panggilan.
+
+
+def erlang_b(a, c):
+    """Peluang ditolak Erlang B untuk beban a = lam/mu dan c server.
+
+    Rekursi B(k) = a B(k-1) / (k + a B(k-1)) tidak memakai faktorial sehingga
+    tetap stabil untuk c ratusan atau ribuan. c berbeda per elemen diperbolehkan.
+    """
+    a, c = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(c))
+    if np.any(c < 0) or np.any(c != np.floor(c)):
+        raise ValueError("Jumlah server harus bilangan bulat tidak negatif")
+    c = c.astype(np.int64)
+    B = np.ones(a.shape)
+    for k in range(1, int(c.max(initial=0)) + 1):
+        B = np.where(k <= c, a * B / (k + a * B), B)
+    return B
+
+
+def erlang_c(a, c):
+    """Peluang pelanggan menunggu (Erlang C); 1 jika a >= c (antrian tidak stabil)."""
+    a = np.asarray(a, dtype=float)
+    B = erlang_b(a, c)
+    rho = a / np.asarray(c, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        C = B / (1 - rho * (1 - B))
+    return np.where(rho < 1, C, 1.0)
+
+
+# =============== MODEL M/M/c DAN M/M/c/K ===============
+@dataclass
+class QueueMetrics:
+    """Ukuran kinerja antrian; waktu dalam satuan yang sama dengan 1/lam.
+
+    throughput = laju pelanggan yang masuk (lam * (1 - p_block)); p_wait = peluang
+    pelanggan yang masuk harus menunggu; stable = False jika antrian tanpa batas
+    kapasitas kewalahan (lam >= c mu), dan ukuran waktu/panjang antrian bernilai inf.
+    """
+    utilization: np.ndarray
+    p0: np.ndarray
+    p_wait: np.ndarray
+    p_block: np.ndarray
+    Lq: np.ndarray
+    L: np.ndarray
+    Wq: np.ndarray
+    W: np.ndarray
+    throughput: np.ndarray
+    stable: np.ndarray
+
+
+def mmc(lam, mu, c=1, K=np.inf):
+    """Ukuran kinerja M/M/c (K = inf) atau M/M/c/K (K = kapasitas sistem, K >= c).
+
+    Semua peluang dinyatakan relatif terhadap p_c (peluang tepat c pelanggan):
+    sum_{n<=c} p_n / p_c = 1 / ErlangB(a, c) dan di atas c deret geometri rho^(n-c),
+    jadi a^c / c! hanya muncul dalam bentuk log untuk p0.
+    """
+    lam, mu, c, K = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (lam, mu, c, K)))
+    if np.any(lam < 0) or np.any(mu <= 0) or np.any(c < 1):
+        raise ValueError("lam tidak boleh negatif, mu harus positif dan c minimal 1")
+    if np.any(K < c):
+        raise ValueError("Kapasitas sistem K tidak boleh lebih kecil dari jumlah server c")
+    a = lam / mu
+    rho = a / c
+    B = erlang_b(a, c)
+    terbatas = np.isfinite(K)
+    N = np.where(terbatas, K - c, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # M/M/c/K: deret geometri terpotong, diskalakan rho^-N bila rho > 1
+        skala, ekor, geo, antre = _geometric_sums(rho, N)
+        Z = skala / B + geo
+        p_block = np.where(terbatas, ekor / Z, 0.0)
+        p_c_k = skala / Z
+        # M/M/c: sum_{n>c} p_n / p_c = rho / (1 - rho)
+        stable = terbatas | (rho < 1)
+        p_c = np.where(terbatas, p_c_k, np.where(stable, 1 / (1 / B + rho / (1 - rho)), 0.0))
+        throughput = lam * (1 - p_block)
+        # peluang menunggu: n >= c saat datang, bersyarat diterima
+        p_wait = np.where(terbatas, (skala + geo - ekor) / Z / (1 - p_block), p_c / (1 - rho))
+        Lq = np.where(terbatas, antre / Z, np.where(stable, p_c * rho / (1 - rho) ** 2, np.inf))
+        L = Lq + throughput / mu
+        Wq = np.where(stable, Lq / throughput, np.inf)
+        W = np.where(stable, L / throughput, np.inf)
+        # p0 = p_c c! / a^c dalam bentuk log; jika p_c underflow (c jauh di atas a)
+        # pakai sum_{n<=c} a^n/n! = e^a P(Poisson(a) <= c) dan p_n/p_c di atas c
+        log_ac = c * np.log(a) - gammaln(c + 1)
+        atas_c = np.where(terbatas, B * geo / skala, B * rho / (1 - rho))
+        poisson = np.exp(-a) / ((1 - gamma_cdf(a, c + 1)) * (1 + atas_c))
+        p0 = np.where(p_c > 0, np.exp(np.log(p_c) - log_ac), poisson)
+        p0 = np.where(lam == 0, 1.0, np.where(stable, p0, 0.0))
+        utilization = throughput / (c * mu)
+    p_wait = np.where(stable, p_wait, 1.0)
+    p_wait = np.where(lam == 0, 0.0, p_wait)
+    Lq = np.where(lam == 0, 0.0, Lq)
+    Wq = np.where(lam == 0, 0.0, Wq)
+    L = np.where(lam == 0, 0.0, L)
+    W = np.where(lam == 0, 1 / mu, W)
+    return QueueMetrics(utilization, p0, p_wait, p_block, Lq, L, Wq, W, throughput, stable)
+
+
+def _geometric_sums(rho, N, batas=1e-3):
+    """(s, s rho^N, s * sum_{j=1..N} rho^j, s * sum_{j=1..N} j rho^j) untuk N bulat,
+    dengan s = rho^-N jika rho > 1 (agar tidak overflow untuk K besar) dan 1 selainnya.
+
+    Bentuk tertutup kehilangan presisi saat rho mendekati 1, jadi elemen dengan
+    |1 - rho| < batas dijumlahkan langsung (s = 1).
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore", under="ignore"):
+        besar = rho > 1
+        skala = np.array(np.where(besar, rho ** -N, 1.0))
+        rN = np.array(np.where(besar, 1.0, rho ** N))
+        # rho > 1: pembilang dikalikan rho^-N, yaitu rN -> 1 dan 1 -> skala
+        geo = np.array(rho * (skala - rN) / (1 - rho))
+        antre = np.array(rho * (skala - (N + 1) * rN + N * rN * rho) / (1 - rho) ** 2)
+    dekat = (np.abs(1 - rho) < batas) & (N > 0)
+    if dekat.any():
+        r, n = rho[dekat], N[dekat]
+        g = np.zeros(r.size)
+        t = np.zeros(r.size)
+        pangkat = np.ones(r.size)
+        for j in range(1, int(n.max()) + 1):
+            pangkat *= r
+            ikut = j <= n
+            g += np.where(ikut, pangkat, 0.0)
+            t += np.where(ikut, j * pangkat, 0.0)
+        skala[dekat], rN[dekat], geo[dekat], antre[dekat] = 1.0, r ** n, g, t
+    geo = np.where(N == 0, 0.0, geo)
+    antre = np.where(N == 0, 0.0, antre)
+    return skala, rN, geo, antre
+
+
+# =============== PENJADWALAN PETUGAS (PROFIL KEDATANGAN) ===============
+@dataclass
+class StaffingPlan:
+    """Hasil staffing; semua field array berisi satu nilai per interval.
+
+    sla_servers = server minimum yang memenuhi SLA, servers = setelah
+    pertimbangan biaya (>= sla_servers); cost dalam Rp per jam dan total_cost
+    untuk seluruh profil (cost * lama interval).
+    """
+    servers: np.ndarray
+    sla_servers: np.ndarray
+    Wq: np.ndarray
+    service_level: np.ndarray
+    utilization: np.ndarray
+    cost: np.ndarray
+    total_cost: float
+    seconds: float
+
+
+def staffing(rates, mu, sla_wait, service_level=None, cost_waiting=0.0, cost_add_server=0.0,
+             interval_hours=0.25, vectorized=True, c_max=10_000):
+    """Jumlah server minimum per interval untuk profil laju kedatangan (Erlang C).
+    Jalur default (vectorized=True) mencari semua interval bersama dari batas
+    stabil; hanya vectorized=False yang memakai ulang jawaban interval sebelumnya.
+
+    SLA: rata-rata Wq <= sla_wait (harus > 0) jika service_level None, selain itu
+    P(Wq <= sla_wait) = 1 - C e^(-(c mu - lam) sla_wait) >= service_level.
+    Setelah SLA terpenuhi server terus ditambah selama biaya per jam
+    cost_add_server * c + cost_waiting * lam * Wq masih turun (Wq cembung di c).
+    Pencarian c memakai langkah Erlang B O(1): B(c+1) = a B / (c + 1 + a B) dan
+    kebalikannya. Jalur vektor menaikkan c dari floor(a) + 1; jalur per interval
+    mulai dari jawaban SLA interval sebelumnya lalu naik atau turun seperlunya.
+    Pencarian dibatasi c_max server per interval (ValueError jika terlampaui);
+    cost_waiting > 0 butuh cost_add_server > 0 agar minimum biaya ada.
+    """
+    lam = np.asarray(rates, dtype=float).ravel()
+    if np.any(lam < 0) or mu <= 0 or sla_wait < 0 or interval_hours <= 0:
+        raise ValueError("Laju kedatangan tidak boleh negatif; mu dan lama interval harus positif")
+    if service_level is not None and not 0 < service_level < 1:
+        raise ValueError("service_level harus di antara 0 dan 1")
+    if service_level is None and sla_wait <= 0:
+        raise ValueError("Batas rata-rata waktu tunggu harus positif (Wq = 0 tidak mungkin dicapai)")
+    if cost_waiting < 0 or cost_add_server < 0 or (cost_waiting > 0 and cost_add_server == 0):
+        raise ValueError("Biaya tidak boleh negatif, dan biaya tambah server harus positif jika ada "
+                         "biaya menunggu (tanpa itu biaya terus turun setiap server ditambah)")
+    mulai = time.perf_counter()
+    a = lam / mu
+    batas = np.where(lam > 0, np.floor(a) + 1, 0)
+
+    def cek_batas(c):
+        if np.any(c > c_max):
+            raise ValueError(f"Kebutuhan server melebihi c_max={c_max}; periksa laju, SLA dan biaya "
+                             "atau naikkan c_max")
+
+    cek_batas(batas)
+
+    def ukuran(c, B):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            C = B / (1 - a_ * (1 - B) / c)
+            sela = c * mu - lam_
+            Wq = np.where(lam_ > 0, C / sela, 0.0)
+            sl = np.where(lam_ > 0, 1 - C * np.exp(-sela * sla_wait), 1.0)
+        ok = Wq <= sla_wait if service_level is None else sl >= service_level
+        return Wq, sl, ok, cost_add_server * c + cost_waiting * lam_ * Wq
+
+    def naik(c, B):
+        return c + 1, a_ * B / (c + 1 + a_ * B)
+
+    if vectorized:
+        lam_, a_ = lam, a
+        c = batas.copy()
+        B = erlang_b(a, c)
+        # naikkan semua interval yang belum memenuhi SLA, lalu yang biayanya masih turun
+        aktif = ~ukuran(c, B)[2]
+        while aktif.any():
+            c_baru, B_baru = naik(c, B)
+            c, B = np.where(aktif, c_baru, c), np.where(aktif, B_baru, B)
+            cek_batas(c)
+            aktif &= ~ukuran(c, B)[2]
+        sla_c = c.copy()
+        aktif = lam > 0
+        while aktif.any():
+            c_baru, B_baru = naik(c, B)
+            aktif &= ukuran(c_baru, B_baru)[3] < ukuran(c, B)[3]
+            c, B = np.where(aktif, c_baru, c), np.where(aktif, B_baru, B)
+            cek_batas(c)
+    else:
+        c = np.zeros(lam.size)
+        sla_c = np.zeros(lam.size)
+        B = np.ones(lam.size)
+        sebelum = 0
+        for i in range(lam.size):
+            lam_, a_ = lam[i], a[i]
+            if lam_ == 0:
+                continue
+            k = max(sebelum, batas[i])
+            b = float(erlang_b(a_, k))
+            while not ukuran(k, b)[2]:
+                k, b = naik(k, b)
+                cek_batas(k)
+            # turun selama server yang lebih sedikit masih stabil dan memenuhi SLA
+            while k - 1 >= batas[i]:
+                b_turun = k * b / (a_ * (1 - b))
+                if not ukuran(k - 1, b_turun)[2]:
+                    break
+                k, b = k - 1, b_turun
+            sla_c[i] = k
+            while True:
+                k_baru, b_baru = naik(k, b)
+                if ukuran(k_baru, b_baru)[3] >= ukuran(k, b)[3]:
+                    break
+                k, b = k_baru, b_baru
+                cek_batas(k)
+            c[i], B[i], sebelum = k, b, sla_c[i]
+        lam_, a_ = lam, a
+    Wq, sl, _, biaya = ukuran(c, B)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        utilisasi = np.where(c > 0, a / c, 0.0)
+    return StaffingPlan(
+        servers=c.astype(int),
+        sla_servers=sla_c.astype(int),
+        Wq=Wq,
+        service_level=sl,
+        utilization=utilisasi,
+        cost=biaya,
+        total_cost=float(biaya.sum() * interval_hours),
+        seconds=time.perf_counter() - mulai,
+    )
+
+
+# =============== JARINGAN ANTRIAN (JACKSON) ===============
+@dataclass
+class NetworkMetrics:
+    """Hasil jackson_network. arrival_rates = laju total per stasiun (solusi
+    persamaan lalu lintas), visits = rata-rata kunjungan per pelanggan,
+    sojourn_from = waktu sampai keluar jaringan jika masuk di stasiun itu,
+    sojourn_time = rata-rata waktu di jaringan (hukum Little) dan L = total
+    pelanggan di jaringan. stations berisi ukuran M/M/c per stasiun."""
+    arrival_rates: np.ndarray
+    visits: np.ndarray
+    stations: QueueMetrics
+    sojourn_from: np.ndarray
+    sojourn_time: float
+    L: float
+    stable: bool
+
+
+def jackson_network(external, mu, c=1, routing=None, dense_limit=500, tol=1e-12, max_iter=100_000):
+    """Jaringan antrian terbuka Jackson dengan stasiun M/M/c.
+
+    external = laju kedatangan dari luar (gamma) per stasiun; routing = matriks
+    P (array padat atau optimasi.CSRMatrix) dengan P[i, j] = peluang pindah dari
+    i ke j, sisanya 1 - sum_j P[i, j] keluar jaringan. Persamaan lalu lintas
+    (I - P^T) lam = gamma dan waktu sampai keluar (I - P) T = W diselesaikan
+    dengan np.linalg.solve jika stasiun <= dense_limit; di atasnya dipakai
+    iterasi x = b + P^T x atas CSRMatrix (O(nnz) per iterasi) sampai perubahan
+    relatif < tol.
+    """
+    gamma = np.asarray(external, dtype=float).ravel()
+    n = gamma.size
+    if np.any(gamma < 0) or gamma.sum() <= 0:
+        raise ValueError("Laju kedatangan luar tidak boleh negatif dan minimal satu stasiun positif")
+    if routing is None:
+        P = CSRMatrix.from_coo([], [], [], (n, n))
+    elif isinstance(routing, CSRMatrix):
+        P = routing
+    else:
+        P = CSRMatrix.from_dense(routing)
+    if P.shape != (n, n):
+        raise ValueError(f"Matriks routing harus berukuran {n}x{n}")
+    if np.any(P.data < 0) or np.any(np.bincount(P.rows, P.data, minlength=n) > 1 + 1e-12):
+        raise ValueError("Peluang routing tidak boleh negatif dan jumlah per baris maksimal 1")
+    lam = _solve_routing(P, gamma, True, dense_limit, tol, max_iter)
+    mu, c = (np.broadcast_to(np.asarray(v, dtype=float), (n,)) for v in (mu, c))
+    stable = bool(np.all(lam < c * mu))
+    metrik = mmc(lam, mu, c)
+    if stable:
+        W = metrik.W
+        sojourn_from = _solve_routing(P, W, False, dense_limit, tol, max_iter)
+        L = float(metrik.L.sum())
+    else:
+        sojourn_from = np.full(n, np.inf)
+        L = np.inf
+    return NetworkMetrics(
+        arrival_rates=lam,
+        visits=lam / gamma.sum(),
+        stations=metrik,
+        sojourn_from=sojourn_from,
+        sojourn_time=L / gamma.sum(),
+        L=L,
+        stable=stable,
+    )
+
+
+def _solve_routing(P, b, transpose, dense_limit, tol, max_iter):
+    """Selesaikan (I - P^T) x = b (transpose=True) atau (I - P) x = b."""
+    n = b.size
+    if n <= dense_limit:
+        A = P.toarray()
+        A = np.eye(n) - (A.T if transpose else A)
+        try:
+            x = np.linalg.solve(A, b)
+        except np.linalg.LinAlgError:
+            x = np.full(n, np.nan)
+    else:
+        kali = P.tdot if transpose else P.dot
+        x = b.copy()
+        for _ in range(max_iter):
+            baru = b + kali(x)
+            if np.all(np.abs(baru - x) <= tol * np.maximum(np.abs(baru), 1.0)):
+                x = baru
+                break
+            x = baru
+        else:
+            x = np.full(n, np.nan)
+    if not np.all(np.isfinite(x)) or np.any(x < -1e-9 * np.abs(x).max(initial=1.0)):
+        raise ValueError("Jaringan tidak terbuka: ada siklus routing tanpa jalan keluar")
+    return np.maximum(x, 0.0)
+
+
+# =============== SIMULASI KEJADIAN DISKRIT ===============
+DISTRIBUSI_WAKTU = ("exponential", "lognormal", "gamma", "deterministic", "empirical")
+
+_DATANG, _SELESAI = 0, 1
+
+
+def _variates(rng, distribution, mean, cv, size, data=None):
+    """Waktu acak positif dengan rata-rata mean dan koefisien variasi cv;
+    "empirical" mengambil ulang (dengan pengembalian) dari data apa adanya."""
+    if distribution == "empirical":
+        return rng.choice(data, size)
+    if distribution == "exponential":
+        return rng.exponential(mean, size)
+    if distribution == "deterministic" or cv == 0:
+        return np.full(size, float(mean))
+    if distribution == "lognormal":
+        s2 = np.log1p(cv * cv)
+        return rng.lognormal(np.log(mean) - s2 / 2, np.sqrt(s2), size)
+    if distribution == "gamma":
+        return rng.gamma(1 / (cv * cv), mean * cv * cv, size)
+    raise ValueError(f"distribution tidak dikenal: {distribution!r}")
+
+
+def _aliran(bangkit, block):
+    """Iterator tak hingga atas bangkit(block); variat dibangkitkan per blok agar
+    loop kejadian tidak memanggil generator acak satu per satu."""
+    while True:
+        yield from bangkit(block).tolist()
+
+
+class _Pelanggan:
+    __slots__ = ("nomor", "datang")
+
+    def __init__(self, nomor, datang):
+        self.nomor = nomor
+        self.datang = datang
+
+
+@dataclass
+class QueueSimulation:
+    """Hasil simulate_queue. Setiap ukuran punya pasangan *_hw = setengah lebar
+    selang kepercayaan (batch means), jadi selangnya W +- W_hw."""
+    W: float
+    Wq: float
+    L: float
+    Lq: float
+    W_hw: float
+    Wq_hw: float
+    L_hw: float
+    Lq_hw: float
+    utilization: float
+    balk_rate: float
+    customers: int
+    seconds: float
+
+    def interval(self, nama):
+        """Selang kepercayaan (bawah, atas) untuk "W", "Wq", "L" atau "Lq"."""
+        tengah, hw = getattr(self, nama), getattr(self, nama + "_hw")
+        return tengah - hw, tengah + hw
+
+
+def simulate_queue(lam, mu, c=1, customers=1_000_000, arrival="exponential", arrival_cv=1.0,
+                   service="exponential", service_cv=1.0, K=np.inf, balking=None, warmup=0.1,
+                   batches=30, confidence=0.95, seed=None, block=1 << 16,
+                   arrival_data=None, service_data=None):
+    """Simulasi kejadian diskrit antrian G/G/c(/K) FIFO dengan balking.
+
+    Kalender kejadian berupa heap (heapq) berisi kedatangan berikutnya dan
+    kepergian dari server yang sibuk. Waktu antar kedatangan (rata-rata 1/lam),
+    waktu layanan (rata-rata 1/mu) dan bilangan acak balking dibangkitkan per blok
+    sebagai array NumPy. balking: urutan peluang pelanggan pergi jika melihat n
+    orang di sistem (indeks n; n di luar urutan memakai nilai terakhir); pelanggan
+    yang datang saat sistem berisi K orang selalu ditolak. Fraksi warmup pelanggan
+    pertama dibuang, sisanya dibagi menjadi `batches` batch berurutan dan selang
+    kepercayaan memakai distribusi t atas rata-rata batch. Distribusi "empirical"
+    memakai arrival_data/service_data (lam atau mu diabaikan untuk aliran itu).
+    """
+    if lam <= 0 or mu <= 0 or c < 1 or K < c or customers < 1:
+        raise ValueError("lam, mu dan customers harus positif, c minimal 1 dan K >= c")
+    if not 0 <= warmup < 1 or batches < 2:
+        raise ValueError("warmup harus dalam [0, 1) dan batches minimal 2")
+    arrival_data = _cek_distribusi(arrival, arrival_data)
+    service_data = _cek_distribusi(service, service_data)
+    mulai = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    antar = _aliran(lambda m: _variates(rng, arrival, 1 / lam, arrival_cv, m, arrival_data), block)
+    layanan = _aliran(lambda m: _variates(rng, service, 1 / mu, service_cv, m, service_data), block)
+    peluang_balk = None if balking is None else [float(p) for p in balking]
+    acak = _aliran(rng.random, block) if peluang_balk else None
+
+    n_buang = int(warmup * customers)
+    ukuran = max((customers - n_buang) // batches, 1)
+    batas = [n_buang + k * ukuran for k in range(batches + 1)]
+    # pelanggan ke-batas[-1] hanya penanda akhir batch terakhir, tidak dilayani
+    total = batas[-1]
+    batas = set(batas)
+    tunggu = [np.nan] * total
+    sistem = [np.nan] * total
+    potret = []
+
+    # nama lokal mempercepat loop kejadian Python
+    push, pop, ambil_antar, ambil_layanan = heappush, heappop, antar.__next__, layanan.__next__
+    kalender = [(ambil_antar(), 0, _DATANG, None)]
+    urutan = 1
+    antre = deque()
+    n = sibuk = nomor = ditolak = 0
+    t_lalu = luas_L = luas_Lq = luas_sibuk = 0.0
+    while kalender:
+        t, _, jenis, orang = pop(kalender)
+        dt = t - t_lalu
+        luas_L += n * dt
+        luas_Lq += (n - sibuk) * dt
+        luas_sibuk += sibuk * dt
+        t_lalu = t
+        if jenis == _DATANG:
+            if nomor in batas:
+                potret.append((t, luas_L, luas_Lq, luas_sibuk, ditolak))
+            if nomor == total:
+                continue
+            push(kalender, (t + ambil_antar(), urutan, _DATANG, None))
+            urutan += 1
+            i = nomor
+            nomor += 1
+            if n >= K or (peluang_balk and next(acak) < peluang_balk[min(n, len(peluang_balk) - 1)]):
+                ditolak += 1
+                continue
+            n += 1
+            orang = _Pelanggan(i, t)
+            if sibuk < c:
+                sibuk += 1
+                tunggu[i] = 0.0
+                push(kalender, (t + ambil_layanan(), urutan, _SELESAI, orang))
+                urutan += 1
+            else:
+                antre.append(orang)
+        else:
+            n -= 1
+            sistem[orang.nomor] = t - orang.datang
+            if antre:
+                berikut = antre.popleft()
+                tunggu[berikut.nomor] = t - berikut.datang
+                push(kalender, (t + ambil_layanan(), urutan, _SELESAI, berikut))
+                urutan += 1
+            else:
+                sibuk -= 1
+
+    potret = np.array(potret)
+    durasi = np.diff(potret[:, 0])
+    per_batch = {
+        "L": np.diff(potret[:, 1]) / durasi,
+        "Lq": np.diff(potret[:, 2]) / durasi,
+    }
+    with warnings.catch_warnings():
+        # batch yang semua pelanggannya balking memberi nan dan diabaikan
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for nama, data in (("W", sistem), ("Wq", tunggu)):
+            nilai = np.array(data[n_buang:]).reshape(batches, ukuran)
+            per_batch[nama] = np.nanmean(nilai, axis=1)
+    hasil = {}
+    for nama, nilai in per_batch.items():
+        nilai = nilai[np.isfinite(nilai)]
+        hasil[nama] = float(nilai.mean()) if nilai.size else np.nan
+        hasil[nama + "_hw"] = _half_width(nilai, confidence)
+    jendela = potret[-1, 0] - potret[0, 0]
+    masuk = total - n_buang
+    return QueueSimulation(
+        **hasil,
+        utilization=float((potret[-1, 3] - potret[0, 3]) / (c * jendela)),
+        balk_rate=float((potret[-1, 4] - potret[0, 4]) / masuk),
+        customers=masuk,
+        seconds=time.perf_counter() - mulai,
+    )
+
+
+def _cek_distribusi(distribution, data):
+    if distribution not in DISTRIBUSI_WAKTU:
+        raise ValueError(f"distribution tidak dikenal: {distribution!r}")
+    if distribution != "empirical":
+        return None
+    data = np.asarray(data if data is not None else [], dtype=float).ravel()
+    if data.size == 0 or np.any(data < 0) or not np.all(np.isfinite(data)) or data.sum() == 0:
+        raise ValueError("Distribusi empirical butuh data waktu yang tidak negatif dan tidak kosong")
+    return data
+
+
+def _half_width(nilai, confidence):
+    """Setengah lebar selang kepercayaan rata-rata dengan distribusi t."""
+    if nilai.size < 2:
+        return np.nan
+    return float(t_ppf(0.5 + confidence / 2, nilai.size - 1) * nilai.std(ddof=1) / np.sqrt(nilai.size))
+
+
+# =============== SIMULASI CEPAT G/G/1 (REKURSI LINDLEY) ===============
+def simulate_gg1(lam, mu, customers=10_000_000, arrival="exponential", arrival_cv=1.0,
+                 service="exponential", service_cv=1.0, arrival_data=None, service_data=None,
+                 warmup=0.1, batches=30, confidence=0.95, chunk=1 << 20, seed=None):
+    """Antrian G/G/1 FIFO lewat rekursi Lindley Wq(n+1) = max(0, Wq(n) + S(n) - A(n+1))
+    tanpa mesin kejadian.
+
+    Dengan U = cumsum(S(n-1) - A(n)) dalam satu potongan (chunk pelanggan),
+    Wq(n) = U(n) - min(-Wq_awal, min_{k<=n} U(k)), jadi satu potongan cukup satu
+    cumsum dan satu np.minimum.accumulate; Wq dan S pelanggan terakhir dibawa ke
+    potongan berikutnya (cumsum per potongan juga menjaga presisi). Distribusi dan
+    batch means sama seperti simulate_queue; L dan Lq per batch dari hukum Little
+    atas jumlah waktu di batch dibagi rentang waktu kedatangannya. Hasilnya
+    QueueSimulation dengan balk_rate 0.
+    """
+    if lam <= 0 or mu <= 0 or customers < 1:
+        raise ValueError("lam, mu dan customers harus positif")
+    if not 0 <= warmup < 1 or batches < 2:
+        raise ValueError("warmup harus dalam [0, 1) dan batches minimal 2")
+    arrival_data = _cek_distribusi(arrival, arrival_data)
+    service_data = _cek_distribusi(service, service_data)
+    mulai = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    n_buang = int(warmup * customers)
+    ukuran = max((customers - n_buang) // batches, 1)
+    total = n_buang + ukuran * batches
+    # jumlah per batch: Wq, S, waktu antar kedatangan
+    jumlah_wq, jumlah_s, rentang = (np.zeros(batches) for _ in range(3))
+    wq_lalu = s_lalu = 0.0
+    for awal in range(0, total, chunk):
+        m = min(chunk, total - awal)
+        A = _variates(rng, arrival, 1 / lam, arrival_cv, m, arrival_data)
+        S = _variates(rng, service, 1 / mu, service_cv, m, service_data)
+        X = np.empty(m)
+        X[0] = s_lalu - A[0]
+        np.subtract(S[:-1], A[1:], out=X[1:])
+        U = np.cumsum(X)
+        Wq = U - np.minimum(np.minimum.accumulate(U), -wq_lalu)
+        wq_lalu, s_lalu = Wq[-1], S[-1]
+        lewat = max(n_buang - awal, 0)
+        if lewat >= m:
+            continue
+        batch = (np.arange(awal + lewat, awal + m) - n_buang) // ukuran
+        jumlah_wq += np.bincount(batch, Wq[lewat:], batches)
+        jumlah_s += np.bincount(batch, S[lewat:], batches)
+        rentang += np.bincount(batch, A[lewat:], batches)
+    per_batch = {
+        "W": (jumlah_wq + jumlah_s) / ukuran,
+        "Wq": jumlah_wq / ukuran,
+        "L": (jumlah_wq + jumlah_s) / rentang,
+        "Lq": jumlah_wq / rentang,
+    }
+    hasil = {}
+    for nama, nilai in per_batch.items():
+        hasil[nama] = float(nilai.mean())
+        hasil[nama + "_hw"] = _half_width(nilai, confidence)
+    return QueueSimulation(
+        **hasil,
+        utilization=float(min(jumlah_s.sum() / rentang.sum(), 1.0)),
+        balk_rate=0.0,
+        customers=total - n_buang,
+        seconds=time.perf_counter() - mulai,
+    )
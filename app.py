@@ -3,6 +3,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import math
 
+from optimasi import solve_lp
+
 # Judul aplikasi
 st.title("Aplikasi Model Matematika Industri")
 st.write("""
@@ -38,23 +40,12 @@ if menu == "Optimasi Produksi":
     
     # Hitung solusi optimal
     if st.button("Hitung Solusi Optimal"):
-        # Hitung titik potong
-        x_max = total_time / time_a
-        y_max = total_time / time_b
-        
-        # Hitung keuntungan di setiap titik ekstrim
-        profit_x = profit_a * x_max
-        profit_y = profit_b * y_max
-        
-        # Tentukan solusi optimal
-        if profit_x > profit_y:
-            optimal_x = x_max
-            optimal_y = 0
-            max_profit = profit_x
-        else:
-            optimal_x = 0
-            optimal_y = y_max
-            max_profit = profit_y
+        hasil = solve_lp([profit_a, profit_b], [[time_a, time_b]], [total_time])
+        if not hasil.success:
+            st.error(f"Solver gagal: {hasil.message}")
+            st.stop()
+        optimal_x, optimal_y = hasil.x
+        max_profit = hasil.objective
         
         # Tampilkan hasil
         st.subheader("Hasil Optimasi")
@@ -63,8 +54,9 @@ if menu == "Optimasi Produksi":
         
         # Visualisasi
         fig, ax = plt.subplots()
+        x_max = total_time / time_a if time_a > 0 else max(optimal_x, 1.0)
         x = np.linspace(0, x_max, 100)
-        y = (total_time - time_a * x) / time_b
+        y = (total_time - time_a * x) / time_b if time_b > 0 else np.full_like(x, optimal_y)
         
         ax.plot(x, y, label='Kendala Waktu Mesin')
         ax.fill_between(x, 0, y, alpha=0.1)
@@ -0,0 +1,117 @@
+import time
+
+import numpy as np
+
+import optimasi
+from optimasi import CSRMatrix, plan_multiperiod, solve_lp
+
+# =============== BENCHMARK LP: DENSE VS CSR ===============
+# Jalankan: python benchmark_lp.py
+
+
+def buat_model_pabrik(n_produk, n_mesin, mesin_per_produk=3, seed=0):
+    """Model produksi acak: tiap produk hanya memakai beberapa mesin."""
+    rng = np.random.default_rng(seed)
+    cols = np.repeat(np.arange(n_produk), mesin_per_produk)
+    rows = np.concatenate([rng.choice(n_mesin, mesin_per_produk, replace=False) for _ in range(n_produk)])
+    vals = rng.uniform(0.5, 5.0, cols.size)
+    order = np.lexsort((cols, rows))
+    rows, cols, vals = rows[order], cols[order], vals[order]
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=n_mesin))])
+    A = CSRMatrix(indptr, cols, vals, (n_mesin, n_produk))
+    b = rng.uniform(200, 2000, n_mesin)
+    c = rng.uniform(10, 100, n_produk)
+    bounds = np.column_stack([np.zeros(n_produk), rng.uniform(5, 50, n_produk)])
+    return c, A, b, bounds
+
+
+def buat_model_impor(n_produk, n_mesin, seed=0):
+    """Model pabrik "mentah": baris kapasitas duplikat, batas permintaan sebagai
+    baris kendala x_j <= cap, dan sebagian produk dengan permintaan 0."""
+    c, A, b, bounds = buat_model_pabrik(n_produk, n_mesin, seed=seed)
+    rng = np.random.default_rng(seed)
+    rows, cols, vals = A.to_coo()
+    dup = rng.choice(n_mesin, n_mesin // 4, replace=False)
+    pilih = np.isin(rows, dup)
+    nomor_dup = np.full(n_mesin, -1)
+    nomor_dup[dup] = np.arange(dup.size)
+    cap = bounds[:, 1].copy()
+    cap[rng.random(n_produk) < 0.2] = 0
+    R = np.concatenate([rows, n_mesin + nomor_dup[rows[pilih]], n_mesin + dup.size + np.arange(n_produk)])
+    C = np.concatenate([cols, cols[pilih], np.arange(n_produk)])
+    V = np.concatenate([vals, 2 * vals[pilih], np.ones(n_produk)])
+    B = np.concatenate([b, 2.2 * b[dup], cap])
+    return c, CSRMatrix.from_coo(R, C, V, (n_mesin + dup.size + n_produk, n_produk)), B
+
+
+def ukur(label, c, A, b, bounds, nbytes, presolve=False, method="auto"):
+    mulai = time.perf_counter()
+    hasil = solve_lp(c, A, b, bounds=bounds, presolve=presolve, method=method)
+    durasi = time.perf_counter() - mulai
+    print(f"{label:8s} {durasi:8.3f} s  {hasil.iterations:6d} iterasi  "
+          f"Z = {hasil.objective:,.2f}  memori A = {nbytes / 1e6:.1f} MB")
+    return hasil
+
+
+if __name__ == "__main__":
+    for n_produk, n_mesin in [(10_000, 100), (10_000, 300)]:
+        c, A_csr, b, bounds = buat_model_pabrik(n_produk, n_mesin)
+        A_dense = A_csr.toarray()
+        print(f"\n{n_produk} produk x {n_mesin} mesin, nnz = {A_csr.nnz} "
+              f"({A_csr.nnz / A_dense.size:.2%} terisi)")
+        # simpleks untuk keduanya agar yang dibandingkan hanya format matriksnya
+        dense = ukur("dense", c, A_dense, b, bounds, A_dense.nbytes, method="simplex")
+        csr = ukur("csr", c, A_csr, b, bounds,
+                   A_csr.data.nbytes + A_csr.indices.nbytes + A_csr.indptr.nbytes, method="simplex")
+        print(f"selisih Z: {abs(dense.objective - csr.objective):.2e}")
+
+    # presolve pada model impor (baris duplikat, batas permintaan sebagai baris)
+    c, A_csr, b = buat_model_impor(1000, 50)
+    nbytes = A_csr.data.nbytes + A_csr.indices.nbytes + A_csr.indptr.nbytes
+    print(f"\nModel impor {A_csr.shape[1]} produk x {A_csr.shape[0]} baris kendala")
+    tanpa = ukur("tanpa", c, A_csr, b, None, nbytes)
+    dengan = ukur("presolve", c, A_csr, b, None, nbytes, presolve=True)
+    print(f"selisih Z: {abs(tanpa.objective - dengan.objective):.2e}")
+
+    # katalog satu mesin: otomatis lewat jalur cepat knapsack pecahan
+    rng = np.random.default_rng(0)
+    n_produk = 100_000
+    c = rng.uniform(10, 100, n_produk)
+    waktu = rng.uniform(0.5, 5.0, n_produk)
+    bounds = np.column_stack([np.zeros(n_produk), rng.uniform(5, 50, n_produk)])
+    print(f"\nKatalog {n_produk} produk x 1 mesin")
+    ukur("greedy", c, waktu[None, :], [100_000.0], bounds, waktu.nbytes)
+
+    # model padat berkopling kuat: simpleks vs interior-point (Mehrotra)
+    rng = np.random.default_rng(0)
+    n_kendala, n_produk = 1000, 1000
+    A_padat = rng.uniform(0, 1, (n_kendala, n_produk))
+    b = rng.uniform(0.2, 1, n_kendala) * n_produk * 0.3
+    c = rng.uniform(1, 10, n_produk) + 0.5 * A_padat.sum(axis=0)
+    bounds = np.column_stack([np.zeros(n_produk), rng.uniform(1, 5, n_produk)])
+    print(f"\nModel padat {n_produk} produk x {n_kendala} kendala")
+    for metode, crossover in [("simplex", True), ("ipm", False), ("ipm", True)]:
+        mulai = time.perf_counter()
+        hasil = solve_lp(c, A_padat, b, bounds=bounds, method=metode, crossover=crossover)
+        label = metode + ("+crossover" if metode == "ipm" and crossover else "")
+        print(f"{label:14s} {time.perf_counter() - mulai:8.3f} s  Z = {hasil.objective:,.4f}")
+
+
+    # rencana produksi mingguan berbentuk tangga: simpleks (basis padat) vs interior-point berpita
+    rng = np.random.default_rng(0)
+    K, R = 10, 3
+    profit = rng.uniform(5, 50, K)
+    usage = rng.uniform(0.5, 3, (R, K))
+    print(f"\nRencana multi-periode {K} produk x {R} sumber daya")
+    asli = optimasi.PLAN_SIMPLEX_MAX_ROWS
+    for T in (52, 104, 260):
+        musim = 1 + 0.4 * np.sin(2 * np.pi * np.arange(T) / 52)
+        demand = rng.uniform(20, 80, (T, K)) * musim[:, None]
+        cap = np.tile((usage @ demand.T).mean(axis=1) * 0.85, (T, 1))
+        for label, batas in [("simplex", 10 ** 9), ("ipm", 0)]:
+            optimasi.PLAN_SIMPLEX_MAX_ROWS = batas
+            mulai = time.perf_counter()
+            hasil = plan_multiperiod(profit, usage, cap, demand, holding_cost=0.3 * profit)
+            print(f"T={T:<4d} {label:8s} {time.perf_counter() - mulai:8.3f} s  {hasil.iterations:6d} iterasi  "
+                  f"Z = {hasil.objective:,.2f}")
+    optimasi.PLAN_SIMPLEX_MAX_ROWS = asli
@@ -2,6 +2,8 @@ import streamlit as st
 import matplotlib.pyplot as plt
 import numpy as np
 
+from optimasi import plan_multiperiod
+
 st.title("🔥 Optimasi Produksi PT. Bakar-Bakar")
 
 # Input Parameter
@@ -9,38 +11,63 @@ st.header("📊 Masukkan Parameter")
 col1, col2 = st.columns(2)
 with col1:
     waktu_harian = st.number_input("Total Waktu Harian (menit)", value=240)
+    permintaan_sosis = st.number_input("Permintaan Harian Sosis Bakar (maks)", value=60)
+    permintaan_baso = st.number_input("Permintaan Harian Baso Bakar (maks)", value=50)
 with col2:
-    waktu_mingguan = st.number_input("Total Waktu Mingguan (menit)", value=1200)
+    jumlah_minggu = st.number_input("Jumlah Minggu Perencanaan (5 hari kerja)", min_value=1, value=52)
+    lonjakan_jumat = st.slider("Kenaikan Permintaan Hari Jumat (%)", 0, 200, 100)
+    biaya_simpan = st.number_input("Biaya Simpan per Unit per Hari (Rp)", value=50)
 
 # Hitung Solusi
 if st.button("🎯 Hitung Solusi Optimal"):
-    # Solusi Harian
-    y_harian = waktu_harian / 3
-    z_harian = 1000 * y_harian
+    # Model: maks 500x + 1000y - biaya simpan, dengan 2x + 3y <= waktu harian,
+    # penjualan <= permintaan, dan stok yang tidak terjual dibawa ke hari berikutnya
+    hari = 5 * int(jumlah_minggu)
+    pola = np.ones(5)
+    pola[4] += lonjakan_jumat / 100
+    permintaan = np.tile(pola, int(jumlah_minggu))[:, None] * [permintaan_sosis, permintaan_baso]
+    basis_lama = st.session_state.get("rencana_basis")
+    rencana = plan_multiperiod([500, 1000], [2, 3], waktu_harian, permintaan,
+                               holding_cost=biaya_simpan,
+                               basis=basis_lama[1] if basis_lama and basis_lama[0] == hari else None)
+    if not rencana.success:
+        st.error(f"Rencana tidak dapat disusun: {rencana.message}")
+        st.stop()
+    st.session_state.rencana_basis = (hari, rencana.lp.basis)
+
+    # Solusi Harian (hari pertama)
+    x_harian, y_harian = rencana.production[0]
+    z_harian = rencana.sales[0] @ [500, 1000] - biaya_simpan * rencana.inventory[0].sum()
 
-    # Solusi Mingguan
-    y_mingguan = waktu_mingguan / 3
-    z_mingguan = 1000 * y_mingguan
+    # Solusi Mingguan (minggu pertama)
+    x_mingguan, y_mingguan = rencana.production[:5].sum(axis=0)
+    z_mingguan = (rencana.sales[:5] @ [500, 1000]).sum() - biaya_simpan * rencana.inventory[:5].sum()
 
     # Tampilkan Hasil
     st.success(f"""
-    **🔹 Harian (4 Jam)**  
-    - Produksi: **0 sosis bakar**, **{y_harian:.0f} baso bakar**  
-    - Keuntungan Maksimal: **Rp{z_harian:,.0f}**  
+    **🔹 Harian (Hari ke-1)**  
+    - Produksi: **{x_harian:.0f} sosis bakar**, **{y_harian:.0f} baso bakar**  
+    - Keuntungan: **Rp{z_harian:,.0f}**  
+
+    **🔹 Mingguan (Minggu ke-1)**  
+    - Produksi: **{x_mingguan:.0f} sosis bakar**, **{y_mingguan:.0f} baso bakar**  
+    - Keuntungan: **Rp{z_mingguan:,.0f}**  
 
-    **🔹 Mingguan (20 Jam)**  
-    - Produksi: **0 sosis bakar**, **{y_mingguan:.0f} baso bakar**  
-    - Keuntungan Maksimal: **Rp{z_mingguan:,.0f}**  
+    **🔹 Seluruh Horizon ({int(jumlah_minggu)} minggu)**  
+    - Keuntungan Maksimal: **Rp{rencana.objective:,.0f}**  
     """)
+    st.caption(f"{rencana.message}, {rencana.iterations} iterasi")
 
-    # Grafik Kendala Harian
-    fig, ax = plt.subplots()
-    x = np.linspace(0, waktu_harian/2, 100)
-    y = (waktu_harian - 2*x) / 3
-    ax.plot(x, y, label="Kendala Waktu Harian")
-    ax.fill_between(x, 0, y, alpha=0.1)
-    ax.scatter(0, y_harian, color="red", label="Solusi Optimal")
-    ax.set_xlabel("Sosis Bakar (x)")
-    ax.set_ylabel("Baso Bakar (y)")
-    ax.legend()
+    # Grafik Rencana Minggu Pertama
+    fig, (ax1, ax2) = plt.subplots(2, 1, sharex=True)
+    hari_ke = np.arange(1, min(hari, 10) + 1)
+    ax1.bar(hari_ke - 0.2, rencana.production[:hari_ke.size, 0], 0.4, label="Sosis Bakar")
+    ax1.bar(hari_ke + 0.2, rencana.production[:hari_ke.size, 1], 0.4, label="Baso Bakar")
+    ax1.set_ylabel("Produksi")
+    ax1.legend()
+    ax2.plot(hari_ke, rencana.inventory[:hari_ke.size, 0], marker="o", label="Stok Sosis")
+    ax2.plot(hari_ke, rencana.inventory[:hari_ke.size, 1], marker="o", label="Stok Baso")
+    ax2.set_xlabel("Hari ke-")
+    ax2.set_ylabel("Persediaan Akhir Hari")
+    ax2.legend()
     st.pyplot(fig)
@@ -0,0 +1,1933 @@
+import hashlib
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, replace
+
+import numpy as np
+
+# =============== KONSTANTA SOLVER ===============
+TOL_PRIMAL = 1e-9      # toleransi kelayakan primal
+TOL_DUAL = 1e-9        # toleransi reduced cost
+TOL_PIVOT = 1e-11      # elemen pivot minimum
+REFACTOR_EVERY = 64    # refaktorisasi basis setiap sekian pivot
+TOL_IPM = 1e-8         # toleransi relatif residual dan gap interior-point
+IPM_MIN_ROWS = 300     # method="auto": interior-point mulai dari sekian baris padat
+BAND_MAX_RATIO = 8     # persamaan normal blok-tridiagonal jika lebar pita CSR <= m / rasio ini
+PLAN_SIMPLEX_MAX_ROWS = 1000  # plan_multiperiod: di atas ini interior-point berpita
+
+
+@dataclass
+class Basis:
+    """Basis simpleks: indeks variabel basis per baris dan status batas atas variabel nonbasis."""
+    head: np.ndarray
+    at_upper: np.ndarray
+
+
+@dataclass
+class LPResult:
+    """Hasil solve_lp. Tanda dual/reduced cost mengikuti arah optimasi (maks/min)."""
+    status: str
+    message: str
+    x: np.ndarray = None
+    objective: float = np.nan
+    slack: np.ndarray = None
+    duals: np.ndarray = None
+    reduced_costs: np.ndarray = None
+    iterations: int = 0
+    basis: Basis = None
+    factor: np.ndarray = field(default=None, repr=False)
+    model: tuple = field(default=None, repr=False)
+
+    @property
+    def success(self):
+        return self.status == "optimal"
+
+
+# =============== MATRIKS KENDALA ===============
+class CSRMatrix:
+    """Matriks jarang format CSR (indptr/indices/data) berbasis NumPy murni.
+
+    Perkalian A·x dan A^T·y berjalan dalam O(nnz); salinan CSC dibuat sekali
+    agar pengambilan kolom untuk simpleks juga sebanding dengan isi kolom.
+    """
+
+    def __init__(self, indptr, indices, data, shape):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.shape = tuple(int(k) for k in shape)
+        m, n = self.shape
+        if self.indptr.shape != (m + 1,) or self.indptr[-1] != self.data.size:
+            raise ValueError("indptr tidak konsisten dengan jumlah baris/data")
+        if self.indices.shape != self.data.shape:
+            raise ValueError("indices dan data harus sama panjang")
+        if self.data.size and (self.indices.min() < 0 or self.indices.max() >= n):
+            raise ValueError("indeks kolom di luar jangkauan")
+        self.rows = np.repeat(np.arange(m), np.diff(self.indptr))
+        # salinan CSC
+        order = np.argsort(self.indices, kind="stable")
+        self.col_ptr = np.concatenate([[0], np.cumsum(np.bincount(self.indices, minlength=n))])
+        self.col_rows = self.rows[order]
+        self.col_data = self.data[order]
+
+    @classmethod
+    def from_dense(cls, A):
+        A = np.atleast_2d(np.asarray(A, dtype=float))
+        rows, cols = np.nonzero(A)
+        return cls.from_coo(rows, cols, A[rows, cols], A.shape)
+
+    @classmethod
+    def from_coo(cls, rows, cols, vals, shape):
+        """Bangun dari triplet (baris, kolom, nilai); urutan bebas, tanpa duplikat."""
+        rows, cols = np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+        order = np.lexsort((cols, rows))
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=shape[0]))])
+        return cls(indptr, cols[order], np.asarray(vals, dtype=float)[order], shape)
+
+    def to_coo(self):
+        return self.rows, self.indices, self.data
+
+    @property
+    def nnz(self):
+        return self.data.size
+
+    def dot(self, x):
+        return np.bincount(self.rows, weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def tdot(self, y):
+        return np.bincount(self.indices, weights=self.data * y[self.rows], minlength=self.shape[1])
+
+    def col_norms2(self):
+        return np.bincount(self.indices, weights=self.data ** 2, minlength=self.shape[1])
+
+    def rmatmat(self, Y):
+        """Y @ A untuk Y berukuran (k, m)."""
+        out = np.zeros((Y.shape[0], self.shape[1]))
+        filled = np.flatnonzero(np.diff(self.col_ptr))
+        if filled.size:
+            parts = Y[:, self.col_rows] * self.col_data
+            out[:, filled] = np.add.reduceat(parts, self.col_ptr[filled], axis=1)
+        return out
+
+    def column_entries(self, j):
+        lo, hi = self.col_ptr[j], self.col_ptr[j + 1]
+        return self.col_rows[lo:hi], self.col_data[lo:hi]
+
+    def column(self, j):
+        col = np.zeros(self.shape[0])
+        rows, vals = self.column_entries(j)
+        col[rows] = vals
+        return col
+
+    def toarray(self):
+        A = np.zeros(self.shape)
+        A[self.rows, self.indices] = self.data
+        return A
+
+
+class _DenseMatrix:
+    """Pembungkus ndarray dengan antarmuka yang sama seperti CSRMatrix."""
+
+    def __init__(self, A):
+        self.A = A
+        self.shape = A.shape
+        self.all_rows = np.arange(A.shape[0])
+
+    @property
+    def nnz(self):
+        return int(np.count_nonzero(self.A))
+
+    def dot(self, x):
+        return self.A @ x
+
+    def tdot(self, y):
+        return self.A.T @ y
+
+    def col_norms2(self):
+        return (self.A ** 2).sum(axis=0)
+
+    def rmatmat(self, Y):
+        return Y @ self.A
+
+    def column_entries(self, j):
+        return self.all_rows, self.A[:, j]
+
+    def column(self, j):
+        return self.A[:, j]
+
+    def toarray(self):
+        return self.A
+
+    def to_coo(self):
+        rows, cols = np.nonzero(self.A)
+        return rows, cols, self.A[rows, cols]
+
+
+def _as_matrix(A):
+    if isinstance(A, (CSRMatrix, _DenseMatrix)):
+        return A
+    return _DenseMatrix(np.atleast_2d(np.asarray(A, dtype=float)))
+
+
+# =============== PERSIAPAN MASALAH ===============
+def _parse_bounds(bounds, n):
+    if bounds is None:
+        return np.zeros(n), np.full(n, np.inf)
+    bnd = np.array(bounds, dtype=float)
+    if bnd.ndim == 1:
+        lb = np.full(n, bnd[0])
+        ub = np.full(n, bnd[1])
+    else:
+        if bnd.shape != (n, 2):
+            raise ValueError(f"bounds harus berukuran ({n}, 2), didapat {bnd.shape}")
+        lb, ub = bnd[:, 0].copy(), bnd[:, 1].copy()
+    # None -> nan -> tanpa batas
+    lb[np.isnan(lb)] = -np.inf
+    ub[np.isnan(ub)] = np.inf
+    if np.any(lb > ub) or np.any(np.isinf(lb) & (lb == ub)):
+        raise ValueError("Batas bawah lebih besar dari batas atas")
+    return lb, ub
+
+
+def _sense_array(sense, m):
+    if sense is None:
+        sense = "<" * m
+    sense = np.array(list(sense) if isinstance(sense, str) else sense)
+    if sense.shape != (m,):
+        raise ValueError(f"sense harus berisi {m} tanda kendala")
+    if not np.all(np.isin(sense, ["<", "=", ">"])):
+        raise ValueError("Tanda kendala hanya boleh '<', '=' atau '>'")
+    return sense
+
+
+def _slack_bounds(sense, m):
+    """Slack s = b - Ax: '<' -> s >= 0, '=' -> s = 0, '>' -> s <= 0."""
+    sense = _sense_array(sense, m)
+    lo = np.where(sense == ">", -np.inf, 0.0)
+    up = np.where(sense == "<", np.inf, 0.0)
+    return lo, up
+
+
+# =============== SIMPLEKS REVISI TERBATAS ===============
+class _Simplex:
+    """Simpleks revisi untuk  min cost·x  dengan  [A I]·x = b,  lo <= x <= up.
+
+    Kolom 0..n-1 adalah variabel keputusan, n..n+m-1 slack, sisanya variabel
+    artifisial fase 1. Invers basis disimpan eksplisit, diperbarui dengan
+    transformasi eta setiap pivot dan dihitung ulang secara berkala.
+    """
+
+    def __init__(self, A, b, lo, up, cost):
+        self.A = A
+        self.b = b
+        self.m, self.n = A.shape
+        self.lo = lo
+        self.up = up
+        self.cost = cost
+        self.art_rows = np.zeros(0, dtype=int)
+        self.art_sign = np.zeros(0)
+        # bobot pricing 1 + ||a_j||^2 (kolom slack/artifisial bernilai 2)
+        self.weight = np.concatenate([1.0 + A.col_norms2(), np.full(self.m, 2.0)])
+        self.iterations = 0
+        self.since_refactor = 0
+
+    # ----- akses kolom -----
+    def column(self, j):
+        m, n = self.m, self.n
+        if j < n:
+            return self.A.column(j)
+        col = np.zeros(m)
+        if j < n + m:
+            col[j - n] = 1.0
+        else:
+            k = j - n - m
+            col[self.art_rows[k]] = self.art_sign[k]
+        return col
+
+    def ftran(self, j):
+        """B^-1 a_j, hanya memakai elemen tak-nol kolom j."""
+        m, n = self.m, self.n
+        if j < n:
+            rows, vals = self.A.column_entries(j)
+            return self.Binv[:, rows] @ vals
+        if j < n + m:
+            return self.Binv[:, j - n].copy()
+        k = j - n - m
+        return self.art_sign[k] * self.Binv[:, self.art_rows[k]]
+
+    def basis_matrix(self):
+        return np.column_stack([self.column(j) for j in self.head])
+
+    def row_activity(self, x):
+        """[A I art]·x untuk vektor penuh x."""
+        m, n = self.m, self.n
+        act = self.A.dot(x[:n]) + x[n:n + m]
+        if self.art_rows.size:
+            np.add.at(act, self.art_rows, self.art_sign * x[n + m:])
+        return act
+
+    def price(self, y):
+        """Reduced cost d = cost - [A I art]^T y."""
+        m, n = self.m, self.n
+        d = self.cost.copy()
+        d[:n] -= self.A.tdot(y)
+        d[n:n + m] -= y
+        if self.art_rows.size:
+            d[n + m:] -= self.art_sign * y[self.art_rows]
+        return d
+
+    # ----- faktorisasi -----
+    def refactor(self):
+        self.Binv = np.linalg.inv(self.basis_matrix())
+        xn = self.x.copy()
+        xn[self.head] = 0.0
+        self.x[self.head] = self.Binv @ (self.b - self.row_activity(xn))
+        self.since_refactor = 0
+
+    def update_inverse(self, r, alpha):
+        pr = self.Binv[r] / alpha[r]
+        self.Binv -= np.outer(alpha, pr)
+        self.Binv[r] = pr
+        self.since_refactor += 1
+        if self.since_refactor >= REFACTOR_EVERY:
+            self.refactor()
+
+    # ----- basis awal -----
+    def nonbasic_value(self, j):
+        if np.isfinite(self.lo[j]):
+            return self.lo[j]
+        if np.isfinite(self.up[j]):
+            return self.up[j]
+        return 0.0
+
+    def crash_slack_basis(self):
+        """Basis slack; baris yang slack-nya melanggar batas diberi variabel artifisial."""
+        m, n = self.m, self.n
+        self.x = np.array([self.nonbasic_value(j) for j in range(n + m)])
+        s = self.b - self.A.dot(self.x[:n])
+        lo_s, up_s = self.lo[n:], self.up[n:]
+        bad = (s < lo_s - TOL_PRIMAL) | (s > up_s + TOL_PRIMAL)
+        rows = np.flatnonzero(bad)
+        target = np.clip(s[rows], lo_s[rows], up_s[rows])
+        self.art_rows = rows
+        self.art_sign = np.sign(s[rows] - target)
+        k = rows.size
+        self.lo = np.concatenate([self.lo, np.zeros(k)])
+        self.up = np.concatenate([self.up, np.full(k, np.inf)])
+        self.x = np.concatenate([self.x, np.abs(s[rows] - target)])
+        self.weight = np.concatenate([self.weight, np.full(k, 2.0)])
+        self.x[n + rows] = target
+        self.x[n + np.flatnonzero(~bad)] = s[~bad]
+        self.head = n + np.arange(m)
+        self.head[rows] = n + m + np.arange(k)
+        self.is_basic = np.zeros(n + m + k, dtype=bool)
+        self.is_basic[self.head] = True
+        self.Binv = np.eye(m)
+        self.Binv[rows, rows] = self.art_sign
+        return k
+
+    def drive_out_artificials(self):
+        """Keluarkan artifisial (bernilai nol) dari basis lalu buang kolomnya."""
+        m, n = self.m, self.n
+        for r in np.flatnonzero(self.head >= n + m):
+            rho = self.Binv[r]
+            alpha_r = np.concatenate([self.A.tdot(rho), rho])
+            alpha_r[self.is_basic[:n + m]] = 0.0
+            q = int(np.argmax(np.abs(alpha_r)))
+            alpha = self.ftran(q)
+            self.is_basic[self.head[r]] = False
+            self.head[r] = q
+            self.is_basic[q] = True
+            self.update_inverse(r, alpha)
+        keep = slice(0, n + m)
+        self.lo, self.up, self.x = self.lo[keep], self.up[keep], self.x[keep]
+        self.is_basic, self.weight = self.is_basic[keep], self.weight[keep]
+        self.art_rows = np.zeros(0, dtype=int)
+        self.art_sign = np.zeros(0)
+
+    # ----- iterasi primal -----
+    def choose_entering(self, d, bland=False):
+        """Kolom masuk: Dantzig berskala norma kolom, atau Bland saat degenerasi berlarut."""
+        x, lo, up = self.x, self.lo, self.up
+        can_inc = (d < -TOL_DUAL) & (x < up - TOL_PRIMAL)
+        can_dec = (d > TOL_DUAL) & (x > lo + TOL_PRIMAL)
+        eligible = (can_inc | can_dec) & ~self.is_basic
+        if not eligible.any():
+            return -1
+        if bland:
+            return int(np.flatnonzero(eligible)[0])
+        score = np.where(eligible, d * d / self.weight, 0.0)
+        return int(np.argmax(score))
+
+    def ratio_test(self, q, delta, alpha):
+        """Langkah maksimum t dan baris penghalang r (-1 jika batas variabel masuk)."""
+        xb = self.x[self.head]
+        lob, upb = self.lo[self.head], self.up[self.head]
+        rate = delta * alpha   # x_B berkurang sebesar rate * t
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_dec = np.where(rate > TOL_PIVOT, (xb - lob) / rate, np.inf)
+            t_inc = np.where(rate < -TOL_PIVOT, (upb - xb) / -rate, np.inf)
+        ratios = np.maximum(np.minimum(t_dec, t_inc), 0.0)
+        t_flip = self.up[q] - self.lo[q]
+        t_min = ratios.min() if ratios.size else np.inf
+        if t_flip <= t_min:
+            return t_flip, -1
+        # di antara baris yang (hampir) seri, pilih pivot terbesar
+        ties = np.flatnonzero(ratios <= t_min + TOL_PRIMAL)
+        r = int(ties[np.argmax(np.abs(alpha[ties]))])
+        return ratios[r], r
+
+    def pivot(self, q, r, t, delta, alpha):
+        self.x[self.head] -= delta * t * alpha
+        self.x[q] += delta * t
+        self.iterations += 1
+        if r < 0:
+            self.x[q] = self.up[q] if delta > 0 else self.lo[q]
+            return
+        leave = self.head[r]
+        # variabel keluar tepat di batasnya
+        self.x[leave] = self.lo[leave] if delta * alpha[r] > 0 else self.up[leave]
+        self.head[r] = q
+        self.is_basic[leave] = False
+        self.is_basic[q] = True
+        self.update_inverse(r, alpha)
+
+    def primal(self, cost, max_iter):
+        degenerate = 0
+        while self.iterations < max_iter:
+            y = self.Binv.T @ cost[self.head]
+            self.cost = cost
+            d = self.price(y)
+            q = self.choose_entering(d, bland=degenerate > self.m)
+            if q < 0:
+                return "optimal"
+            delta = 1.0 if d[q] < 0 else -1.0
+            alpha = self.ftran(q)
+            t, r = self.ratio_test(q, delta, alpha)
+            if not np.isfinite(t):
+                return "unbounded"
+            degenerate = degenerate + 1 if t <= TOL_PRIMAL else 0
+            self.pivot(q, r, t, delta, alpha)
+        return "iteration_limit"
+
+    # ----- warm start -----
+    def load_basis(self, basis):
+        """Pasang basis dari solve sebelumnya; False jika tidak cocok atau singular."""
+        m, n = self.m, self.n
+        head = np.asarray(basis.head, dtype=int)
+        at_upper = np.asarray(basis.at_upper, dtype=bool)
+        if head.shape != (m,) or at_upper.shape != (n + m,):
+            return False
+        if head.min() < 0 or head.max() >= n + m or np.unique(head).size != m:
+            return False
+        self.x = np.array([self.nonbasic_value(j) for j in range(n + m)])
+        upper = at_upper & np.isfinite(self.up)
+        self.x[upper] = self.up[upper]
+        self.head = head.copy()
+        self.is_basic = np.zeros(n + m, dtype=bool)
+        self.is_basic[head] = True
+        try:
+            self.refactor()
+        except np.linalg.LinAlgError:
+            return False
+        return np.all(np.isfinite(self.Binv))
+
+    def primal_infeasibility(self):
+        xb = self.x[self.head]
+        return np.maximum(self.lo[self.head] - xb, xb - self.up[self.head]).clip(min=0.0)
+
+    def dual_feasible(self, cost):
+        self.cost = cost
+        d = self.price(self.Binv.T @ cost[self.head])
+        x, lo, up = self.x, self.lo, self.up
+        bad = ((d < -TOL_DUAL) & (x < up - TOL_PRIMAL)) | ((d > TOL_DUAL) & (x > lo + TOL_PRIMAL))
+        return not np.any(bad & ~self.is_basic)
+
+    def shifted_primal_dual(self, cost, max_iter):
+        """Untuk basis yang tidak layak primal maupun dual: longgarkan sementara batas
+        variabel basis yang dilanggar, selesaikan dengan simpleks primal, pulihkan
+        batas, lalu perbaiki kelayakan dengan simpleks dual. None jika gagal."""
+        lo, up = self.lo.copy(), self.up.copy()
+        xb = self.x[self.head]
+        self.lo[self.head] = np.minimum(lo[self.head], xb)
+        self.up[self.head] = np.maximum(up[self.head], xb)
+        status = self.primal(cost, max_iter)
+        self.lo, self.up = lo, up
+        if status != "optimal":
+            return None
+        # nonbasis yang tertinggal di batas longgar dikembalikan ke batas aslinya
+        luar = ~self.is_basic & ((self.x < lo - TOL_PRIMAL) | (self.x > up + TOL_PRIMAL))
+        if luar.any():
+            self.x[luar] = np.clip(self.x[luar], lo[luar], up[luar])
+            self.refactor()
+        if not self.dual_feasible(cost):
+            return None
+        status = self.dual(cost, max_iter)
+        if status == "optimal":
+            status = self.primal(cost, max_iter)
+        return status
+
+    # ----- iterasi dual -----
+    def dual_pivot(self, r, bound, increase):
+        """Keluarkan basis baris r ke nilai `bound`; `increase` berarti x_r harus naik
+        (batas bawah). False jika tidak ada kolom masuk (masalah tak layak)."""
+        cost = self.cost
+        leave = self.head[r]
+        d = self.price(self.Binv.T @ cost[self.head])
+        rho = self.Binv[r]
+        alpha_row = np.concatenate([self.A.tdot(rho), rho])
+        # x_r harus naik (menuju batas bawah) atau turun: pilih arah gerak nonbasis yang sesuai
+        s = alpha_row if increase else -alpha_row
+        free = ~self.is_basic & (self.lo < self.up)
+        can_inc = free & (self.x < self.up - TOL_PRIMAL) & (s < -TOL_PIVOT)
+        can_dec = free & (self.x > self.lo + TOL_PRIMAL) & (s > TOL_PIVOT)
+        eligible = can_inc | can_dec
+        if not eligible.any():
+            return False
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(eligible, np.abs(d) / np.abs(alpha_row), np.inf)
+        t_min = ratios.min()
+        ties = np.flatnonzero(ratios <= t_min + TOL_DUAL)
+        q = int(ties[np.argmax(np.abs(alpha_row[ties]))])
+
+        alpha = self.ftran(q)
+        step = (self.x[leave] - bound) / alpha[r]
+        self.x[self.head] -= step * alpha
+        self.x[q] += step
+        self.x[leave] = bound
+        self.head[r] = q
+        self.is_basic[leave] = False
+        self.is_basic[q] = True
+        self.iterations += 1
+        self.update_inverse(r, alpha)
+        return True
+
+    def dual(self, cost, max_iter):
+        """Simpleks dual terbatas dari basis yang layak dual (mis. setelah b berubah)."""
+        self.cost = cost
+        while self.iterations < max_iter:
+            infeas = self.primal_infeasibility()
+            r = int(np.argmax(infeas))
+            if infeas[r] <= TOL_PRIMAL:
+                return "optimal"
+            leave = self.head[r]
+            below = self.x[leave] < self.lo[leave]
+            if not self.dual_pivot(r, self.lo[leave] if below else self.up[leave], below):
+                return "infeasible"
+        return "iteration_limit"
+
+
+# =============== ANTARMUKA UTAMA ===============
+def solve_lp(c, A, b, bounds=None, sense=None, maximize=True, max_iter=None, basis=None, presolve=False,
+             method="auto", crossover=True):
+    """Selesaikan LP  maks/min c·x  dengan  A x (sense) b  dan  bounds.
+
+    c: (n,), A: (m, n) ndarray atau CSRMatrix, b: (m,)
+    bounds: None (x >= 0), pasangan (lb, ub) untuk semua variabel, atau array (n, 2);
+            None/nan berarti tanpa batas.
+    sense: string/list berisi '<', '=', '>' per baris (default semua '<').
+    basis: LPResult.basis dari solve sebelumnya untuk warm start. Jika hanya c
+           berubah basis tetap layak primal (simpleks primal); jika hanya b atau
+           batas berubah basis tetap layak dual (simpleks dual).
+    presolve: jalankan presolve_lp dulu. Hasilnya dipetakan kembali ke ruang asli
+              tetapi tanpa basis/faktorisasi, jadi tidak dipakai bersama warm start
+              maupun sensitivity().
+
+    method: "simplex", "ipm" (interior-point Mehrotra) atau "auto": interior-point
+            untuk model padat dengan sedikitnya IPM_MIN_ROWS baris tanpa warm start.
+    crossover: setelah interior-point, pindah ke titik sudut lewat simpleks agar
+               hasilnya punya basis (untuk sensitivity() dan warm start).
+
+    Rute: satu kendala '<' dengan koefisien tak-negatif dan batas bawah berhingga
+    (bauran produk satu mesin) diselesaikan solve_single_resource hanya jika
+    basis tidak diberikan dan method="auto"; basis hasilnya valid untuk warm
+    start berikutnya. Dengan basis atau method eksplisit model yang sama lewat
+    simpleks/interior-point biasa (presolve tidak berpengaruh pada jalur cepat
+    karena hasilnya sudah eksak). Selain itu: presolve (jika diminta, tanpa
+    basis), lalu pemilihan method di atas.
+    """
+    c = np.asarray(c, dtype=float).ravel()
+    A = _as_matrix(A)
+    b = np.asarray(b, dtype=float).ravel()
+    m, n = A.shape
+    if c.shape != (n,) or b.shape != (m,):
+        raise ValueError(f"Dimensi tidak cocok: c{c.shape}, A{A.shape}, b{b.shape}")
+    lb, ub = _parse_bounds(bounds, n)
+    lo_s, up_s = _slack_bounds(sense, m)
+    if max_iter is None:
+        max_iter = 50 * (m + n) + 1000
+    if (basis is None and method == "auto" and m == 1 and _sense_array(sense, 1)[0] == "<"
+            and np.all(np.isfinite(lb))):
+        _, cols, vals = A.to_coo()
+        a = np.zeros(n)
+        a[cols] = vals
+        if np.all(a >= 0):
+            return solve_single_resource(c, a, b[0], bounds=np.column_stack([lb, ub]), maximize=maximize)
+    if presolve and basis is None:
+        pre = presolve_lp(c, A, b, bounds=np.column_stack([lb, ub]), sense=sense, maximize=maximize)
+        if pre.status != "reduced":
+            return pre.postsolve(None)
+        if pre.b.size == 0:
+            if pre.c.size:
+                # tersisa hanya kolom kosong menuju batas tak hingga; sisanya layak
+                return replace(pre, status="unbounded").postsolve(None)
+            return pre.postsolve(LPResult("optimal", "", x=np.zeros(0), slack=np.zeros(0),
+                                          duals=np.zeros(0), iterations=0))
+        return pre.postsolve(solve_lp(pre.c, pre.A, pre.b, bounds=pre.bounds, sense=pre.sense,
+                                      maximize=maximize, max_iter=max_iter, method=method,
+                                      crossover=crossover))
+
+    sign = -1.0 if maximize else 1.0
+    cost = np.concatenate([sign * c, np.zeros(m)])
+    lo, up = np.concatenate([lb, lo_s]), np.concatenate([ub, up_s])
+
+    if method == "auto":
+        padat = A.nnz >= 0.2 * m * n
+        method = "ipm" if basis is None and padat and m >= IPM_MIN_ROWS else "simplex"
+    if method == "ipm":
+        status, z, y, dz, it = _interior_point(A, b, lo, up, cost)
+        if status == "optimal":
+            if crossover:
+                res = solve_lp(c, A, b, bounds=np.column_stack([lb, ub]), sense=sense, maximize=maximize,
+                               max_iter=max_iter, basis=_crossover_basis(A, b, lo, up, z, dz),
+                               method="simplex")
+                res.message += f" setelah interior-point ({it} iterasi) dan crossover"
+                return res
+            x = z[:n]
+            return LPResult(
+                status="optimal",
+                message=f"Solusi optimal ditemukan (interior-point, {it} iterasi)",
+                x=x,
+                objective=float(c @ x),
+                slack=b - A.dot(x),
+                duals=sign * y,
+                reduced_costs=sign * dz[:n],
+                iterations=it,
+            )
+        # tidak konvergen (termasuk masalah tak layak/tak terbatas): simpleks memberi kepastian
+        res = solve_lp(c, A, b, bounds=np.column_stack([lb, ub]), sense=sense, maximize=maximize,
+                       max_iter=max_iter, method="simplex")
+        res.message += f" (interior-point berhenti: {status})"
+        return res
+    if method != "simplex":
+        raise ValueError(f"method tidak dikenal: {method!r}")
+
+    if basis is not None:
+        solver = _Simplex(A, b, lo, up, cost)
+        if solver.load_basis(basis):
+            if solver.primal_infeasibility().max(initial=0.0) <= TOL_PRIMAL:
+                status = solver.primal(cost, max_iter)
+                metode = "warm start, simpleks primal"
+            elif solver.dual_feasible(cost):
+                status = solver.dual(cost, max_iter)
+                if status == "optimal":
+                    status = solver.primal(cost, max_iter)
+                metode = "warm start, simpleks dual"
+            else:
+                status = solver.shifted_primal_dual(cost, max_iter)
+                metode = "warm start, geser batas"
+            if status is not None:
+                return _finish(solver, status, c, sign, metode)
+
+    solver = _Simplex(A, b, lo, up, cost)
+    n_art = solver.crash_slack_basis()
+
+    # Fase 1: minimalkan jumlah variabel artifisial
+    if n_art:
+        cost1 = np.concatenate([np.zeros(n + m), np.ones(n_art)])
+        status = solver.primal(cost1, max_iter)
+        if status == "iteration_limit":
+            return LPResult(status, "Batas iterasi tercapai pada fase 1", iterations=solver.iterations)
+        if solver.x[n + m:].sum() > TOL_PRIMAL * max(1.0, np.abs(b).max()):
+            return LPResult("infeasible", "Kendala tidak dapat dipenuhi (daerah layak kosong)",
+                            iterations=solver.iterations)
+        solver.drive_out_artificials()
+
+    status = solver.primal(cost, max_iter)
+    return _finish(solver, status, c, sign, "simpleks dua fase")
+
+
+def _finish(solver, status, c, sign, metode):
+    if status == "unbounded":
+        return LPResult(status, "Fungsi tujuan tidak terbatas", iterations=solver.iterations)
+    if status == "infeasible":
+        return LPResult(status, "Kendala tidak dapat dipenuhi (daerah layak kosong)",
+                        iterations=solver.iterations)
+    if status == "iteration_limit":
+        return LPResult(status, "Batas iterasi tercapai", iterations=solver.iterations)
+    return _make_result(solver, c, sign, metode)
+
+
+def _make_result(solver, c, sign, metode):
+    n = solver.n
+    solver.refactor()
+    y = solver.Binv.T @ solver.cost[solver.head]
+    d = solver.price(y)
+    x = solver.x[:n].copy()
+    head = solver.head.copy()
+    at_upper = ~solver.is_basic & (solver.x >= solver.up - TOL_PRIMAL) & (solver.up > solver.lo)
+    return LPResult(
+        status="optimal",
+        message=f"Solusi optimal ditemukan ({metode})",
+        x=x,
+        objective=float(c @ x),
+        slack=solver.b - solver.A.dot(x),
+        duals=sign * y,
+        reduced_costs=sign * d[:n],
+        iterations=solver.iterations,
+        basis=Basis(head, at_upper),
+        factor=solver.Binv.copy(),
+        model=(solver.A, solver.b, solver.lo.copy(), solver.up.copy(), solver.cost.copy(), sign),
+    )
+
+
+# =============== INTERIOR-POINT (MEHROTRA) ===============
+def _interior_point(A, b, lo, up, cost, max_iter=100):
+    """Primal-dual prediktor-korektor Mehrotra untuk  min cost·x,  [A I]·x = b,  lo <= x <= up.
+
+    Arah Newton dihitung dari persamaan normal (A Θ A^T) dy = r yang difaktorkan
+    Cholesky sekali per iterasi dan dipakai untuk langkah prediktor maupun
+    korektor (padat, atau blok-tridiagonal untuk CSR berpita sempit lewat
+    _normal_equations). Variabel tetap (lo == up, mis.
+    slack baris '=') tidak bergerak; variabel bebas diberi regularisasi kecil.
+    Mengembalikan (status, x, y, zl - zu, iterasi).
+    """
+    m, n = A.shape
+    normal = _normal_equations(A)
+    norm2 = A.col_norms2()
+    has_l, has_u = np.isfinite(lo), np.isfinite(up)
+    fixed = has_l & has_u & (up - lo <= TOL_PRIMAL)
+    has_l &= ~fixed
+    has_u &= ~fixed
+    free = ~fixed & ~has_l & ~has_u
+    lo_f, up_f = np.where(has_l, lo, 0.0), np.where(has_u, up, 0.0)
+
+    def amul(x):
+        return A.dot(x[:n]) + x[n:]
+
+    def atmul(y):
+        return np.concatenate([A.tdot(y), y])
+
+    # titik awal: solusi kuadrat terkecil A x = b, lalu didorong masuk ke dalam batas
+    # (A A^T + 2I: bobot 1 untuk kolom struktural, 2 untuk slack)
+    x = np.where(fixed, lo, 0.0)
+    normal.factor(np.concatenate([np.ones(n), np.full(m, 2.0)]), 0.0)
+    x_ls = atmul(normal.solve(b - amul(x)))
+    x = np.where(fixed, x, x_ls)
+    skala = max(1.0, np.abs(b).max(initial=0.0), np.abs(cost).max(initial=0.0))
+    lebar = np.where(has_l & has_u, up_f - lo_f, np.inf)
+    jarak = np.minimum(0.1 * skala, 0.5 * lebar)
+    x = np.where(has_l, np.maximum(x, lo_f + jarak), x)
+    x = np.where(has_u, np.minimum(x, up_f - jarak), x)
+    zl = np.where(has_l, skala, 0.0)
+    zu = np.where(has_u, skala, 0.0)
+    y = np.zeros(m)
+    n_comp = max(int(has_l.sum() + has_u.sum()), 1)
+    nb, nc = 1.0 + np.linalg.norm(b), 1.0 + np.linalg.norm(cost)
+
+    for it in range(1, max_iter + 1):
+        xl = np.where(has_l, x - lo_f, 1.0)
+        xu = np.where(has_u, up_f - x, 1.0)
+        rp = b - amul(x)
+        rd = np.where(fixed, 0.0, cost - atmul(y) - zl + zu)
+        mu = (np.dot(xl[has_l], zl[has_l]) + np.dot(xu[has_u], zu[has_u])) / n_comp
+        pobj = cost @ x
+        dobj = b @ y + lo_f[has_l] @ zl[has_l] - up_f[has_u] @ zu[has_u] + cost[fixed] @ x[fixed] \
+            - atmul(y)[fixed] @ x[fixed]
+        if (np.linalg.norm(rp) / nb < TOL_IPM and np.linalg.norm(rd) / nc < TOL_IPM
+                and abs(pobj - dobj) / (1.0 + abs(pobj)) < TOL_IPM):
+            return "optimal", x, y, zl - zu, it - 1
+        # iterat menyimpang (biasanya masalah tak layak atau tak terbatas)
+        if (not np.all(np.isfinite(x)) or np.abs(x).max() > 1e14 or np.abs(y).max(initial=0.0) > 1e14
+                or np.any(xl[has_l] <= 0) or np.any(xu[has_u] <= 0)):
+            return "numerical", x, y, zl - zu, it - 1
+
+        D = np.where(has_l, zl / xl, 0.0) + np.where(has_u, zu / xu, 0.0) + np.where(free, 1e-8, 0.0)
+        theta = np.where(fixed, 0.0, 1.0 / np.where(fixed, 1.0, D))
+        reg = 1e-14 * max(1.0, (theta[:n] @ norm2 + theta[n:].sum()) / m)
+        while True:
+            try:
+                normal.factor(theta, reg)
+                break
+            except np.linalg.LinAlgError:
+                reg *= 100.0
+                if reg > 1e6:
+                    return "numerical", x, y, zl - zu, it - 1
+
+        def arah(rcl, rcu):
+            r_hat = rd - np.where(has_l, rcl / xl, 0.0) + np.where(has_u, rcu / xu, 0.0)
+            dy = normal.solve(rp + amul(theta * r_hat))
+            dx = theta * (atmul(dy) - r_hat)
+            dzl = np.where(has_l, (rcl - zl * dx) / xl, 0.0)
+            dzu = np.where(has_u, (rcu + zu * dx) / xu, 0.0)
+            return dx, dy, dzl, dzu
+
+        # prediktor (affine scaling)
+        dx, dy, dzl, dzu = arah(-xl * zl, -xu * zu)
+        ap = min(1.0, _max_step(xl, dx, has_l, xu, -dx, has_u))
+        ad = min(1.0, _max_step(zl, dzl, has_l, zu, dzu, has_u))
+        mu_aff = (np.dot((xl + ap * dx)[has_l], (zl + ad * dzl)[has_l])
+                  + np.dot((xu - ap * dx)[has_u], (zu + ad * dzu)[has_u])) / n_comp
+        sigma = (mu_aff / mu) ** 3 if mu > 0 else 0.0
+        # korektor: pusatkan ke sigma*mu dan koreksi suku orde dua
+        rcl = np.where(has_l, sigma * mu - xl * zl - dx * dzl, 0.0)
+        rcu = np.where(has_u, sigma * mu - xu * zu + dx * dzu, 0.0)
+        dx, dy, dzl, dzu = arah(rcl, rcu)
+        eta = 0.99
+        ap = min(1.0, eta * _max_step(xl, dx, has_l, xu, -dx, has_u))
+        ad = min(1.0, eta * _max_step(zl, dzl, has_l, zu, dzu, has_u))
+        x = x + ap * dx
+        y = y + ad * dy
+        zl = zl + ad * dzl
+        zu = zu + ad * dzu
+    return "iteration_limit", x, y, zl - zu, max_iter
+
+
+def _crossover_basis(A, b, lo, up, x, z):
+    """Basis simpleks dari solusi interior-point (crossover).
+
+    Mulai dari basis slack, kolom struktural yang paling "dalam" (jarak ke batas
+    besar dibanding reduced cost-nya) dipivot masuk menggantikan slack yang lebih
+    dekat ke batasnya, memakai pembaruan invers yang sama dengan simpleks.
+    Variabel nonbasis diletakkan di batas terdekat. Simpleks lalu cukup
+    menyelesaikan beberapa pivot dari basis ini.
+    """
+    m, n = A.shape
+    with np.errstate(invalid="ignore"):
+        jarak = np.minimum(x - lo, up - x)
+        skor = np.where(lo == up, 0.0, np.where(np.isfinite(jarak), jarak / (jarak + np.abs(z)), 1.0))
+    skor = np.nan_to_num(skor)
+    solver = _Simplex(A, b, lo, up, np.zeros(n + m))
+    solver.x = x.copy()
+    solver.head = n + np.arange(m)
+    solver.is_basic = np.zeros(n + m, dtype=bool)
+    solver.is_basic[solver.head] = True
+    solver.Binv = np.eye(m)
+    for j in np.argsort(-skor[:n], kind="stable"):
+        if skor[j] <= 0.5:
+            break
+        alpha = solver.ftran(j)
+        slot = (solver.head >= n) & (skor[solver.head] < skor[j])
+        besar = np.abs(alpha)
+        slot &= besar > 1e-7 * besar.max(initial=0.0)
+        if not slot.any():
+            continue
+        r = int(np.argmax(np.where(slot, besar, 0.0)))
+        solver.is_basic[solver.head[r]] = False
+        solver.head[r] = j
+        solver.is_basic[j] = True
+        solver.update_inverse(r, alpha)
+    at_upper = ~solver.is_basic & np.isfinite(up) & (up > lo) & ((up - x) < (x - lo))
+    return Basis(solver.head.copy(), at_upper)
+
+
+def _normal_equations(A):
+    """Penyelesai persamaan normal untuk interior-point: blok-tridiagonal jika A
+    CSR dengan lebar pita (jarak baris terjauh dalam satu kolom) kecil, mis. model
+    multi-periode yang barisnya urut per periode; selain itu padat."""
+    if isinstance(A, CSRMatrix):
+        isi = np.flatnonzero(np.diff(A.col_ptr))
+        lebar = 1
+        if isi.size:
+            lebar = max(1, int((A.col_rows[A.col_ptr[isi + 1] - 1] - A.col_rows[A.col_ptr[isi]]).max()))
+        if BAND_MAX_RATIO * lebar <= A.shape[0]:
+            return _BandNormal(A, lebar)
+    return _DenseNormal(A)
+
+
+class _DenseNormal:
+    """A Θ A^T + diag(Θ_slack) padat, Cholesky penuh O(m^3)."""
+
+    def __init__(self, A):
+        self.A = A.toarray()
+
+    def factor(self, theta, reg):
+        m, n = self.A.shape
+        M = (self.A * theta[:n]) @ self.A.T
+        M[np.diag_indices(m)] += theta[n:] + reg
+        self.L = np.linalg.cholesky(M)
+
+    def solve(self, r):
+        return _cholesky_solve(self.L, r)
+
+
+class _BandNormal:
+    """A Θ A^T + diag(Θ_slack) untuk CSR berpita lebar w: baris dikelompokkan per w
+    sehingga matriksnya blok-tridiagonal, lalu Cholesky blok O(m w^2).
+
+    Pasangan elemen (i, j) tiap kolom beserta posisinya di penyimpanan blok
+    dihitung sekali; tiap faktorisasi cukup satu bincount berbobot Θ.
+    """
+
+    def __init__(self, A, w):
+        m, n = A.shape
+        self.m, self.n, self.w = m, n, w
+        self.nb = -(-m // w)
+        ptr, rows, data = A.col_ptr, A.col_rows, A.col_data
+        jumlah = np.diff(ptr)
+        kol = np.repeat(np.arange(n), jumlah)
+        # setiap elemen kolom dipasangkan dengan semua elemen kolom yang sama
+        ulang = jumlah[kol]
+        a = np.repeat(np.arange(rows.size), ulang)
+        awal = np.repeat(ptr[kol], ulang)
+        b = awal + np.arange(a.size) - np.repeat(np.cumsum(ulang) - ulang, ulang)
+        i, j = rows[a], rows[b]
+        bawah = (i // w == j // w) | (i // w == j // w + 1)
+        i, j, a = i[bawah], j[bawah], a[bawah]
+        self.kolom = kol[a]
+        self.nilai = data[a] * data[b[bawah]]
+        self.posisi = self._posisi(i, j)
+        self.diag = self._posisi(np.arange(m), np.arange(m))
+        self.ukuran = self.nb * w * w + (self.nb - 1) * w * w
+        # baris pengisi blok terakhir diberi diagonal 1
+        self.dasar = np.zeros(self.ukuran)
+        self.dasar[self._posisi(np.arange(m, self.nb * w), np.arange(m, self.nb * w))] = 1.0
+
+    def _posisi(self, i, j):
+        """Indeks datar (i, j) di [blok diagonal (nb, w, w) | blok bawah (nb-1, w, w)]."""
+        w = self.w
+        bi, bj = i // w, j // w
+        sub = (bi > bj) * (self.nb * w * w + (bj * w + i % w) * w + j % w)
+        return np.where(bi == bj, (bi * w + i % w) * w + j % w, sub)
+
+    def factor(self, theta, reg):
+        w, nb = self.w, self.nb
+        isi = self.dasar + np.bincount(self.posisi, weights=self.nilai * theta[self.kolom],
+                                       minlength=self.ukuran)
+        isi[self.diag] += theta[self.n:] + reg
+        D = isi[:nb * w * w].reshape(nb, w, w)
+        S = isi[nb * w * w:].reshape(nb - 1, w, w)
+        self.L = np.empty_like(D)
+        self.W = np.empty_like(S)
+        self.L[0] = np.linalg.cholesky(D[0])
+        for k in range(1, nb):
+            self.W[k - 1] = np.linalg.solve(self.L[k - 1], S[k - 1].T).T
+            self.L[k] = np.linalg.cholesky(D[k] - self.W[k - 1] @ self.W[k - 1].T)
+
+    def solve(self, r):
+        w, nb, L, W = self.w, self.nb, self.L, self.W
+        r = np.concatenate([r, np.zeros(nb * w - self.m)]).reshape(nb, w)
+        z = np.empty_like(r)
+        z[0] = np.linalg.solve(L[0], r[0])
+        for k in range(1, nb):
+            z[k] = np.linalg.solve(L[k], r[k] - W[k - 1] @ z[k - 1])
+        x = np.empty_like(r)
+        x[-1] = np.linalg.solve(L[-1].T, z[-1])
+        for k in range(nb - 2, -1, -1):
+            x[k] = np.linalg.solve(L[k].T, z[k] - W[k].T @ x[k + 1])
+        return x.ravel()[:self.m]
+
+
+def _cholesky_solve(L, r, blok=128):
+    """Selesaikan L L^T x = r. NumPy tidak punya penyelesai segitiga, jadi substitusi
+    maju/mundur dilakukan per blok: blok diagonal kecil lewat np.linalg.solve,
+    sisanya perkalian matriks-vektor, total O(m^2)."""
+    m = r.size
+    batas = list(range(0, m, blok)) + [m]
+    z = np.empty(m)
+    for i0, i1 in zip(batas[:-1], batas[1:]):
+        z[i0:i1] = np.linalg.solve(L[i0:i1, i0:i1], r[i0:i1] - L[i0:i1, :i0] @ z[:i0])
+    x = np.empty(m)
+    for i0, i1 in zip(batas[-2::-1], batas[:0:-1]):
+        x[i0:i1] = np.linalg.solve(L[i0:i1, i0:i1].T, z[i0:i1] - L[i1:, i0:i1].T @ x[i1:])
+    return x
+
+
+def _max_step(v1, dv1, mask1, v2, dv2, mask2):
+    """Langkah terbesar agar v1 + t*dv1 >= 0 dan v2 + t*dv2 >= 0 pada elemen bermask."""
+    t = np.inf
+    for v, dv, mask in ((v1, dv1, mask1), (v2, dv2, mask2)):
+        turun = mask & (dv < 0)
+        t = min(t, (-v[turun] / dv[turun]).min(initial=np.inf))
+    return t
+
+
+# =============== JALUR CEPAT SATU SUMBER DAYA ===============
+def solve_single_resource(c, a, capacity, bounds=None, maximize=True):
+    """LP  maks/min c·x  dengan  a·x <= capacity,  lb <= x <= ub,  a >= 0.
+
+    Knapsack pecahan berbatas: setelah x digeser ke lb, produk yang menambah
+    tujuan diurutkan menurut keuntungan per unit sumber daya (c_j / a_j) lalu
+    diisi sampai batas atasnya hingga kapasitas habis; produk terakhir bernilai
+    pecahan. O(n log n), tanpa simpleks. Hasilnya LPResult lengkap (dual, basis,
+    faktor 1x1) sehingga sensitivity() dan warm start tetap bisa dipakai.
+    """
+    c = np.asarray(c, dtype=float).ravel()
+    a = np.asarray(a, dtype=float).ravel()
+    n = c.size
+    if a.shape != (n,):
+        raise ValueError(f"Dimensi tidak cocok: c{c.shape}, a{a.shape}")
+    if np.any(a < 0):
+        raise ValueError("Koefisien sumber daya harus tak-negatif")
+    lb, ub = _parse_bounds(bounds, n)
+    if not np.all(np.isfinite(lb)):
+        raise ValueError("Batas bawah harus berhingga")
+    sign = -1.0 if maximize else 1.0
+    cost = sign * c                      # bentuk minimasi
+    sisa = float(capacity) - a @ lb
+    if sisa < -TOL_PRIMAL * max(1.0, abs(float(capacity))):
+        return LPResult("infeasible", "Kendala tidak dapat dipenuhi (daerah layak kosong)")
+
+    gratis = (a == 0) & (cost < 0)
+    if np.any(gratis & ~np.isfinite(ub)):
+        return LPResult("unbounded", "Fungsi tujuan tidak terbatas")
+    x = lb.copy()
+    x[gratis] = ub[gratis]
+
+    kandidat = np.flatnonzero((a > 0) & (cost < 0))
+    kandidat = kandidat[np.argsort(cost[kandidat] / a[kandidat])]
+    pakai = np.cumsum(a[kandidat] * (ub[kandidat] - lb[kandidat]))
+    k = int(np.searchsorted(pakai, sisa, side="right"))
+    penuh = kandidat[:k]
+    x[penuh] = ub[penuh]
+    if k < kandidat.size:
+        q = int(kandidat[k])
+        x[q] = lb[q] + (sisa - (pakai[k - 1] if k else 0.0)) / a[q]
+        head, y = q, cost[q] / a[q]
+        factor = np.array([[1.0 / a[q]]])
+    else:
+        head, y = n, 0.0
+        factor = np.ones((1, 1))
+
+    A = _DenseMatrix(a[None, :])
+    b = np.array([float(capacity)])
+    lo, up = np.concatenate([lb, [0.0]]), np.concatenate([ub, [np.inf]])
+    d = cost - a * y
+    at_upper = np.zeros(n + 1, dtype=bool)
+    at_upper[:n] = (x >= ub - TOL_PRIMAL) & (ub > lb)
+    at_upper[head] = False
+    return LPResult(
+        status="optimal",
+        message="Solusi optimal ditemukan (greedy satu sumber daya)",
+        x=x,
+        objective=float(c @ x),
+        slack=b - a @ x,
+        duals=np.array([sign * y]),
+        reduced_costs=sign * d,
+        iterations=0,
+        basis=Basis(np.array([head]), at_upper),
+        factor=factor,
+        model=(A, b, lo, up, np.concatenate([cost, [0.0]]), sign),
+    )
+
+
+# =============== ANALISIS SENSITIVITAS ===============
+@dataclass
+class Sensitivity:
+    """Harga bayangan, reduced cost, dan rentang c_j / b_i yang mempertahankan basis optimal."""
+    duals: np.ndarray
+    reduced_costs: np.ndarray
+    c_increase: np.ndarray
+    c_decrease: np.ndarray
+    b_increase: np.ndarray
+    b_decrease: np.ndarray
+
+
+def sensitivity(res):
+    """Analisis sensitivitas dari faktorisasi akhir LPResult, tanpa solve ulang."""
+    if not res.success:
+        raise ValueError("Analisis sensitivitas membutuhkan solusi optimal")
+    A, b, lo, up, cost, sign = res.model
+    Binv = res.factor
+    head = res.basis.head
+    m, n = A.shape
+    x = np.concatenate([res.x, res.slack])
+    xb = x[head]
+    is_basic = np.zeros(n + m, dtype=bool)
+    is_basic[head] = True
+
+    # reduced cost internal (bentuk minimasi)
+    y = Binv.T @ cost[head]
+    d = cost - np.concatenate([A.tdot(y), y])
+
+    # ----- rentang b_i: x_B + delta * B^-1 e_i harus tetap dalam batas -----
+    lob, upb = lo[head][:, None], up[head][:, None]
+    xb_col = xb[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        naik = np.where(Binv > TOL_PIVOT, (upb - xb_col) / Binv,
+                        np.where(Binv < -TOL_PIVOT, (lob - xb_col) / Binv, np.inf))
+        turun = np.where(Binv > TOL_PIVOT, (xb_col - lob) / Binv,
+                         np.where(Binv < -TOL_PIVOT, (xb_col - upb) / Binv, np.inf))
+    b_increase = np.maximum(naik.min(axis=0), 0.0)
+    b_decrease = np.maximum(turun.min(axis=0), 0.0)
+
+    # ----- rentang cost internal -----
+    cost_inc = np.full(n, np.inf)
+    cost_dec = np.full(n, np.inf)
+    nonbasic = ~is_basic
+    movable = nonbasic & (lo < up)
+    at_lower = movable & (x <= lo + TOL_PRIMAL)
+    at_upper = movable & (x >= up - TOL_PRIMAL)
+    free = movable & ~at_lower & ~at_upper
+    # variabel nonbasis: hanya reduced cost-nya sendiri yang berubah
+    cost_dec[at_lower[:n]] = d[:n][at_lower[:n]]
+    cost_inc[at_upper[:n]] = -d[:n][at_upper[:n]]
+    cost_inc[free[:n]] = cost_dec[free[:n]] = 0.0
+    # variabel basis baris r: d_k berubah sebesar -delta * (B^-1 N)_rk
+    rows = np.flatnonzero(head < n)
+    if rows.size:
+        Binv_r = Binv[rows]
+        alpha = np.concatenate([A.rmatmat(Binv_r), Binv_r], axis=1)
+        alpha[:, ~movable] = 0.0
+        dd = d[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # d_k - delta*alpha >= 0 (di batas bawah), <= 0 (di batas atas), = 0 (bebas)
+            lim_pos = np.where(at_lower & (alpha > TOL_PIVOT), dd / alpha,
+                               np.where(at_upper & (alpha < -TOL_PIVOT), dd / alpha, np.inf))
+            lim_neg = np.where(at_lower & (alpha < -TOL_PIVOT), -dd / alpha,
+                               np.where(at_upper & (alpha > TOL_PIVOT), -dd / alpha, np.inf))
+        blocked = free & (np.abs(alpha) > TOL_PIVOT)
+        lim_pos[blocked] = 0.0
+        lim_neg[blocked] = 0.0
+        cost_inc[head[rows]] = np.maximum(lim_pos.min(axis=1), 0.0)
+        cost_dec[head[rows]] = np.maximum(lim_neg.min(axis=1), 0.0)
+
+    # kembali ke tanda masalah asli: c = sign * cost
+    if sign < 0:
+        c_increase, c_decrease = cost_dec, cost_inc
+    else:
+        c_increase, c_decrease = cost_inc, cost_dec
+    # "+ 0.0" menghapus nol negatif agar tabel rapi
+    return Sensitivity(
+        duals=sign * y + 0.0,
+        reduced_costs=sign * d[:n] + 0.0,
+        c_increase=c_increase + 0.0,
+        c_decrease=c_decrease + 0.0,
+        b_increase=b_increase + 0.0,
+        b_decrease=b_decrease + 0.0,
+    )
+
+
+# =============== ANALISIS PARAMETRIK RHS ===============
+@dataclass
+class ParametricResult:
+    """Titik patah fungsi nilai optimal z(theta) untuk ruas kanan b + theta·d."""
+    status: str
+    theta: np.ndarray
+    objective: np.ndarray
+    x: np.ndarray
+    iterations: int = 0
+
+    def value_at(self, theta):
+        """Nilai optimal di sembarang theta (interpolasi linear antar titik patah)."""
+        return np.interp(theta, self.theta, self.objective)
+
+
+def parametric_rhs(c, A, b, direction, theta_max, bounds=None, sense=None, maximize=True, max_iter=None):
+    """Telusuri z(theta) untuk theta di [0, theta_max] dalam satu lintasan.
+
+    Di antara titik patah basis tetap dan x_B bergerak linear sepanjang B^-1 d;
+    di titik patah variabel basis yang mentok dikeluarkan dengan satu pivot dual.
+    status "infeasible" berarti masalah tak layak setelah theta terakhir.
+    """
+    res = solve_lp(c, A, b, bounds=bounds, sense=sense, maximize=maximize, max_iter=max_iter)
+    if not res.success:
+        return ParametricResult(res.status, np.zeros(0), np.zeros(0), np.zeros((0, len(c))), res.iterations)
+    A, b0, lo, up, cost, sign = res.model
+    m, n = A.shape
+    d = np.asarray(direction, dtype=float).ravel()
+    if d.shape != (m,):
+        raise ValueError(f"direction harus berukuran ({m},)")
+    if max_iter is None:
+        max_iter = 50 * (m + n) + 1000
+
+    solver = _Simplex(A, b0.copy(), lo, up, cost)
+    solver.load_basis(res.basis)
+    c = np.asarray(c, dtype=float).ravel()
+    theta = 0.0
+    thetas, objs, xs = [0.0], [res.objective], [res.x]
+    status = "optimal"
+    while theta < theta_max and solver.iterations < max_iter:
+        head = solver.head
+        beta = solver.Binv @ d
+        xb = solver.x[head]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            room = np.where(beta > TOL_PIVOT, (up[head] - xb) / beta,
+                            np.where(beta < -TOL_PIVOT, (lo[head] - xb) / beta, np.inf))
+        room = np.maximum(room, 0.0)
+        r = int(np.argmin(room))
+        step = min(room[r], theta_max - theta)
+        solver.x[head] += step * beta
+        theta += step
+        solver.b = b0 + theta * d
+        if step > 0:
+            thetas.append(theta)
+            objs.append(float(c @ solver.x[:n]))
+            xs.append(solver.x[:n].copy())
+        if theta >= theta_max:
+            break
+        # variabel basis baris r mentok: ganti basis dengan satu pivot dual
+        leave = head[r]
+        hits_upper = beta[r] > 0
+        bound = up[leave] if hits_upper else lo[leave]
+        solver.x[leave] = bound
+        if not solver.dual_pivot(r, bound, increase=not hits_upper):
+            status = "infeasible"
+            break
+    return ParametricResult(status, np.array(thetas), np.array(objs), np.array(xs),
+                            res.iterations + solver.iterations)
+
+
+# =============== BATCH SKENARIO DUA PRODUK ===============
+def solve_two_product_batch(profit_a, profit_b, time_a, time_b, total_time,
+                            cap_a=np.inf, cap_b=np.inf, chunk_size=1 << 20):
+    """Selesaikan N skenario  maks pa·x1 + pb·x2,  ta·x1 + tb·x2 <= T,  0 <= x <= cap  sekaligus.
+
+    Semua argumen berupa skalar atau array (N,) yang dibroadcast. Setiap skenario
+    dievaluasi di kelima titik pojok daerah layaknya secara tervektorisasi.
+    Mengembalikan (x1, x2, Z); Z = inf untuk skenario tak terbatas, nan jika T < 0.
+    """
+    args = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in
+                                 (profit_a, profit_b, time_a, time_b, total_time, cap_a, cap_b)))
+    shape = args[0].shape
+    args = [a.ravel() for a in args]
+    N = args[0].size
+    x1 = np.empty(N)
+    x2 = np.empty(N)
+    z = np.empty(N)
+    for start in range(0, N, chunk_size):
+        part = slice(start, min(start + chunk_size, N))
+        x1[part], x2[part], z[part] = _two_product_chunk(*(a[part] for a in args))
+    return x1.reshape(shape), x2.reshape(shape), z.reshape(shape)
+
+
+def _two_product_chunk(pa, pb, ta, tb, T, ca, cb):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # batas efektif: x1 <= min(cap_a, T/ta), x2 <= min(cap_b, T/tb)
+        ea = np.minimum(ca, np.where(ta > 0, T / ta, np.inf))
+        eb = np.minimum(cb, np.where(tb > 0, T / tb, np.inf))
+        y3 = np.clip(np.where(tb > 0, (T - ta * ea) / tb, np.inf), 0.0, eb)
+        x4 = np.clip(np.where(ta > 0, (T - tb * eb) / ta, np.inf), 0.0, ea)
+        zero = np.zeros_like(pa)
+        X = np.stack([zero, ea, zero, ea, x4])
+        Y = np.stack([zero, zero, eb, y3, eb])
+        Z = pa * X + pb * Y
+    Z[np.isnan(Z)] = -np.inf
+    best = np.argmax(Z, axis=0)[None]
+    x1 = np.take_along_axis(X, best, 0)[0]
+    x2 = np.take_along_axis(Y, best, 0)[0]
+    z = np.take_along_axis(Z, best, 0)[0]
+    unbounded = ((pa > 0) & np.isinf(ea)) | ((pb > 0) & np.isinf(eb))
+    z[unbounded] = np.inf
+    infeasible = T < 0
+    x1[infeasible] = x2[infeasible] = z[infeasible] = np.nan
+    return x1, x2, z
+
+
+# =============== BRANCH-AND-BOUND (BILANGAN BULAT) ===============
+@dataclass
+class MILPResult:
+    """Hasil solve_milp. gap = selisih relatif batas terbaik dan solusi bulat terbaik."""
+    status: str
+    message: str
+    x: np.ndarray = None
+    objective: float = np.nan
+    bound: float = np.nan
+    gap: float = np.inf
+    nodes: int = 0
+    lp_iterations: int = 0
+
+
+def solve_milp(c, A, b, bounds=None, sense=None, integrality=None, maximize=True,
+               node_limit=20000, time_limit=5.0, gap_tol=1e-6):
+    """Branch-and-bound di atas solve_lp dengan seleksi simpul best-bound.
+
+    integrality: array bool (n,) variabel yang harus bulat (default semua).
+    Anak simpul mewarisi batas induknya dan di-warm start dari basis LP induk,
+    sehingga cukup beberapa pivot dual per simpul.
+    """
+    c = np.asarray(c, dtype=float).ravel()
+    A = _as_matrix(A)
+    b = np.asarray(b, dtype=float).ravel()
+    n = c.size
+    lb, ub = _parse_bounds(bounds, n)
+    integer = np.ones(n, dtype=bool) if integrality is None else np.asarray(integrality, dtype=bool)
+    # variabel bulat: batas dibulatkan ke dalam
+    lb = np.where(integer, np.ceil(lb - TOL_PRIMAL), lb)
+    ub = np.where(integer, np.floor(ub + TOL_PRIMAL), ub)
+    lo_s, up_s = _slack_bounds(sense, A.shape[0])
+    sign = 1.0 if maximize else -1.0   # nilai dalam arah "lebih besar lebih baik"
+    mulai = time.perf_counter()
+
+    def solve_node(node_lb, node_ub, basis):
+        if np.any(node_lb > node_ub):
+            return None
+        return solve_lp(c, A, b, bounds=np.column_stack([node_lb, node_ub]), sense=sense,
+                        maximize=maximize, basis=basis)
+
+    def ambang():
+        # tanpa solusi bulat, -inf + gap_tol * inf = nan akan membuang semua simpul
+        if best_x is None:
+            return -np.inf
+        return best_val + gap_tol * max(1.0, abs(best_val))
+
+    def feasible(x):
+        act = b - A.dot(x)
+        return np.all(act >= lo_s - 1e-7) and np.all(act <= up_s + 1e-7) and \
+            np.all(x >= lb - 1e-9) and np.all(x <= ub + 1e-9)
+
+    root = solve_node(lb, ub, None)
+    if root is None or root.status == "infeasible":
+        return MILPResult("infeasible", "Tidak ada solusi bulat yang layak")
+    if root.status != "optimal":
+        return MILPResult(root.status, root.message, lp_iterations=root.iterations)
+
+    best_x, best_val = None, -np.inf
+    lp_iterations = root.iterations
+    heap = [(-sign * root.objective, 0, lb, ub, root)]
+    counter = 1
+    nodes = 0
+    status = "optimal"
+    while heap:
+        key, _, node_lb, node_ub, res = heapq.heappop(heap)
+        node_val = -key
+        if node_val <= ambang():
+            continue
+        nodes += 1
+        x = res.x
+        frac = np.abs(x - np.round(x))
+        frac[~integer] = 0.0
+        if frac.max() <= 1e-6:
+            best_x, best_val = np.where(integer, np.round(x), x), node_val
+            continue
+        # heuristik pembulatan: coba bulatkan ke bawah sebagai solusi sementara
+        x_round = np.where(integer, np.floor(x + 1e-9), x)
+        if feasible(x_round) and sign * (c @ x_round) > best_val:
+            best_x, best_val = x_round, sign * (c @ x_round)
+        if nodes >= node_limit:
+            status = "node_limit"
+            heapq.heappush(heap, (key, counter, node_lb, node_ub, res))
+            break
+        if time.perf_counter() - mulai > time_limit:
+            status = "time_limit"
+            heapq.heappush(heap, (key, counter, node_lb, node_ub, res))
+            break
+        # cabang pada variabel paling pecahan
+        j = int(np.argmax(np.where(frac > 1e-6, -np.abs(frac - 0.5), -np.inf)))
+        for side in ("down", "up"):
+            child_lb, child_ub = node_lb.copy(), node_ub.copy()
+            if side == "down":
+                child_ub[j] = np.floor(x[j])
+            else:
+                child_lb[j] = np.ceil(x[j])
+            child = solve_node(child_lb, child_ub, res.basis)
+            if child is None or child.status != "optimal":
+                continue
+            lp_iterations += child.iterations
+            child_val = sign * child.objective
+            if child_val > ambang():
+                heapq.heappush(heap, (-child_val, counter, child_lb, child_ub, child))
+                counter += 1
+
+    bound = max([-item[0] for item in heap], default=best_val)
+    bound = max(bound, best_val)
+    if best_x is None:
+        if status == "optimal":
+            return MILPResult("infeasible", "Tidak ada solusi bulat yang layak", nodes=nodes,
+                              lp_iterations=lp_iterations)
+        return MILPResult(status, "Batas simpul/waktu tercapai sebelum solusi bulat ditemukan",
+                          bound=sign * bound, nodes=nodes, lp_iterations=lp_iterations)
+    gap = (bound - best_val) / max(1.0, abs(best_val))
+    pesan = {"optimal": "Solusi bulat optimal ditemukan",
+             "node_limit": "Batas jumlah simpul tercapai",
+             "time_limit": "Batas waktu tercapai"}[status]
+    return MILPResult(status, pesan, x=best_x, objective=float(c @ best_x), bound=sign * bound,
+                      gap=max(gap, 0.0), nodes=nodes, lp_iterations=lp_iterations)
+
+
+# =============== PRESOLVE ===============
+@dataclass
+class Presolved:
+    """Masalah tereduksi hasil presolve_lp beserta catatan untuk postsolve."""
+    status: str
+    c: np.ndarray
+    A: object
+    b: np.ndarray
+    bounds: np.ndarray
+    sense: np.ndarray
+    removed: dict
+    original: tuple = field(repr=False)
+    col_keep: np.ndarray = field(repr=False)
+    row_keep: np.ndarray = field(repr=False)
+    x_fixed: np.ndarray = field(repr=False)
+    final_bounds: tuple = field(repr=False)
+    bound_rows: tuple = field(repr=False)
+    singletons: list = field(repr=False)
+    coo: tuple = field(repr=False)
+
+    def postsolve(self, res):
+        """Petakan LPResult masalah tereduksi (x dan dual) kembali ke ruang asli."""
+        if self.status == "infeasible":
+            return LPResult("infeasible", "Presolve: kendala tidak dapat dipenuhi")
+        if self.status == "unbounded":
+            return LPResult("unbounded", "Presolve: fungsi tujuan tidak terbatas")
+        if not res.success:
+            return res
+        c, A, b = self.original
+        lb, ub = self.final_bounds
+        lb_row, ub_row = self.bound_rows
+        x = self.x_fixed.copy()
+        x[self.col_keep] = res.x
+        y = np.zeros(b.size)
+        y[self.row_keep] = res.duals
+        # baris tunggal yang menjadi batas aktif mewarisi reduced cost variabelnya,
+        # diproses terbalik karena baris itu bisa memuat kolom yang dihapus lebih dulu
+        rows, cols, vals, row_ptr = self.coo
+        d = c - A.tdot(y)
+        for i, j, a in reversed(self.singletons):
+            at_lb = lb_row[j] == i and x[j] <= lb[j] + TOL_PRIMAL
+            at_ub = ub_row[j] == i and x[j] >= ub[j] - TOL_PRIMAL
+            if at_lb or at_ub:
+                y[i] = d[j] / a
+                seg = slice(row_ptr[i], row_ptr[i + 1])
+                d[cols[seg]] -= y[i] * vals[seg]
+        return LPResult(
+            status="optimal",
+            message=res.message + " setelah presolve",
+            x=x,
+            objective=float(c @ x),
+            slack=b - A.dot(x),
+            duals=y,
+            reduced_costs=c - A.tdot(y),
+            iterations=res.iterations,
+        )
+
+
+def presolve_lp(c, A, b, bounds=None, sense=None, maximize=True):
+    """Sederhanakan LP sebelum simpleks.
+
+    Menghapus variabel tetap (lb == ub, mis. permintaan maksimal 0), kolom kosong,
+    baris kosong, baris tunggal (diubah menjadi batas variabel, mis. x1 <= 30),
+    baris duplikat/sejajar (yang paling ketat dipertahankan) dan baris yang tidak
+    mungkin aktif berdasarkan batas aktivitasnya.
+    """
+    c = np.asarray(c, dtype=float).ravel()
+    Amat = _as_matrix(A)
+    b = np.asarray(b, dtype=float).ravel()
+    m, n = Amat.shape
+    lb, ub = _parse_bounds(bounds, n)
+    sense = _sense_array(sense, m)
+    rows, cols, vals = Amat.to_coo()
+    rows, cols, vals = np.asarray(rows), np.asarray(cols), np.asarray(vals, dtype=float)
+    row_ptr = np.searchsorted(rows, np.arange(m + 1))
+
+    entry = np.ones(vals.size, dtype=bool)
+    row_on = np.ones(m, dtype=bool)
+    col_on = np.ones(n, dtype=bool)
+    bw = b.copy()
+    x_fixed = np.full(n, np.nan)
+    lb_row = np.full(n, -1)
+    ub_row = np.full(n, -1)
+    singletons = []
+    removed = dict(variabel_tetap=0, kolom_kosong=0, baris_kosong=0, baris_tunggal=0,
+                   baris_duplikat=0, baris_redundan=0)
+    arah = 1.0 if maximize else -1.0
+    status = "reduced"
+
+    def tol(v):
+        return 1e-9 * (1.0 + np.abs(v))
+
+    changed = True
+    while changed and status == "reduced":
+        changed = False
+
+        # variabel tetap: substitusi ke ruas kanan (hanya jika kedua batas hingga;
+        # tol(-inf) = inf akan menandai semua variabel bebas sebagai tetap)
+        fixed = col_on & np.isfinite(lb) & np.isfinite(ub) & (ub - lb <= tol(lb))
+        if fixed.any():
+            hit = entry & fixed[cols]
+            bw -= np.bincount(rows[hit], weights=vals[hit] * lb[cols[hit]], minlength=m)
+            entry &= ~hit
+            x_fixed[fixed] = lb[fixed]
+            col_on &= ~fixed
+            removed["variabel_tetap"] += int(fixed.sum())
+            changed = True
+
+        # baris kosong
+        row_cnt = np.bincount(rows[entry], minlength=m)
+        empty = row_on & (row_cnt == 0)
+        if empty.any():
+            bad = empty & (((sense != ">") & (bw < -tol(bw))) | ((sense != "<") & (bw > tol(bw))))
+            if bad.any():
+                status = "infeasible"
+                break
+            row_on &= ~empty
+            removed["baris_kosong"] += int(empty.sum())
+
+        # baris tunggal a·x_j (<,=,>) b menjadi batas variabel
+        single = row_on & (row_cnt == 1)
+        for k in np.flatnonzero(entry & single[rows]):
+            i, j, a = int(rows[k]), int(cols[k]), vals[k]
+            batas = bw[i] / a
+            if sense[i] == "=" or (sense[i] == "<") == (a > 0):
+                if batas < ub[j]:
+                    ub[j], ub_row[j] = batas, i
+            if sense[i] == "=" or (sense[i] == "<") != (a > 0):
+                if batas > lb[j]:
+                    lb[j], lb_row[j] = batas, i
+            if lb[j] > ub[j] + tol(ub[j]):
+                status = "infeasible"
+                break
+            ub[j] = max(ub[j], lb[j])
+            entry[k] = False
+            row_on[i] = False
+            singletons.append((i, j, a))
+            removed["baris_tunggal"] += 1
+            changed = True
+        if status != "reduced":
+            break
+
+        # kolom kosong: langsung ke batas yang paling menguntungkan. Kolom yang
+        # menuju batas tak hingga dibiarkan di masalah tereduksi: LP baru tidak
+        # terbatas jika sisanya layak, dan itu diputuskan simpleks (fase 1 dulu)
+        col_cnt = np.bincount(cols[entry], minlength=n)
+        empty_col = col_on & (col_cnt == 0)
+        if empty_col.any():
+            cj = arah * c
+            bebas = np.where(np.isfinite(lb), lb, np.where(np.isfinite(ub), ub, 0.0))
+            val = np.where(cj > 0, ub, np.where(cj < 0, lb, bebas))
+            empty_col &= np.isfinite(val)
+        if empty_col.any():
+            x_fixed[empty_col] = val[empty_col]
+            col_on &= ~empty_col
+            removed["kolom_kosong"] += int(empty_col.sum())
+            changed = True
+
+        # batas aktivitas baris dari batas variabel
+        e = entry & row_on[rows]
+        r, v, j = rows[e], vals[e], cols[e]
+        lo_c = np.where(v > 0, v * lb[j], v * ub[j])
+        hi_c = np.where(v > 0, v * ub[j], v * lb[j])
+        min_act = np.where(np.bincount(r, weights=np.isinf(lo_c), minlength=m) > 0, -np.inf,
+                           np.bincount(r, weights=np.where(np.isinf(lo_c), 0.0, lo_c), minlength=m))
+        max_act = np.where(np.bincount(r, weights=np.isinf(hi_c), minlength=m) > 0, np.inf,
+                           np.bincount(r, weights=np.where(np.isinf(hi_c), 0.0, hi_c), minlength=m))
+        if np.any(row_on & (((sense != ">") & (min_act > bw + tol(bw))) |
+                            ((sense != "<") & (max_act < bw - tol(bw))))):
+            status = "infeasible"
+            break
+        redundant = row_on & (((sense == "<") & (max_act <= bw + tol(bw))) |
+                              ((sense == ">") & (min_act >= bw - tol(bw))))
+        if redundant.any():
+            entry &= ~redundant[rows]
+            row_on &= ~redundant
+            removed["baris_redundan"] += int(redundant.sum())
+            changed = True
+
+        # baris sejajar: hanya saat langkah lain tidak menemukan apa-apa
+        if not changed:
+            dup = _duplicate_rows(rows, cols, vals, entry, row_on, bw, sense, tol)
+            if dup is None:
+                status = "infeasible"
+                break
+            if dup.any():
+                entry &= ~dup[rows]
+                row_on &= ~dup
+                removed["baris_duplikat"] += int(dup.sum())
+                changed = True
+
+    col_keep = np.flatnonzero(col_on)
+    row_keep = np.flatnonzero(row_on)
+    e = entry & row_on[rows] & col_on[cols]
+    new_col = np.cumsum(col_on) - 1
+    new_row = np.cumsum(row_on) - 1
+    shape = (row_keep.size, col_keep.size)
+    if isinstance(Amat, CSRMatrix):
+        A_red = CSRMatrix.from_coo(new_row[rows[e]], new_col[cols[e]], vals[e], shape)
+    else:
+        A_red = np.zeros(shape)
+        A_red[new_row[rows[e]], new_col[cols[e]]] = vals[e]
+    return Presolved(
+        status=status,
+        c=c[col_keep],
+        A=A_red,
+        b=bw[row_keep],
+        bounds=np.column_stack([lb[col_keep], ub[col_keep]]),
+        sense=sense[row_keep],
+        removed=removed,
+        original=(c, Amat, b),
+        col_keep=col_keep,
+        row_keep=row_keep,
+        x_fixed=x_fixed,
+        final_bounds=(lb, ub),
+        bound_rows=(lb_row, ub_row),
+        singletons=singletons,
+        coo=(rows, cols, vals, row_ptr),
+    )
+
+
+def _duplicate_rows(rows, cols, vals, entry, row_on, bw, sense, tol):
+    """Tandai baris yang sejajar dengan baris lain yang lebih ketat (None jika kontradiktif)."""
+    e = np.flatnonzero(entry & row_on[rows])
+    order = e[np.lexsort((cols[e], rows[e]))]
+    dup = np.zeros(row_on.size, dtype=bool)
+    if order.size == 0:
+        return dup
+    r_sorted = rows[order]
+    starts = np.flatnonzero(np.r_[True, r_sorted[1:] != r_sorted[:-1]])
+    kept = {}
+    flip = {"<": ">", ">": "<", "=": "="}
+    for seg in np.split(order, starts[1:]):
+        i = int(rows[seg[0]])
+        f = vals[seg[0]]
+        key = (cols[seg].tobytes(), np.round(vals[seg] / f, 10).tobytes())
+        s = sense[i] if f > 0 else flip[sense[i]]
+        rhs = bw[i] / f
+        slot = kept.setdefault(key, {})
+        if s not in slot:
+            slot[s] = (i, rhs)
+            continue
+        k, rhs_k = slot[s]
+        if s == "=":
+            if abs(rhs - rhs_k) > tol(rhs_k):
+                return None
+            dup[i] = True
+        elif (s == "<") == (rhs < rhs_k):
+            # baris baru lebih ketat: gantikan yang lama
+            dup[k] = True
+            slot[s] = (i, rhs)
+        else:
+            dup[i] = True
+    return dup
+
+
+# =============== PERENCANAAN MULTI-PERIODE ===============
+@dataclass
+class PlanResult:
+    """Hasil plan_multiperiod. Array berbentuk (T, K): periode x produk."""
+    status: str
+    message: str
+    production: np.ndarray = None
+    sales: np.ndarray = None
+    inventory: np.ndarray = None
+    objective: float = np.nan
+    capacity_duals: np.ndarray = None
+    iterations: int = 0
+    lp: LPResult = field(default=None, repr=False)
+
+    @property
+    def success(self):
+        return self.status == "optimal"
+
+
+def plan_multiperiod(profit, usage, capacity, demand, holding_cost=0.0, initial_inventory=0.0,
+                     max_inventory=np.inf, basis=None, max_iter=None):
+    """Rencana produksi T periode dengan persediaan yang dibawa antar periode.
+
+    Per periode t dan produk k: produksi x, penjualan s <= demand, persediaan akhir I.
+        maks  sum_t  profit·s_t - holding_cost·I_t
+        usage·x_t <= capacity_t                      (R kendala sumber daya)
+        I_{t-1} + x_t - s_t - I_t = 0                (keseimbangan persediaan)
+        0 <= I_t <= max_inventory
+
+    profit, holding_cost: (K,) atau (T, K); usage: (K,) atau (R, K);
+    capacity: skalar, (T,) atau (T, R); demand: (T, K), inf berarti tanpa batas.
+
+    Matriksnya berbentuk tangga (blok periode hanya terhubung lewat I_{t-1}), jadi
+    disusun langsung dalam CSR. Basis awal dirakit dari LP tiap periode yang
+    diselesaikan berurutan dengan warm start periode sebelumnya: solusi tanpa
+    persediaan itu layak untuk model penuh, sehingga simpleks tinggal menggeser
+    produksi antar periode. basis: PlanResult.lp.basis dari rencana sebelumnya
+    (mis. setelah kapasitas diubah) dipakai langsung sebagai gantinya.
+
+    Simpleks menyimpan invers basis padat (m x m, m = T (R + K)), jadi tiap pivot
+    O(m^2) dan total waktunya tumbuh kira-kira T^3. Tanpa basis dan dengan lebih
+    dari PLAN_SIMPLEX_MAX_ROWS baris, model diselesaikan interior-point yang
+    memanfaatkan bentuk tangga (persamaan normal blok-tridiagonal, O(T) per
+    iterasi) tanpa crossover: hasilnya optimal dengan dual, tetapi lp.basis None
+    sehingga tidak ada warm start berikutnya. Contoh K=10, R=3 (m = 13 T):
+    T=104 0,2 detik, T=260 0,5 detik, T=520 1,3 detik (simpleks: 1 dan 20 detik untuk
+    T=104 dan T=260).
+    """
+    demand = np.atleast_2d(np.asarray(demand, dtype=float))
+    T, K = demand.shape
+    usage = np.asarray(usage, dtype=float).reshape(-1, K)
+    R = usage.shape[0]
+    profit = np.broadcast_to(np.asarray(profit, dtype=float), (T, K))
+    hold = np.broadcast_to(np.asarray(holding_cost, dtype=float), (T, K))
+    cap = np.asarray(capacity, dtype=float)
+    cap = np.broadcast_to(cap.reshape(T, -1) if cap.ndim == 1 and R == 1 else cap, (T, R))
+    init = np.broadcast_to(np.asarray(initial_inventory, dtype=float), (K,))
+    if np.any(demand < 0) or np.any(init < 0):
+        raise ValueError("Permintaan dan persediaan awal tidak boleh negatif")
+
+    # variabel periode t: [x_t (K), s_t (K), I_t (K)]; baris periode t: [kapasitas (R), keseimbangan (K)]
+    nv, nr = 3 * K, R + K
+    n, m = T * nv, T * nr
+    var0 = np.arange(T)[:, None] * nv
+    row0 = np.arange(T)[:, None] * nr
+    ur, uk = np.nonzero(usage)
+    bal = row0 + R + np.arange(K)
+    prod = var0 + np.arange(K)
+    rows = [(row0 + ur).ravel(), bal.ravel(), bal.ravel(), bal.ravel(), bal[1:].ravel()]
+    cols = [(var0 + uk).ravel(), prod.ravel(), (prod + K).ravel(), (prod + 2 * K).ravel(),
+            (prod[:-1] + 2 * K).ravel()]
+    vals = [np.tile(usage[ur, uk], T), np.ones(T * K), -np.ones(T * K), -np.ones(T * K),
+            np.ones((T - 1) * K)]
+    A = CSRMatrix.from_coo(np.concatenate(rows), np.concatenate(cols), np.concatenate(vals), (m, n))
+    b = np.zeros((T, nr))
+    b[:, :R] = cap
+    b[0, R:] = -init
+    c = np.concatenate([np.zeros((T, K)), profit, -hold], axis=1).ravel()
+    bounds = np.zeros((n, 2))
+    bounds[:, 1] = np.concatenate([np.full((T, K), np.inf), demand,
+                                   np.full((T, K), max_inventory)], axis=1).ravel()
+    sense = np.array((["<"] * R + ["="] * K) * T)
+
+    it0 = 0
+    if basis is None and m > PLAN_SIMPLEX_MAX_ROWS:
+        res = solve_lp(c, A, b.ravel(), bounds=bounds, sense=sense, max_iter=max_iter,
+                       method="ipm", crossover=False)
+    else:
+        if basis is None:
+            basis, it0 = _period_crash_basis(profit, usage, cap, demand, init)
+        res = solve_lp(c, A, b.ravel(), bounds=bounds, sense=sense, max_iter=max_iter, basis=basis)
+    if not res.success:
+        return PlanResult(res.status, res.message, iterations=it0 + res.iterations, lp=res)
+    x = res.x.reshape(T, 3, K)
+    return PlanResult(
+        status=res.status,
+        message=res.message,
+        production=x[:, 0],
+        sales=x[:, 1],
+        inventory=x[:, 2],
+        objective=res.objective,
+        capacity_duals=res.duals.reshape(T, nr)[:, :R],
+        iterations=it0 + res.iterations,
+        lp=res,
+    )
+
+
+def _period_crash_basis(profit, usage, cap, demand, init):
+    """Basis model penuh dari LP per periode (tanpa persediaan).
+
+    Baris kapasitas memakai basis LP periode. Baris keseimbangan produk k diisi
+    s_k jika x_k basis atau nol, dan x_k jika x_k tepat di permintaannya (s_k
+    nonbasis di batas atas), sehingga matriks basis blok-diagonal dan nonsingular.
+    Persediaan awal dihabiskan lebih dulu: ia mengurangi permintaan periode awal dan
+    sisanya menjadi I_t basis.
+    """
+    T, K = demand.shape
+    R = usage.shape[0]
+    nv, nr = 3 * K, R + K
+    n = T * nv
+    head = np.zeros(T * nr, dtype=int)
+    at_upper = np.zeros(n + T * nr, dtype=bool)
+    prev, iterations = None, 0
+    carry = init.copy()
+    for t in range(T):
+        need = np.maximum(demand[t] - carry, 0.0)
+        excess = carry > demand[t]
+        carry = np.maximum(carry - demand[t], 0.0)
+        p = solve_lp(profit[t], usage, cap[t], bounds=np.column_stack([np.zeros(K), need]),
+                     basis=prev)
+        if not p.success:
+            return None, iterations
+        prev = p.basis
+        iterations += p.iterations
+        o, ro = t * nv, t * nr
+        hp = p.basis.head
+        head[ro:ro + R] = np.where(hp < K, o + hp, n + ro + hp - K)
+        full = p.basis.at_upper[:K] & np.isfinite(demand[t])
+        full[hp[hp < K]] = False
+        k = np.arange(K)
+        head[ro + R:ro + nr] = np.where(full, o + k, o + K + k)
+        full |= excess
+        head[ro + R:ro + nr][excess] = o + 2 * K + k[excess]
+        at_upper[o + K + k[full]] = True
+    return Basis(head, at_upper), iterations
+
+
+# =============== CACHE HASIL LP ===============
+class LPCache:
+    """Cache LRU hasil solve_lp dengan kunci hash bentuk kanonik LP.
+
+    Bentuk kanonik: setiap baris dibagi elemen terbesarnya (baris '>' dibalik
+    menjadi '<'), lalu baris diurutkan, sehingga LP yang sama dengan urutan atau
+    skala baris berbeda berbagi satu entri. Aman dipakai bersama antar sesi/thread.
+    Ukuran dibatasi jumlah entri (maxsize) dan total memori array (max_bytes).
+    Opsi solver (method, presolve, crossover, max_iter) ikut menjadi kunci, dan
+    setiap hasil yang dikembalikan adalah salinan sehingga mengubah array hasil
+    tidak merusak entri yang dipakai bersama.
+    """
+
+    def __init__(self, maxsize=256, max_bytes=64 * 2 ** 20):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def solve(self, c, A, b, bounds=None, sense=None, maximize=True, **kwargs):
+        """Seperti solve_lp, tetapi LP yang pernah diselesaikan diambil dari cache.
+
+        Jika baris LP identik dengan entri cache, hasil tersimpan dikembalikan
+        langsung. Jika hanya sama secara kanonik, basis tersimpan dipetakan ke urutan
+        baris baru dan solve_lp cukup memfaktorkan ulang basis itu (nol pivot).
+        """
+        c = np.asarray(c, dtype=float).ravel()
+        A = _as_matrix(A)
+        b = np.asarray(b, dtype=float).ravel()
+        lb, ub = _parse_bounds(bounds, c.size)
+        sense = _sense_array(sense, b.size)
+        key, perm, scale = _canonical_lp(c, A, b, lb, ub, sense, maximize)
+        # basis hanya titik awal, tidak mengubah hasil optimal
+        opsi = tuple(sorted((k, v) for k, v in kwargs.items() if k != "basis"))
+        key = (key, opsi)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+        if entry is not None:
+            res, perm0, scale0, _ = entry
+            if not res.success or (np.array_equal(perm, perm0) and np.array_equal(scale, scale0)):
+                self._count(hit=True)
+                return _salin_hasil(res, message=res.message + " [cache]")
+            if res.basis is not None:
+                self._count(hit=True)
+                row = np.empty_like(perm)
+                row[perm0] = perm
+                n = c.size
+                head = res.basis.head.copy()
+                head[head >= n] = n + row[head[head >= n] - n]
+                at_upper = res.basis.at_upper.copy()
+                at_upper[n + row] = res.basis.at_upper[n:]
+                warm = dict(kwargs, basis=Basis(head, at_upper), presolve=False, method="simplex")
+                return solve_lp(c, A, b, bounds=np.column_stack([lb, ub]), sense=sense,
+                                maximize=maximize, **warm)
+
+        self._count(hit=False)
+        res = solve_lp(c, A, b, bounds=np.column_stack([lb, ub]), sense=sense, maximize=maximize, **kwargs)
+        if res.status in ("optimal", "infeasible", "unbounded"):
+            self._store(key, (res, perm, scale, _nbytes(res)))
+            return _salin_hasil(res)
+        return res
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._data),
+                    "bytes": self.nbytes, "hit_rate": self.hits / total if total else 0.0}
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = self.misses = 0
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _store(self, key, entry):
+        size = entry[3]
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[3]
+            self._data[key] = entry
+            self.nbytes += size
+            while len(self._data) > self.maxsize or self.nbytes > self.max_bytes:
+                _, lama = self._data.popitem(last=False)
+                self.nbytes -= lama[3]
+
+
+def _quantize(v):
+    """Kode int64 nilai dengan mantissa dibulatkan ke 40 bit, agar derau pembulatan
+    (mis. 240/6 vs 120/3) tidak mengubah hash. ±inf dan nan mendapat kode khusus."""
+    v = np.asarray(v, dtype=float)
+    mant, expo = np.frexp(np.where(np.isfinite(v), v, 0.0))
+    mant = np.round(mant * 2.0 ** 40) + 0.0
+    # mantissa yang dibulatkan ke 1.0 pindah ke eksponen berikutnya
+    carry = np.abs(mant) == 2.0 ** 40
+    mant = np.where(carry, mant / 2, mant)
+    code = mant.astype(np.int64) * 4096 + (expo + carry + 2048)
+    code = np.where(np.isposinf(v), 2 ** 62, np.where(np.isneginf(v), -2 ** 62, code))
+    return np.where(np.isnan(v), 2 ** 62 + 1, code)
+
+
+def _mix64(k):
+    """Pengacak splitmix64 (aritmetika uint64 modulo 2^64)."""
+    k = k.astype(np.uint64)
+    with np.errstate(over="ignore"):
+        k = (k ^ (k >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        k = (k ^ (k >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return k ^ (k >> np.uint64(31))
+
+
+def _canonical_lp(c, A, b, lb, ub, sense, maximize):
+    """Kunci hash LP kanonik, urutan baris kanonik (perm) dan skala tiap baris."""
+    m, n = A.shape
+    rows, cols, vals = A.to_coo()
+    rows, cols, vals = np.asarray(rows), np.asarray(cols, dtype=np.int64), np.asarray(vals, dtype=float)
+    row_ptr = np.searchsorted(rows, np.arange(m + 1))
+    filled = row_ptr[1:] > row_ptr[:-1]
+    absmax = np.zeros(m)
+    np.maximum.at(absmax, rows, np.abs(vals))
+    # baris kosong hanya berisi ruas kanan: diskalakan oleh |b|
+    scale = np.where(filled, absmax, np.where(b != 0, np.abs(b), 1.0))
+    # '>' menjadi '<', baris '=' dinormalkan agar elemen pertamanya positif
+    scale[sense == ">"] *= -1
+    eq = filled & (sense == "=")
+    scale[eq] *= np.sign(vals[row_ptr[:-1][eq]])
+    scale[~filled & (sense == "=") & (b < 0)] *= -1
+    kind = (sense == "=").astype(np.int64)
+    qv = _quantize(vals / scale[rows])
+    qb = _quantize(b / scale)
+
+    # kunci urut 64-bit per baris: jumlah hash tiap elemen (kolom, nilai) + ruas kanan
+    key = _mix64(qb) ^ _mix64(kind + 7)
+    if vals.size:
+        entry = _mix64(_mix64(cols) ^ qv.view(np.uint64))
+        with np.errstate(over="ignore"):
+            key[filled] += np.add.reduceat(entry, row_ptr[:-1][filled])
+    perm = np.argsort(key, kind="stable")
+
+    # hash akhir memakai isi baris terurut secara lengkap, bukan hanya kuncinya
+    lens = np.diff(row_ptr)[perm]
+    idx = np.repeat(row_ptr[:-1][perm] - np.concatenate([[0], np.cumsum(lens)[:-1]]), lens)
+    idx += np.arange(idx.size)
+    h = hashlib.blake2b(f"{m}x{n}:{bool(maximize)}".encode(), digest_size=20)
+    for part in (_quantize(c), _quantize(lb), _quantize(ub), lens, kind[perm], qb[perm], cols[idx], qv[idx]):
+        h.update(np.ascontiguousarray(part).tobytes())
+    return h.hexdigest(), perm, scale
+
+
+def _salin_hasil(res, **ubah):
+    """Salinan LPResult dengan array (termasuk basis dan vektor model) milik sendiri."""
+    def salin(obj):
+        if isinstance(obj, np.ndarray):
+            return obj.copy()
+        if isinstance(obj, Basis):
+            return Basis(obj.head.copy(), obj.at_upper.copy())
+        if isinstance(obj, tuple):
+            return tuple(salin(o) for o in obj)
+        return obj
+    nilai = {f.name: salin(getattr(res, f.name)) for f in fields(res)}
+    nilai.update(ubah)
+    return replace(res, **nilai)
+
+
+def _nbytes(res):
+    """Perkiraan memori array yang dirujuk sebuah hasil (termasuk faktor dan model)."""
+    def size(obj):
+        if isinstance(obj, np.ndarray):
+            return obj.nbytes
+        if isinstance(obj, (tuple, list)):
+            return sum(size(o) for o in obj)
+        if isinstance(obj, (Basis, CSRMatrix, _DenseMatrix)):
+            return sum(size(o) for o in vars(obj).values())
+        return 0
+    return sum(size(getattr(res, f.name)) for f in fields(res))
@@ -0,0 +1,783 @@
+import io
+import os
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from statistik import gamma_cdf, gamma_pdf, gamma_ppf, norm_loss, norm_pdf, norm_ppf, norm_sf
+
+# =============== KONSTANTA ===============
+HARI_PER_TAHUN = 365
+KOLOM_MASUK = ("D", "S", "H", "L")
+KOLOM_HASIL = ("EOQ", "ROP", "frekuensi", "total_biaya")
+KOLOM_MASUK_DISKON = KOLOM_MASUK + ("P",)
+KOLOM_HASIL_DISKON = KOLOM_HASIL + ("tingkat", "harga")
+
+
+# =============== EOQ DASAR ===============
+def eoq(D, S, H, L=0.0, days=HARI_PER_TAHUN):
+    """EOQ klasik untuk skalar atau array (di-broadcast).
+
+    D: permintaan per tahun, S: biaya pesan per order, H: biaya simpan per unit
+    per tahun, L: waktu tunggu (hari). Mengembalikan (Q*, ROP, frekuensi pesan per
+    tahun, total biaya pesan + simpan per tahun). Baris dengan D <= 0, S < 0,
+    H <= 0 atau L < 0 bernilai nan.
+    """
+    D, S, H, L = (np.asarray(v, dtype=float) for v in (D, S, H, L))
+    valid = (D > 0) & (S >= 0) & (H > 0) & (L >= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        q = np.sqrt(2.0 * D * S / H)
+        rop = D / days * L
+        frekuensi = D / q
+        total = np.sqrt(2.0 * D * S * H)
+    nan = np.nan
+    return (np.where(valid, q, nan), np.where(valid, rop, nan),
+            np.where(valid, frekuensi, nan), np.where(valid, total, nan))
+
+
+# =============== EOQ DENGAN DISKON KUANTITAS ===============
+def eoq_discount(D, S, breaks, prices, holding_cost=0.0, holding_rate=0.0, scheme="all_units"):
+    """EOQ dengan harga bertingkat, semua tingkat dievaluasi sekaligus (broadcast).
+
+    breaks: kuantitas minimum tiap tingkat (K,) atau (N, K), tingkat pertama
+            biasanya 0; prices: harga per unit tiap tingkat, bentuk sama (nan =
+            tingkat tidak ada). Biaya simpan per unit per tahun =
+            holding_cost + holding_rate * harga.
+    scheme: "all_units" (harga tingkat berlaku untuk semua unit) atau
+            "incremental" (harga tingkat hanya untuk unit di atas batasnya).
+    Biaya total tahunan = pembelian + pemesanan + penyimpanan; per tingkat Q
+    optimum dijepit ke rentang tingkatnya (fungsi biaya konveks di rentang itu)
+    lalu dipilih tingkat termurah. Mengembalikan (Q, indeks tingkat, biaya total).
+    """
+    D = np.asarray(D, dtype=float)[..., None]
+    S = np.asarray(S, dtype=float)[..., None]
+    h = np.asarray(holding_cost, dtype=float)[..., None]
+    b, p = np.broadcast_arrays(np.asarray(breaks, dtype=float), np.asarray(prices, dtype=float))
+    atas = np.concatenate([b[..., 1:], np.full(b.shape[:-1] + (1,), np.inf)], axis=-1)
+    H = h + holding_rate * p
+    if scheme == "all_units":
+        tetap = S
+    elif scheme == "incremental":
+        # biaya kumulatif unit-unit sebelum batas tingkat: c_k - p_k * b_k
+        lebar = np.diff(b, axis=-1)
+        kumulatif = np.concatenate([np.zeros(b.shape[:-1] + (1,)),
+                                    np.cumsum(p[..., :-1] * lebar, axis=-1)], axis=-1)
+        a = kumulatif - p * b
+        tetap = S + a
+    else:
+        raise ValueError(f"scheme tidak dikenal: {scheme!r}")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        q = np.clip(np.sqrt(2.0 * D * tetap / H), b, atas)
+        biaya = D * p + D * tetap / q + H * q / 2
+        if scheme == "incremental":
+            biaya += holding_rate * a / 2
+    biaya = np.where(np.isnan(biaya) | (H <= 0) | (D <= 0), np.inf, biaya)
+    k = np.argmin(biaya, axis=-1)
+    q = np.take_along_axis(np.broadcast_to(q, biaya.shape), k[..., None], axis=-1)[..., 0]
+    biaya = np.take_along_axis(biaya, k[..., None], axis=-1)[..., 0]
+    gagal = ~np.isfinite(biaya)
+    return np.where(gagal, np.nan, q), k, np.where(gagal, np.nan, biaya)
+
+
+# =============== TITIK PESAN ULANG STOKASTIK (s, Q) ===============
+@dataclass
+class ReorderPolicy:
+    """Hasil reorder_point; semua field berbentuk array hasil broadcast masukan."""
+    reorder_point: np.ndarray
+    safety_stock: np.ndarray
+    lead_time_demand_mean: np.ndarray
+    lead_time_demand_std: np.ndarray
+    cycle_service: np.ndarray
+    fill_rate: np.ndarray
+    expected_shortage: np.ndarray
+
+
+def reorder_point(D, L, Q, demand_std=0.0, lead_time_std=0.0, service=0.95,
+                  target="cycle", distribution="normal", days=HARI_PER_TAHUN):
+    """Titik pesan ulang s untuk kebijakan (s, Q) dengan permintaan dan waktu tunggu acak.
+
+    D: permintaan per tahun, L: rata-rata waktu tunggu (hari), Q: ukuran pesanan,
+    demand_std: simpangan baku permintaan harian, lead_time_std: simpangan baku
+    waktu tunggu (hari). Permintaan selama waktu tunggu X punya rata-rata d*L dan
+    variansi L*sd_d^2 + d^2*sd_L^2, lalu dimodelkan "normal" atau "gamma"
+    (dicocokkan momennya). target "cycle": P(X <= s) = service; target "fill":
+    E[(X - s)+] = (1 - service) * Q. Semua argumen di-broadcast sehingga satu
+    panggilan menghitung seluruh katalog.
+    """
+    D, L, Q, sd_d, sd_L, service = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+        D, L, Q, demand_std, lead_time_std, service)))
+    bentuk_asal = D.shape
+    D, L, Q, sd_d, sd_L, service = (v.ravel() for v in (D, L, Q, sd_d, sd_L, service))
+    d = D / days
+    mu = d * L
+    sigma = np.sqrt(L * sd_d ** 2 + d ** 2 * sd_L ** 2)
+    valid = (D > 0) & (L >= 0) & (Q > 0) & (sd_d >= 0) & (sd_L >= 0) & (service > 0) & (service < 1)
+    acak = sigma > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if distribution == "normal":
+            if target == "cycle":
+                z = norm_ppf(service)
+            elif target == "fill":
+                z = _inverse_loss(lambda z, i: (norm_loss(z), norm_sf(z), norm_pdf(z)),
+                                  (1 - service) * Q / sigma)
+            else:
+                raise ValueError(f"target tidak dikenal: {target!r}")
+            s = mu + z * sigma
+            zs = (s - mu) / sigma
+            siklus = 1 - norm_sf(zs)
+            kurang = sigma * norm_loss(zs)
+        elif distribution == "gamma":
+            k = mu ** 2 / sigma ** 2
+            skala = sigma ** 2 / mu
+            if target == "cycle":
+                s = gamma_ppf(service, k, skala)
+            elif target == "fill":
+                # mulai dekat solusi normal (digeser ke kiri) agar Newton cukup beberapa langkah
+                z = _inverse_loss(lambda z, i: (norm_loss(z), norm_sf(z), norm_pdf(z)),
+                                  (1 - service) * Q / sigma)
+                s = _inverse_loss(lambda x, i: _gamma_loss_sf(x, k[i], skala[i]), (1 - service) * Q,
+                                  awal=mu + (z - 0.25) * sigma)
+            else:
+                raise ValueError(f"target tidak dikenal: {target!r}")
+            kurang, sf, _ = _gamma_loss_sf(s, k, skala)
+            siklus = 1 - sf
+        else:
+            raise ValueError(f"distribution tidak dikenal: {distribution!r}")
+    # tanpa variasi: s = mu (siklus) atau s = mu - (1 - service) Q (fill rate)
+    s_pasti = mu - (target == "fill") * (1 - service) * Q
+    s = np.where(acak, s, s_pasti)
+    siklus = np.where(acak, siklus, (s >= mu).astype(float))
+    kurang = np.where(acak, kurang, np.maximum(mu - s, 0.0))
+    nan = np.nan
+    return ReorderPolicy(*(np.where(valid, v, nan).reshape(bentuk_asal)
+                           for v in (s, s - mu, mu, sigma, siklus, 1 - kurang / Q, kurang)))
+
+
+def _gamma_loss_sf(x, k, skala):
+    """(E[(X - x)+], P(X > x), densitas) untuk X ~ Gamma(k, skala); loss memakai
+    identitas pada gamma_loss sehingga cukup satu CDF per evaluasi."""
+    sf = 1 - gamma_cdf(x, k, skala)
+    pdf = gamma_pdf(x, k, skala)
+    loss = (k * skala - x) * sf + skala * x * pdf
+    return np.where(x >= 0, np.maximum(loss, 0.0), k * skala - x), sf, pdf
+
+
+def _inverse_loss(loss_sf, target, awal=None, iters=100):
+    """Cari s dengan loss(s) = target (array 1-D). loss cembung dan turun dengan
+    turunan -sf(s) dan turunan kedua pdf(s), jadi dari kiri akar langkah Newton
+    tidak pernah melewati akar; langkah Halley (kembali ke Newton jika koreksinya
+    besar) mempercepat konvergensi. loss_sf(s, indeks)
+    mengembalikan (loss, sf, pdf) untuk elemen yang belum konvergen saja. awal
+    yang ternyata di kanan akar diganti min(-target, 0); evaluasi di awal dipakai
+    ulang sebagai langkah pertama."""
+    s = np.minimum(-target, 0.0)
+    aktif = np.flatnonzero(np.isfinite(target))
+    hitung = None
+    if awal is not None:
+        with np.errstate(invalid="ignore"):
+            hitung = [np.array(v, dtype=float) for v in loss_sf(awal[aktif], aktif)]
+            kiri = hitung[0] >= target[aktif]
+        s[aktif[kiri]] = awal[aktif[kiri]]
+        if not kiri.all():
+            ulang = aktif[~kiri]
+            for v, baru in zip(hitung, loss_sf(s[ulang], ulang)):
+                v[~kiri] = baru
+    for _ in range(iters):
+        sa = s[aktif]
+        loss, sf, pdf = loss_sf(sa, aktif) if hitung is None else hitung
+        hitung = None
+        with np.errstate(divide="ignore", invalid="ignore"):
+            langkah = (loss - target[aktif]) / sf
+            penyebut = 1 - 0.5 * langkah * pdf / sf
+            langkah = np.where(penyebut > 0.5, langkah / penyebut, langkah)
+        langkah = np.where(np.isfinite(langkah), langkah, 0.0)
+        s[aktif] = sa + langkah
+        aktif = aktif[np.abs(langkah) > 1e-10 * np.maximum(np.abs(sa), 1.0)]
+        if aktif.size == 0:
+            break
+    return s
+
+
+# =============== EOQ MULTI-ITEM DENGAN KENDALA GUDANG/ANGGARAN ===============
+@dataclass
+class ConstrainedEOQ:
+    """Hasil eoq_constrained. shadow_price = penurunan biaya tahunan per tambahan
+    satu unit kapasitas (pengali Lagrange)."""
+    status: str
+    message: str
+    Q: np.ndarray
+    shadow_price: float
+    usage: float
+    total_cost: float
+    iterations: int
+
+    @property
+    def success(self):
+        return self.status == "optimal"
+
+
+def eoq_constrained(D, S, H, usage, capacity, tol=1e-10, max_iter=100):
+    """EOQ banyak item yang berbagi satu kapasitas: min sum(D S / Q + H Q / 2)
+    dengan sum(usage * Q) <= capacity.
+
+    usage: pemakaian kapasitas per unit pesanan tiap item, misalnya luas per unit
+    (kapasitas = luas gudang) atau harga / 2 untuk anggaran nilai persediaan
+    rata-rata. Relaksasi Lagrange memberi Q_i(lam) = sqrt(2 D S / (H + 2 lam usage))
+    untuk semua item sekaligus; lam dicari dalam braket [bawah, atas] yang terus
+    menyempit. Pemakaian total cembung dan turun terhadap lam, jadi langkah Newton
+    dari kiri tidak melewati akar; jika langkah keluar braket dipakai bisection.
+    """
+    D, S, H, w = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (D, S, H, usage)))
+    if np.any(D <= 0) or np.any(S < 0) or np.any(H <= 0) or np.any(w < 0):
+        raise ValueError("D dan H harus positif; S dan usage tidak boleh negatif")
+    if capacity <= 0:
+        raise ValueError("capacity harus positif")
+    a = 2.0 * D * S
+
+    def pakai(lam):
+        q = np.sqrt(a / (H + 2.0 * lam * w))
+        return q, float(w @ q), float(w @ (q * w / (H + 2.0 * lam * w)))
+
+    lam = 0.0
+    q, total, turunan = pakai(lam)
+    bawah, atas = 0.0, np.inf
+    it = 0
+    status, pesan = "optimal", "Kendala kapasitas tidak aktif (EOQ biasa)"
+    if total > capacity:
+        pesan = "Kendala kapasitas aktif"
+        for it in range(1, max_iter + 1):
+            if total > capacity:
+                bawah = lam
+            else:
+                atas = lam
+            if abs(total - capacity) <= tol * capacity:
+                break
+            # d(total)/d(lam) = -turunan
+            lam_baru = lam + (total - capacity) / turunan
+            if not bawah <= lam_baru <= atas or lam_baru == lam:
+                lam_baru = 0.5 * (bawah + atas) if np.isfinite(atas) else 2.0 * max(lam, 1.0)
+            lam = lam_baru
+            q, total, turunan = pakai(lam)
+        else:
+            status, pesan = "iteration_limit", "Batas iterasi tercapai sebelum kapasitas terpenuhi"
+    biaya = float(np.sum(D * S / q + H * q / 2))
+    return ConstrainedEOQ(status, pesan, q, lam, total, biaya, it)
+
+
+# =============== PEMESANAN GABUNGAN (JOINT REPLENISHMENT) ===============
+@dataclass
+class JointReplenishment:
+    """Hasil joint_replenishment. base_cycle dalam tahun; item i dipesan setiap
+    multipliers[i] * base_cycle dengan ukuran order_quantity[i]."""
+    base_cycle: float
+    multipliers: np.ndarray
+    order_quantity: np.ndarray
+    total_cost: float
+    independent_cost: float
+    iterations: int
+
+    @property
+    def savings(self):
+        return self.independent_cost - self.total_cost
+
+
+def joint_replenishment(D, S, s, H, policy="rand", grid=256, zoom=3, max_iter=100, block=32):
+    """Masalah pemesanan gabungan: biaya pesan utama S per pesanan gabungan dan
+    biaya tambahan s_i jika item i ikut dipesan.
+
+    Biaya per tahun (S + sum(s_i / k_i)) / T + T/2 * sum(k_i D_i H_i) dengan T
+    siklus dasar dan k_i kelipatan bulat ("rand") atau pangkat dua ("power_of_two").
+    Untuk T tertentu k optimum tiap item berbentuk tertutup, jadi yang dicari hanya
+    T. Gaya RAND: biaya dievaluasi pada grid log T antara T_min dan T_max (per blok
+    baris agar memori terbatas), grid diperhalus beberapa kali di sekitar titik
+    terbaik, lalu T dan k diperbaiki bergantian sampai biaya tidak turun lagi.
+    """
+    D, s, H = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (D, s, H)))
+    if np.any(D <= 0) or np.any(H <= 0) or np.any(s < 0) or S < 0:
+        raise ValueError("D dan H harus positif; S dan s tidak boleh negatif")
+    if S + s.sum() <= 0:
+        raise ValueError("Biaya pesan utama dan tambahan tidak boleh semuanya nol")
+    if policy not in ("rand", "power_of_two"):
+        raise ValueError(f"policy tidak dikenal: {policy!r}")
+    DH = D * H
+
+    def biaya_grid(T):
+        hasil = np.empty(T.size)
+        for i in range(0, T.size, block):
+            t = T[i:i + block, None]
+            k = _jrp_multipliers(s, DH, t, policy)
+            hasil[i:i + block] = (S + (s / k).sum(axis=1)) / t[:, 0] + t[:, 0] / 2 * (k * DH).sum(axis=1)
+        return hasil
+
+    # T_max: semua item ikut tiap pesanan (k = 1); batas bawah diberi ruang di bawah
+    # siklus EOQ terkecil karena T optimum bisa lebih pendek dari siklus item mana pun
+    t_max = np.sqrt(2.0 * (S + s.sum()) / DH.sum())
+    t_min = 0.5 * min(np.sqrt(2.0 * S / DH.sum()), np.sqrt(2.0 * s / DH).min())
+    t_min = min(max(t_min, 1e-3 * t_max), t_max)
+    T = np.geomspace(t_min, t_max, grid)
+    for _ in range(zoom + 1):
+        biaya = biaya_grid(T)
+        i = int(np.argmin(biaya))
+        T_opt, biaya_opt = T[i], biaya[i]
+        T = np.geomspace(T[max(i - 1, 0)], T[min(i + 1, T.size - 1)], 33)
+    for it in range(1, max_iter + 1):
+        k = _jrp_multipliers(s, DH, T_opt, policy)
+        pesan, simpan = S + (s / k).sum(), (k * DH).sum()
+        biaya_baru = np.sqrt(2.0 * pesan * simpan)
+        if biaya_baru >= biaya_opt * (1 - 1e-12):
+            break
+        T_opt, biaya_opt = np.sqrt(2.0 * pesan / simpan), biaya_baru
+    k = _jrp_multipliers(s, DH, T_opt, policy).astype(np.int64)
+    biaya_opt = (S + (s / k).sum()) / T_opt + T_opt / 2 * (k * DH).sum()
+    terpisah = float(np.sum(np.sqrt(2.0 * D * (S + s) * H)))
+    return JointReplenishment(float(T_opt), k, k * T_opt * D, float(biaya_opt), terpisah, it)
+
+
+def _jrp_multipliers(s, DH, T, policy):
+    """k optimum per item untuk siklus dasar T. Dengan r = 2 s / (T^2 D H):
+    kelipatan bulat terkecil dengan k (k + 1) >= r, atau pangkat dua terkecil
+    dengan k >= sqrt(r / 2)."""
+    r = 2.0 * s / (T ** 2 * DH)
+    if policy == "rand":
+        k = np.ceil((np.sqrt(1.0 + 4.0 * r) - 1.0) / 2.0)
+    else:
+        with np.errstate(divide="ignore"):
+            k = 2.0 ** np.ceil(np.log2(np.sqrt(r / 2.0)))
+    return np.maximum(k, 1.0)
+
+
+# =============== LOT SIZING DINAMIS (WAGNER-WHITIN) ===============
+@dataclass
+class LotSizingPlan:
+    """Hasil wagner_whitin; baris = SKU, kolom = periode."""
+    orders: np.ndarray
+    inventory: np.ndarray
+    total_cost: np.ndarray
+    setups: np.ndarray
+    seconds: float
+
+
+def wagner_whitin(demand, setup_cost, holding_cost, chunk_skus=1024):
+    """Lot sizing dinamis (Wagner-Whitin) untuk satu atau banyak deret permintaan.
+
+    demand: (n,) atau (m, n) permintaan per periode; setup_cost dan holding_cost
+    (biaya simpan per unit per periode) skalar, per periode atau per SKU per periode.
+    Dengan Hc_i = sum h sebelum periode i, D kumulatif dan W_j = sum d_t Hc_t,
+        F(j) = W_j + min_i [F(i-1) + K_i - W_{i-1} + Hc_i D_{i-1} - Hc_i D_j],
+    yaitu minimum garis-garis dengan kemiringan -Hc_i yang makin turun, ditanya
+    pada D_j yang makin naik. Selubung bawah garis (convex hull trick) dengan
+    penunjuk yang hanya maju memberi O(n) per SKU; garis di kiri penunjuk tidak
+    pernah dipakai lagi (sifat planning horizon). Semua SKU dalam satu potongan
+    maju bersama per periode.
+    """
+    mulai = time.perf_counter()
+    d = np.asarray(demand, dtype=float)
+    satu = d.ndim == 1
+    d = np.atleast_2d(d)
+    m, n = d.shape
+    if np.any(d < 0):
+        raise ValueError("Permintaan tidak boleh negatif")
+    K = np.broadcast_to(np.asarray(setup_cost, dtype=float), (m, n))
+    h = np.broadcast_to(np.asarray(holding_cost, dtype=float), (m, n))
+    if np.any(K < 0) or np.any(h < 0):
+        raise ValueError("Biaya setup dan biaya simpan tidak boleh negatif")
+    orders = np.zeros((m, n))
+    total = np.empty(m)
+    for awal in range(0, m, chunk_skus):
+        bagian = slice(awal, min(awal + chunk_skus, m))
+        orders[bagian], total[bagian] = _wagner_whitin_blok(d[bagian], K[bagian], h[bagian])
+    inventory = np.cumsum(orders - d, axis=1)
+    hasil = LotSizingPlan(orders, inventory, total, np.count_nonzero(orders, axis=1),
+                          time.perf_counter() - mulai)
+    if satu:
+        hasil.orders, hasil.inventory = orders[0], inventory[0]
+        hasil.total_cost, hasil.setups = float(total[0]), int(hasil.setups[0])
+    return hasil
+
+
+def _wagner_whitin_blok(d, K, h):
+    m, n = d.shape
+    r = np.arange(m)
+    Hc = np.concatenate([np.zeros((m, 1)), np.cumsum(h[:, :-1], axis=1)], axis=1)
+    D = np.cumsum(d, axis=1)
+    W = np.cumsum(d * Hc, axis=1)
+    A = -Hc                              # kemiringan garis i
+    B = np.empty((m, n))                 # titik potong garis i
+    hull = np.zeros((m, n), dtype=np.int64)
+    pred = np.empty((m, n), dtype=np.int64)
+    kepala = np.zeros(m, dtype=np.int64)
+    ekor = np.full(m, -1, dtype=np.int64)
+    F = np.zeros(m)
+    D_lalu = W_lalu = np.zeros(m)
+    for j in range(n):
+        B[:, j] = F + K[:, j] - W_lalu + Hc[:, j] * D_lalu
+        a3, b3 = A[:, j], B[:, j]
+        # buang garis ekor yang tertutup garis baru
+        while True:
+            dua = ekor - kepala >= 1
+            l1, l2 = hull[r, np.maximum(ekor - 1, 0)], hull[r, np.maximum(ekor, 0)]
+            a1, b1, a2, b2 = A[r, l1], B[r, l1], A[r, l2], B[r, l2]
+            buang = dua & ((b3 - b1) * (a1 - a2) <= (b2 - b1) * (a1 - a3))
+            buang |= (ekor == kepala) & (a2 == a3) & (b3 <= b2)
+            if not buang.any():
+                break
+            ekor -= buang
+        ekor += 1
+        hull[r, ekor] = j
+        # penunjuk optimum hanya bergerak maju karena D_j tidak turun
+        x = D[:, j]
+        while True:
+            l1, l2 = hull[r, kepala], hull[r, np.minimum(kepala + 1, ekor)]
+            maju = (kepala < ekor) & (A[r, l2] * x + B[r, l2] <= A[r, l1] * x + B[r, l1])
+            if not maju.any():
+                break
+            kepala += maju
+        terbaik = hull[r, kepala]
+        # sebelum ada permintaan sama sekali tidak perlu memesan
+        belum = x == 0
+        F = np.where(belum, 0.0, W[:, j] + A[r, terbaik] * x + B[r, terbaik])
+        pred[:, j] = np.where(belum, -1, terbaik)
+        D_lalu, W_lalu = x, W[:, j]
+    # telusur balik: periode j dipenuhi pesanan di pred[j], lanjut ke pred[j] - 1
+    orders = np.zeros((m, n))
+    j = np.full(m, n - 1)
+    aktif = r
+    while aktif.size:
+        i = pred[aktif, j[aktif]]
+        pesan = i >= 0
+        aktif, i = aktif[pesan], i[pesan]
+        sebelum = np.where(i > 0, D[aktif, np.maximum(i - 1, 0)], 0.0)
+        orders[aktif, i] = D[aktif, j[aktif]] - sebelum
+        j[aktif] = i - 1
+        aktif = aktif[i > 0]
+    return orders, F
+
+
+# =============== SIMULASI MONTE CARLO PERSEDIAAN ===============
+@dataclass
+class InventorySimulation:
+    """Hasil simulate_inventory; field array berisi satu nilai per jalur (replikasi)."""
+    cost: np.ndarray
+    stockout_days: np.ndarray
+    avg_inventory: np.ndarray
+    fill_rate: np.ndarray
+    orders: np.ndarray
+    seconds: float
+
+    def percentiles(self, q=(5, 50, 95)):
+        """Persentil biaya, hari kehabisan stok dan persediaan rata-rata."""
+        return {nama: np.percentile(getattr(self, nama), q)
+                for nama in ("cost", "stockout_days", "avg_inventory", "fill_rate")}
+
+
+def simulate_inventory(D, S, H, L, s, Q, demand_std=0.0, lead_time_std=0.0, paths=10_000,
+                       horizon=HARI_PER_TAHUN, distribution="normal", backorder_cost=0.0,
+                       initial_inventory=None, chunk_paths=4096, seed=None, days=HARI_PER_TAHUN):
+    """Simulasi kebijakan (s, Q) dengan permintaan harian acak dan backorder.
+
+    Semua jalur dalam satu potongan (chunk_paths jalur) maju bersama hari demi hari
+    sebagai array NumPy; permintaan dan waktu tunggu potongan dibangkitkan sekaligus
+    di awal, dan pesanan dalam perjalanan disimpan di buffer melingkar per jalur.
+    Urutan harian: barang tiba, permintaan dipenuhi (sisanya jadi backorder), lalu
+    jika posisi persediaan <= s dipesan kelipatan Q secukupnya (satu kali biaya S).
+    distribution: "normal" (dipotong di 0), "gamma" atau "poisson" untuk permintaan
+    harian; waktu tunggu gamma untuk "gamma" dan normal untuk lainnya, dibulatkan
+    ke hari dan minimal 1. Biaya per tahun = pesan + H * persediaan fisik +
+    backorder_cost * unit backorder (keduanya per unit per tahun).
+    """
+    if D <= 0 or Q <= 0 or H < 0 or S < 0 or L < 0 or demand_std < 0 or lead_time_std < 0:
+        raise ValueError("D dan Q harus positif; S, H, L dan simpangan baku tidak boleh negatif")
+    if distribution not in ("normal", "gamma", "poisson"):
+        raise ValueError(f"distribution tidak dikenal: {distribution!r}")
+    mulai = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    d = D / days
+    awal = s + Q if initial_inventory is None else initial_inventory
+    hasil = {nama: np.empty(paths) for nama in ("cost", "stockout_days", "avg_inventory", "fill_rate", "orders")}
+    for i in range(0, paths, chunk_paths):
+        n = min(chunk_paths, paths - i)
+        permintaan = _sample_demand(rng, d, demand_std, (n, horizon), distribution)
+        tunggu = _sample_lead_time(rng, L, lead_time_std, (n, horizon), distribution)
+        R = int(tunggu.max()) + 1
+        pipa = np.zeros((n, R))
+        baris = np.arange(n)
+        net = np.full(n, float(awal))
+        dipesan = np.zeros(n)
+        simpan, backorder, habis, pesanan, terlayani = (np.zeros(n) for _ in range(5))
+        for t in range(horizon):
+            slot = t % R
+            tiba = pipa[:, slot]
+            net += tiba
+            dipesan -= tiba
+            pipa[:, slot] = 0
+            harian = permintaan[:, t]
+            terlayani += np.minimum(harian, np.maximum(net, 0))
+            net -= harian
+            kurang = s - (net + dipesan)
+            jumlah = np.where(kurang >= 0, (np.floor(kurang / Q) + 1) * Q, 0.0)
+            pipa[baris, (t + tunggu[:, t]) % R] += jumlah
+            dipesan += jumlah
+            pesanan += jumlah > 0
+            fisik = np.maximum(net, 0)
+            simpan += fisik
+            backorder += fisik - net
+            habis += net < 0
+        tahunan = days / horizon
+        bagian = slice(i, i + n)
+        hasil["cost"][bagian] = (pesanan * S + (simpan * H + backorder * backorder_cost) / days) * tahunan
+        hasil["stockout_days"][bagian] = habis
+        hasil["avg_inventory"][bagian] = simpan / horizon
+        with np.errstate(invalid="ignore"):
+            hasil["fill_rate"][bagian] = terlayani / permintaan.sum(axis=1)
+        hasil["orders"][bagian] = pesanan * tahunan
+    return InventorySimulation(**hasil, seconds=time.perf_counter() - mulai)
+
+
+def _sample_demand(rng, mean, std, size, distribution):
+    if distribution == "poisson":
+        return rng.poisson(mean, size).astype(float)
+    if std == 0:
+        return np.full(size, float(mean))
+    if distribution == "gamma":
+        return rng.gamma((mean / std) ** 2, std ** 2 / mean, size)
+    return np.maximum(rng.normal(mean, std, size), 0.0)
+
+
+def _sample_lead_time(rng, mean, std, size, distribution):
+    if std == 0:
+        tunggu = np.full(size, float(mean))
+    elif distribution == "gamma":
+        tunggu = rng.gamma((mean / std) ** 2, std ** 2 / mean, size)
+    else:
+        tunggu = rng.normal(mean, std, size)
+    return np.maximum(np.rint(tunggu), 1).astype(np.int32)
+
+
+# =============== EOQ MASSAL (KATALOG SKU) ===============
+@dataclass
+class BulkEOQSummary:
+    """Ringkasan bulk_eoq."""
+    rows: int
+    invalid: int
+    total_cost: float
+    seconds: float
+
+
+def bulk_eoq(source, dest, chunk_rows=1 << 18, days=HARI_PER_TAHUN,
+             breaks=None, discounts=None, scheme="all_units", holding_rate=0.0):
+    """EOQ, ROP, frekuensi dan total biaya untuk seluruh katalog SKU, per potongan.
+
+    source: path atau file biner (.csv dengan kolom D,S,H,L, boleh ber-header,
+            atau .npy 2-D dengan empat kolom pertama D,S,H,L).
+    dest: path (.npy atau .csv) atau file biner yang ditulisi CSV. Baris keluaran
+          berurutan sama dengan masukan, kolom EOQ,ROP,frekuensi,total_biaya.
+    Memori puncak sebanding chunk_rows, bukan ukuran katalog.
+
+    Dengan breaks (K,) dan discounts (K,) (pecahan potongan harga per tingkat),
+    katalog butuh kolom kelima P (harga dasar per unit); harga tingkat =
+    P * (1 - discounts), biaya simpan = H + holding_rate * harga, dan hasil
+    memakai eoq_discount per potongan (total_biaya termasuk pembelian) dengan
+    kolom tambahan tingkat dan harga.
+    """
+    diskon = breaks is not None
+    if diskon:
+        breaks = np.asarray(breaks, dtype=float)
+        faktor = 1.0 - np.asarray(discounts, dtype=float)
+        if breaks.ndim != 1 or breaks.shape != faktor.shape:
+            raise ValueError("breaks dan discounts harus array 1-D yang sama panjang")
+    masuk = KOLOM_MASUK_DISKON if diskon else KOLOM_MASUK
+    mulai = time.perf_counter()
+    rows = invalid = 0
+    total = 0.0
+    with _open(source, "rb") as f:
+        reader = _npy_chunks(f, chunk_rows, masuk) if _is_npy(f) else _csv_chunks(f, chunk_rows, masuk)
+        with _writer(dest, source, KOLOM_HASIL_DISKON if diskon else KOLOM_HASIL) as tulis:
+            for blok in reader:
+                if diskon:
+                    hasil = _eoq_discount_blok(blok, breaks, faktor, scheme, holding_rate, days)
+                else:
+                    hasil = np.column_stack(eoq(blok[:, 0], blok[:, 1], blok[:, 2], blok[:, 3], days))
+                tulis(hasil)
+                rows += hasil.shape[0]
+                bad = np.isnan(hasil[:, 0])
+                invalid += int(bad.sum())
+                total += float(hasil[~bad, 3].sum())
+    return BulkEOQSummary(rows, invalid, total, time.perf_counter() - mulai)
+
+
+def _eoq_discount_blok(blok, breaks, faktor, scheme, holding_rate, days):
+    D, S, H, L, P = blok.T
+    valid = (S >= 0) & (H >= 0) & (L >= 0) & (P > 0)
+    q, k, biaya = eoq_discount(D, np.where(valid, S, np.nan), breaks, P[:, None] * faktor,
+                               holding_cost=H, holding_rate=holding_rate, scheme=scheme)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rop = np.where(np.isnan(q), np.nan, D / days * L)
+        frekuensi = D / q
+    harga = np.where(np.isnan(q), np.nan, P * faktor[k])
+    return np.column_stack([q, rop, frekuensi, biaya, np.where(np.isnan(q), np.nan, k), harga])
+
+
+class _open:
+    """Buka path, atau pakai file yang sudah terbuka tanpa menutupnya."""
+
+    def __init__(self, target, mode):
+        self.target, self.mode = target, mode
+        self.owned = isinstance(target, (str, os.PathLike))
+
+    def __enter__(self):
+        self.f = open(self.target, self.mode) if self.owned else self.target
+        return self.f
+
+    def __exit__(self, *exc):
+        if self.owned:
+            self.f.close()
+
+
+def _is_npy(f):
+    awal = f.read(6)
+    f.seek(-len(awal), io.SEEK_CUR)
+    return awal == b"\x93NUMPY"
+
+
+def _npy_header(f, kolom_masuk=KOLOM_MASUK):
+    versi = np.lib.format.read_magic(f)
+    baca = np.lib.format.read_array_header_1_0 if versi == (1, 0) else np.lib.format.read_array_header_2_0
+    shape, fortran, dtype = baca(f)
+    if len(shape) != 2 or shape[1] < len(kolom_masuk) or fortran or dtype.names is not None:
+        raise ValueError(f"File .npy harus array 2-D (C-order) dengan kolom {', '.join(kolom_masuk)}")
+    return shape, dtype
+
+
+def _npy_chunks(f, chunk_rows, kolom_masuk=KOLOM_MASUK):
+    (n, k), dtype = _npy_header(f, kolom_masuk)
+    for i in range(0, n, chunk_rows):
+        r = min(chunk_rows, n - i)
+        buf = f.read(r * k * dtype.itemsize)
+        yield np.frombuffer(buf, dtype=dtype).reshape(r, k)[:, :len(kolom_masuk)].astype(float)
+
+
+def _csv_chunks(f, chunk_rows, kolom_masuk=KOLOM_MASUK):
+    """Potongan CSV numerik; header opsional menentukan urutan kolom masukan."""
+    pertama = f.readline().decode().strip()
+    nama = [s.strip().upper() for s in pertama.split(",")]
+    k = len(nama)
+    if _is_header(pertama):
+        if not set(kolom_masuk) <= set(nama):
+            raise ValueError(f"Header CSV harus memuat kolom {', '.join(kolom_masuk)}")
+        kolom = [nama.index(c) for c in kolom_masuk]
+        sisa = b""
+    else:
+        kolom = list(range(len(kolom_masuk)))
+        sisa = pertama.encode() + b"\n"
+    if k < len(kolom_masuk):
+        raise ValueError(f"CSV harus memiliki minimal {len(kolom_masuk)} kolom ({', '.join(kolom_masuk)})")
+    ukuran = chunk_rows * max(len(pertama) + 1, 16)
+    nomor = 0 if sisa else 1  # nomor baris berkas sebelum potongan berikutnya
+    while True:
+        blok = f.read(ukuran)
+        teks = sisa + blok
+        if not blok:
+            potong = len(teks)
+        else:
+            potong = teks.rfind(b"\n") + 1
+        sisa = teks[potong:]
+        baris = teks[:potong].replace(b"\r", b"").split(b"\n")
+        if not baris[-1]:
+            baris.pop()
+        isi = [b for b in baris if b.strip()]
+        if isi:
+            try:
+                nilai = np.loadtxt(io.BytesIO(b"\n".join(isi)), delimiter=",", ndmin=2)
+            except ValueError:
+                nilai = None
+            if nilai is None or nilai.shape[1] != k:
+                _cek_baris(baris, nomor, k)
+                raise ValueError(f"CSV tidak dapat dibaca setelah baris {nomor}")
+            yield nilai[:, kolom]
+        nomor += len(baris)
+        if not blok:
+            return
+
+
+def _cek_baris(baris, nomor, k):
+    """Cari baris CSV pertama yang rusak dan laporkan nomor barisnya di berkas."""
+    for i, isi in enumerate(baris, start=nomor + 1):
+        if not isi.strip():
+            continue
+        nilai = isi.split(b",")
+        if len(nilai) != k:
+            raise ValueError(f"Baris {i}: jumlah kolom {len(nilai)}, seharusnya {k}")
+        for v in nilai:
+            if not v.strip():
+                raise ValueError(f"Baris {i}: ada nilai kosong")
+            try:
+                float(v)
+            except ValueError:
+                raise ValueError(f"Baris {i}: nilai bukan angka {v.strip().decode(errors='replace')!r}") from None
+
+
+def _is_header(baris):
+    """Baris pertama CSV dianggap header jika ada kolom yang bukan angka
+    (notasi ilmiah seperti 1.5e+03 dari np.savetxt tetap angka)."""
+    for nilai in baris.strip().split(","):
+        try:
+            float(nilai)
+        except ValueError:
+            return True
+    return False
+
+
+def _count_rows(source):
+    """Jumlah baris data (untuk keluaran .npy yang ukurannya harus diketahui)."""
+    with _open(source, "rb") as f:
+        posisi = f.tell()
+        if _is_npy(f):
+            (n, _), _ = _npy_header(f)
+        else:
+            header = f.readline()
+            n = 0 if _is_header(header.decode()) or not header.strip() else 1
+            # hanya baris berisi yang dihitung (baris kosong dilewati pembaca CSV)
+            sisa = b""
+            while blok := f.read(1 << 24):
+                baris = (sisa + blok).split(b"\n")
+                sisa = baris.pop()
+                n += sum(1 for b in baris if b.strip())
+            if sisa.strip():
+                n += 1
+        f.seek(posisi)
+    return n
+
+
+class _writer:
+    """Penulis keluaran bertahap: memmap .npy (ukuran diketahui) atau teks CSV."""
+
+    def __init__(self, dest, source, kolom=KOLOM_HASIL):
+        self.dest, self.source, self.kolom = dest, source, kolom
+        self.format = ",".join(["%.6g"] * len(kolom)).__mod__
+
+    def __enter__(self):
+        self.posisi = 0
+        if isinstance(self.dest, (str, os.PathLike)) and str(self.dest).endswith(".npy"):
+            n = _count_rows(self.source)
+            self.out = np.lib.format.open_memmap(self.dest, mode="w+", shape=(n, len(self.kolom)))
+            return self._tulis_npy
+        self.file = _open(self.dest, "wb")
+        self.f = self.file.__enter__()
+        self.f.write((",".join(self.kolom) + "\n").encode())
+        return self._tulis_csv
+
+    def _tulis_npy(self, hasil):
+        self.out[self.posisi:self.posisi + hasil.shape[0]] = hasil
+        self.posisi += hasil.shape[0]
+
+    def _tulis_csv(self, hasil):
+        baris = map(self.format, map(tuple, hasil.tolist()))
+        self.f.write(("\n".join(baris) + "\n").encode())
+
+    def __exit__(self, *exc):
+        if hasattr(self, "out"):
+            self.out.flush()
+            del self.out
+        else:
+            self.file.__exit__(*exc)
@@ -0,0 +1,137 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+
+import numpy as np
+
+from statistik import t_ppf
+
+# =============== REPLIKASI PARALEL ===============
+# Model simulasi (simulate_queue, simulate_gg1, simulate_inventory, ...) dijalankan
+# berulang di beberapa proses; setiap replikasi mendapat aliran acak sendiri dari
+# SeedSequence.spawn sehingga hasil tidak saling berkorelasi dan dapat diulang.
+
+
+@dataclass
+class ReplicationSummary:
+    """Rata-rata, simpangan baku dan setengah lebar selang kepercayaan per ukuran
+    atas replikasi yang sudah digabung; converged = presisi target tercapai."""
+    mean: dict
+    std: dict
+    half_width: dict
+    replications: int
+    converged: bool
+    seconds: float
+
+    def interval(self, nama):
+        return self.mean[nama] - self.half_width[nama], self.mean[nama] + self.half_width[nama]
+
+
+class _Welford:
+    """Rata-rata dan varians berjalan (Welford) untuk beberapa ukuran sekaligus."""
+    __slots__ = ("n", "rata", "m2")
+
+    def __init__(self, k):
+        self.n = 0
+        self.rata = np.zeros(k)
+        self.m2 = np.zeros(k)
+
+    def tambah(self, x):
+        self.n += 1
+        delta = x - self.rata
+        self.rata += delta / self.n
+        self.m2 += delta * (x - self.rata)
+
+    def std(self):
+        return np.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else np.full(self.rata.shape, np.nan)
+
+    def half_width(self, confidence):
+        if self.n < 2:
+            return np.full(self.rata.shape, np.inf)
+        return t_ppf(0.5 + confidence / 2, self.n - 1) * self.std() / np.sqrt(self.n)
+
+
+def _jalankan(model, metrics, seed):
+    """Satu replikasi di proses pekerja: ukuran berupa field/atribut hasil model
+    (atau kunci jika hasilnya dict); field array dirata-rata."""
+    hasil = model(seed=seed)
+    ambil = hasil.__getitem__ if isinstance(hasil, dict) else lambda nama: getattr(hasil, nama)
+    return np.array([np.mean(ambil(nama)) for nama in metrics], dtype=float)
+
+
+def run_replications(model, metrics, replications=100, seed=None, workers=None,
+                     rel_precision=None, abs_precision=None, confidence=0.95,
+                     min_replications=10, progress=None):
+    """Jalankan model(seed=...) hingga `replications` kali secara paralel.
+
+    model harus dapat di-pickle (fungsi tingkat modul atau functools.partial-nya)
+    dan menerima argumen seed; metrics = nama ukuran yang diambil dari hasilnya.
+    Hasil digabung secara inkremental menurut urutan replikasi (bukan urutan
+    selesai) sehingga titik berhenti tetap sama untuk seed yang sama. Berhenti
+    lebih awal setelah min_replications jika untuk semua ukuran setengah lebar
+    selang <= rel_precision * |rata-rata| dan/atau <= abs_precision; tugas yang
+    belum berjalan dibatalkan. workers=1 menjalankan semuanya di proses ini.
+    progress(selesai, replications) dipanggil setiap satu replikasi digabung.
+    """
+    metrics = tuple(metrics)
+    if replications < 2 or not metrics:
+        raise ValueError("replications minimal 2 dan metrics tidak boleh kosong")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    mulai = time.perf_counter()
+    anak = np.random.SeedSequence(seed).spawn(replications)
+    agregat = _Welford(len(metrics))
+    ada_target = rel_precision is not None or abs_precision is not None
+
+    def cukup():
+        if not ada_target or agregat.n < max(min_replications, 2):
+            return False
+        hw = agregat.half_width(confidence)
+        ok = np.ones(len(metrics), dtype=bool)
+        if rel_precision is not None:
+            ok &= hw <= rel_precision * np.abs(agregat.rata)
+        if abs_precision is not None:
+            ok &= hw <= abs_precision
+        return bool(ok.all())
+
+    def gabung(x):
+        agregat.tambah(x)
+        if progress is not None:
+            progress(agregat.n, replications)
+        return cukup()
+
+    selesai = False
+    if workers == 1:
+        for s in anak:
+            if gabung(_jalankan(model, metrics, s)):
+                selesai = True
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            berikut = 0
+            berjalan = {}
+            tertunda = {}
+            # antrean tugas dibatasi 2x jumlah pekerja agar pembatalan saat
+            # presisi tercapai tidak menyisakan banyak pekerjaan sia-sia
+            while agregat.n < replications and not selesai:
+                while berikut < replications and len(berjalan) + len(tertunda) < 2 * workers:
+                    berjalan[pool.submit(_jalankan, model, metrics, anak[berikut])] = berikut
+                    berikut += 1
+                beres, _ = wait(berjalan, return_when=FIRST_COMPLETED)
+                for f in beres:
+                    tertunda[berjalan.pop(f)] = f.result()
+                while agregat.n in tertunda and not selesai:
+                    selesai = gabung(tertunda.pop(agregat.n))
+            for f in berjalan:
+                f.cancel()
+    std = agregat.std()
+    hw = agregat.half_width(confidence)
+    return ReplicationSummary(
+        mean=dict(zip(metrics, agregat.rata.tolist())),
+        std=dict(zip(metrics, std.tolist())),
+        half_width=dict(zip(metrics, np.asarray(hw, dtype=float).tolist())),
+        replications=agregat.n,
+        converged=selesai or not ada_target and agregat.n == replications,
+        seconds=time.perf_counter() - mulai,
+    )
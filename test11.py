@@ -3,6 +3,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from io import BytesIO
 
+from optimasi import solve_two_product_batch
+
 # ===== KONFIGURASI =====
 st.set_page_config(layout="wide", page_title="Optimasi Produksi PT. Bakar-Bakar")
 st.title("📊 OPTIMASI PRODUKSI PT. BAKAR-BAKAR")
@@ -133,6 +135,27 @@ if st.button("🧮 HITUNG SOLUSI OPTIMAL", type="primary"):
         use_container_width=True
     )
 
+# ===== ANALISIS SKENARIO =====
+with st.expander("🧪 ANALISIS SKENARIO (GRID KEUNTUNGAN & WAKTU)"):
+    rentang_profit = st.slider("Rentang keuntungan Baso Bakar (Rp)", 100, 5000, (500, 2000), key="rentang_pb")
+    rentang_waktu = st.slider("Rentang total waktu (menit)", 60, 2400, (120, 1200), key="rentang_t")
+    
+    if st.button("🧪 HITUNG SEMUA SKENARIO", use_container_width=True):
+        # 300 x 300 skenario diselesaikan sekaligus tanpa loop per skenario
+        pb_grid, t_grid = np.meshgrid(np.linspace(*rentang_profit, 300), np.linspace(*rentang_waktu, 300))
+        x1_grid, x2_grid, z_grid = solve_two_product_batch(profit_a, pb_grid, time_a, time_b, t_grid)
+        
+        fig, ax = plt.subplots(figsize=(10,6))
+        im = ax.pcolormesh(pb_grid, t_grid, z_grid, shading='auto', cmap='viridis')
+        fig.colorbar(im, ax=ax, label='Keuntungan Maksimum (Rp)')
+        ax.contour(pb_grid, t_grid, (x1_grid > 0).astype(float), levels=[0.5], colors='white', linestyles='--')
+        ax.set_xlabel('Keuntungan Baso Bakar per Unit (Rp)', fontsize=12)
+        ax.set_ylabel('Total Waktu Tersedia (menit)', fontsize=12)
+        ax.set_title('Keuntungan Maksimum per Skenario', pad=20, fontsize=14)
+        st.pyplot(fig)
+        st.caption(f"{z_grid.size:,} skenario dihitung sekaligus. "
+                   "Garis putus-putus: batas pergantian produk optimal.")
+
 # ===== DOKUMENTASI =====
 with st.sidebar.expander("📚 PETUNJUK PENGGUNAAN"):
     st.markdown("""
@@ -4,6 +4,21 @@ import matplotlib.pyplot as plt
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 import base64
+from functools import partial
+
+from antrian import jackson_network, mmc, simulate_gg1, simulate_queue, staffing
+from optimasi import CSRMatrix, LPCache, parametric_rhs, sensitivity, solve_milp
+from persediaan import (bulk_eoq, eoq_constrained, eoq_discount, joint_replenishment, reorder_point,
+                        simulate_inventory, wagner_whitin)
+from replikasi import run_replications
+
+
+# =============== CACHE LP BERSAMA ===============
+@st.cache_resource
+def lp_cache():
+    """Satu cache hasil LP untuk semua sesi pada server yang sama."""
+    return LPCache(maxsize=256, max_bytes=64 * 2**20)
+
 
 # =============== GENERATE LOGO & HEADER (VERSI UPGRADED) ===============
 def create_logo():
@@ -83,6 +98,7 @@ with st.sidebar:
         st.button("🏠 Beranda", on_click=change_page, args=("Beranda",), use_container_width=True)
         st.button("📊 Optimasi", on_click=change_page, args=("Optimasi",), use_container_width=True)
         st.button("⏱ Johnson", on_click=change_page, args=("Johnson",), use_container_width=True)
+        st.button("📅 Lot Sizing", on_click=change_page, args=("Lot Sizing",), use_container_width=True)
     with col2:
         st.button("📦 EOQ", on_click=change_page, args=("EOQ",), use_container_width=True)
         st.button("🔄 Antrian", on_click=change_page, args=("Antrian",), use_container_width=True)
@@ -172,7 +188,7 @@ elif st.session_state.current_page == "Model Baru":
 # =============== HALAMAN OPTIMASI PRODUKSI ===============
 elif st.session_state.current_page == "Optimasi":
     st.title("📈 OPTIMASI PRODUKSI")
-        with st.expander("📚 Contoh Soal & Pembahasan", expanded=True):
+    with st.expander("📚 Contoh Soal & Pembahasan", expanded=True):
         st.subheader("Studi Kasus: Perusahaan Furniture")
         st.markdown("""
         **PT Kayu Indah** memproduksi:
@@ -236,29 +252,34 @@ elif st.session_state.current_page == "Optimasi":
             max2 = st.number_input("Maksimal permintaan", 40, key="max2")
         
         total_time = st.number_input("Total waktu tersedia (jam)", 120, key="total")
+        produksi_bulat = st.checkbox("Jumlah produksi harus bilangan bulat (branch-and-bound)", key="bulat")
 
     if st.button("🧮 HITUNG SOLUSI DETAIL", type="primary", use_container_width=True):
-        # Implementasi solusi
-        titik_A = (0, 0)
-        titik_B = (max1, 0)
-        titik_C = (max1, min((total_time - t1*max1)/t2, max2))
-        titik_D = (min((total_time - t2*max2)/t1, max1), max2)
-        titik_E = (0, min(total_time/t2, max2))
-        
-        # Hitung nilai Z di setiap titik
-        nilai_Z = [
-            p1*titik_A[0] + p2*titik_A[1],
-            p1*titik_B[0] + p2*titik_B[1],
-            p1*titik_C[0] + p2*titik_C[1],
-            p1*titik_D[0] + p2*titik_D[1],
-            p1*titik_E[0] + p2*titik_E[1]
-        ]
-        optimal_idx = np.argmax(nilai_Z)
-        optimal_value = nilai_Z[optimal_idx]
-        optimal_point = [titik_A, titik_B, titik_C, titik_D, titik_E][optimal_idx]
+        # Model: maks p1x1 + p2x2, t1x1 + t2x2 <= total_time, 0 <= xi <= maks permintaan
+        # Basis optimal terakhir dipakai ulang agar perubahan kecil cukup beberapa pivot
+        # LP yang sama (termasuk versi berskala) diambil dari cache bersama tanpa solve ulang
+        hasil = lp_cache().solve([p1, p2], [[t1, t2]], [total_time], bounds=[(0, max1), (0, max2)],
+                                 basis=st.session_state.get("lp_basis"))
+        if hasil.success:
+            st.session_state.lp_basis = hasil.basis
 
         st.markdown("---")
         st.header("📝 HASIL PERHITUNGAN")
+
+        if not hasil.success:
+            st.error(f"Solver gagal: {hasil.message}")
+            st.stop()
+        optimal_point = hasil.x
+        optimal_value = hasil.objective
+        if produksi_bulat:
+            hasil_bulat = solve_milp([p1, p2], [[t1, t2]], [total_time], bounds=[(0, max1), (0, max2)])
+            if hasil_bulat.x is None:
+                st.error(f"Branch-and-bound gagal: {hasil_bulat.message}")
+                st.stop()
+            optimal_point = hasil_bulat.x
+            optimal_value = hasil_bulat.objective
+            st.info(f"{hasil_bulat.message}: {hasil_bulat.nodes} simpul, gap MIP {hasil_bulat.gap:.4%} "
+                    f"(relaksasi LP: Rp{hasil.objective:,.0f})")
         
         cols = st.columns(2)
         with cols[0]:
@@ -270,12 +291,14 @@ elif st.session_state.current_page == "Optimasi":
             }}
             """)
             
-            st.subheader("Titik Pojok")
-            st.write(f"A(0,0) = Rp{nilai_Z[0]:,.0f}")
-            st.write(f"B({max1},0) = Rp{nilai_Z[1]:,.0f}")
-            st.write(f"C({titik_C[0]:.0f},{titik_C[1]:.0f}) = Rp{nilai_Z[2]:,.0f}")
-            st.write(f"D({titik_D[0]:.0f},{max2}) = Rp{nilai_Z[3]:,.0f}")
-            st.write(f"E(0,{titik_E[1]:.0f}) = Rp{nilai_Z[4]:,.0f}")
+            st.subheader("Titik Optimal (Simpleks)")
+            st.write(f"({optimal_point[0]:.2f}, {optimal_point[1]:.2f}) = Rp{optimal_value:,.0f}")
+            st.write(f"Sisa waktu produksi: {hasil.slack[0]:.2f} jam")
+            st.write(f"Jumlah iterasi simpleks: {hasil.iterations}")
+            st.caption(hasil.message)
+            info_cache = lp_cache().stats()
+            st.caption(f"Cache LP: {info_cache['hits']} hit, {info_cache['misses']} miss, "
+                       f"{info_cache['entries']} entri ({info_cache['bytes'] / 1024:.1f} KB)")
         
         with cols[1]:
             st.subheader("Grafik Solusi")
@@ -293,19 +316,108 @@ elif st.session_state.current_page == "Optimasi":
             ax.grid(True)
             st.pyplot(fig)
         
+        # Sensitivitas dari basis optimal (tanpa solve ulang)
+        st.subheader("Analisis Sensitivitas" + (" (Relaksasi LP)" if produksi_bulat else ""))
+        sens = sensitivity(hasil)
+        cols = st.columns(2)
+        with cols[0]:
+            st.markdown("**Koefisien Keuntungan (c)**")
+            st.table({
+                "Variabel": ["Produk 1", "Produk 2"],
+                "Nilai": [f"{v:.2f}" for v in hasil.x],
+                "Keuntungan/unit": [f"Rp{p1:,.0f}", f"Rp{p2:,.0f}"],
+                "Reduced cost": [f"{v:,.0f}" for v in sens.reduced_costs],
+                "Kenaikan maks": [f"{v:,.0f}" for v in sens.c_increase],
+                "Penurunan maks": [f"{v:,.0f}" for v in sens.c_decrease],
+            })
+        with cols[1]:
+            st.markdown("**Kapasitas Kendala (b)**")
+            st.table({
+                "Kendala": ["Waktu produksi"],
+                "Kapasitas": [f"{total_time}"],
+                "Harga bayangan": [f"Rp{sens.duals[0]:,.0f}/jam"],
+                "Kenaikan maks": [f"{sens.b_increase[0]:,.2f}"],
+                "Penurunan maks": [f"{sens.b_decrease[0]:,.2f}"],
+            })
+
         st.success(f"""
         ## 🎯 SOLUSI OPTIMAL
         **Produksi:**
-        - Produk 1: {optimal_point[0]:.0f} unit
-        - Produk 2: {optimal_point[1]:.0f} unit
+        - Produk 1: {optimal_point[0]:.2f} unit
+        - Produk 2: {optimal_point[1]:.2f} unit
         
         **Keuntungan Maksimum:** Rp{optimal_value:,.0f}
         """)
 
+    with st.expander("📈 ANALISIS PARAMETRIK KAPASITAS"):
+        st.write("Keuntungan maksimum sebagai fungsi total waktu tersedia, dihitung dalam satu lintasan.")
+        batas_waktu = st.number_input("Batas atas total waktu (jam)", min_value=1, value=2*total_time, key="batas_waktu")
+        if st.button("📈 TELUSURI KURVA KEUNTUNGAN", use_container_width=True):
+            # b(θ) = 0 + θ: kapasitas waktu dari 0 sampai batas atas
+            kurva = parametric_rhs([p1, p2], [[t1, t2]], [0], [1], batas_waktu,
+                                   bounds=[(0, max1), (0, max2)])
+            fig, ax = plt.subplots(figsize=(10,5))
+            ax.plot(kurva.theta, kurva.objective, 'b-', label='Keuntungan maksimum')
+            ax.plot(kurva.theta, kurva.objective, 'ro', label='Titik patah (pergantian basis)')
+            ax.axvline(total_time, color='g', linestyle='--', label=f'Kapasitas saat ini ({total_time} jam)')
+            ax.set_xlabel('Total waktu tersedia (jam)')
+            ax.set_ylabel('Keuntungan maksimum (Rp)')
+            ax.legend()
+            ax.grid(True)
+            st.pyplot(fig)
+            st.table({
+                "Waktu (jam)": [f"{v:,.2f}" for v in kurva.theta],
+                "Produk 1": [f"{v:.2f}" for v in kurva.x[:, 0]],
+                "Produk 2": [f"{v:.2f}" for v in kurva.x[:, 1]],
+                "Keuntungan": [f"Rp{v:,.0f}" for v in kurva.objective],
+            })
+            st.caption(f"{kurva.theta.size} titik patah, {kurva.iterations} pivot simpleks")
+
+    with st.expander("📂 MODEL BESAR (N PRODUK, M KENDALA)"):
+        st.markdown("""
+        Upload file CSV tanpa header:
+        - Baris pertama: keuntungan per unit tiap produk (kolom terakhir dikosongkan)
+        - Baris berikutnya: kebutuhan sumber daya tiap produk, kolom terakhir = kapasitas
+        """)
+        file_model = st.file_uploader("File model (CSV)", type="csv", key="file_lp")
+        pakai_presolve = st.checkbox("Jalankan presolve (hapus baris duplikat/redundan dan variabel tetap)",
+                                     value=True, key="presolve_lp")
+        col_mesin, col_cross = st.columns(2)
+        with col_mesin:
+            mesin = st.selectbox("Mesin solver", ["Otomatis", "Simpleks", "Interior-point"], key="mesin_lp",
+                                 help="Otomatis: interior-point untuk model padat besar, simpleks selain itu")
+        with col_cross:
+            pakai_crossover = st.checkbox("Crossover ke titik sudut (basis untuk warm start)",
+                                          value=True, key="crossover_lp")
+        if file_model is not None:
+            data = np.genfromtxt(file_model, delimiter=",")
+            data = np.atleast_2d(data)
+            c_besar = data[0, :-1] if np.isnan(data[0, -1]) else data[0]
+            A_besar = data[1:, :c_besar.size]
+            b_besar = data[1:, -1]
+            A_besar = np.nan_to_num(A_besar)
+            # matriks kendala yang jarang (<5% terisi) diselesaikan dalam format CSR
+            if np.count_nonzero(A_besar) < 0.05 * A_besar.size:
+                A_besar = CSRMatrix.from_dense(A_besar)
+            basis_lama = st.session_state.get("lp_basis_besar")
+            hasil_besar = lp_cache().solve(c_besar, A_besar, b_besar, presolve=pakai_presolve,
+                                           basis=basis_lama[1] if basis_lama and basis_lama[0] == A_besar.shape else None,
+                                           method={"Otomatis": "auto", "Simpleks": "simplex",
+                                                   "Interior-point": "ipm"}[mesin],
+                                           crossover=pakai_crossover)
+            if hasil_besar.success:
+                st.session_state.lp_basis_besar = (A_besar.shape, hasil_besar.basis)
+                st.success(f"Keuntungan maksimum: Rp{hasil_besar.objective:,.0f} "
+                           f"({c_besar.size} produk, {b_besar.size} kendala, {hasil_besar.iterations} iterasi)")
+                st.caption(hasil_besar.message)
+                st.dataframe({"Produk": np.arange(1, c_besar.size + 1), "Jumlah produksi": hasil_besar.x})
+            else:
+                st.error(f"Solver gagal: {hasil_besar.message}")
+
 # =============== HALAMAN EOQ ===============
 elif st.session_state.current_page == "EOQ":
     st.title("📦 MODEL PERSEDIAAN (EOQ)")
-        with st.expander("📚 Contoh Soal & Pembahasan", expanded=True):
+    with st.expander("📚 Contoh Soal & Pembahasan", expanded=True):
         st.subheader("Studi Kasus: Toko Bahan Bangunan")
         st.markdown("""
         **Toko Bangun Jaya** memiliki data:
@@ -411,10 +523,295 @@ elif st.session_state.current_page == "EOQ":
         **Total biaya persediaan minimum:** Rp{total_cost:,.0f}/tahun
         """)
 
+    with st.expander("🎲 ROP STOKASTIK (SAFETY STOCK)"):
+        st.markdown("""
+        ROP = (D/365) × L menganggap permintaan dan waktu tunggu pasti. Di sini
+        permintaan harian dan waktu tunggu boleh bervariasi, lalu ROP dipilih agar
+        memenuhi target layanan dengan ukuran pesanan Q = EOQ.
+        - **Cycle service:** peluang tidak kehabisan stok dalam satu siklus
+        - **Fill rate:** porsi permintaan yang langsung terpenuhi dari stok
+        """)
+        cols = st.columns(2)
+        sd_harian = cols[0].number_input("Simpangan baku permintaan harian (unit)", 0.0, value=5.0)
+        sd_tunggu = cols[1].number_input("Simpangan baku waktu tunggu (hari)", 0.0, value=1.0)
+        distribusi = cols[0].radio("Distribusi permintaan selama waktu tunggu", ["Normal", "Gamma"], horizontal=True)
+        jenis_target = cols[1].radio("Target layanan", ["Cycle service", "Fill rate"], horizontal=True)
+        layanan = st.slider("Tingkat layanan (%)", 50.0, 99.9, 95.0, 0.1)
+        if st.button("🧮 HITUNG ROP STOKASTIK", key="hitung_rop"):
+            q_eoq = np.sqrt(2 * D * S / H)
+            kebijakan = reorder_point(D, L, q_eoq, demand_std=sd_harian, lead_time_std=sd_tunggu,
+                                      service=layanan / 100,
+                                      target="cycle" if jenis_target == "Cycle service" else "fill",
+                                      distribution=distribusi.lower())
+            if np.isnan(kebijakan.reorder_point):
+                st.error("Parameter tidak valid (D, Q harus positif dan L tidak negatif)")
+                st.stop()
+            cols = st.columns(3)
+            cols[0].metric("ROP", f"{kebijakan.reorder_point:,.1f} unit",
+                           f"{kebijakan.reorder_point - D / 365 * L:+,.1f} vs ROP pasti")
+            cols[1].metric("Safety stock", f"{kebijakan.safety_stock:,.1f} unit")
+            cols[2].metric("Permintaan selama waktu tunggu",
+                           f"{kebijakan.lead_time_demand_mean:,.1f} ± {kebijakan.lead_time_demand_std:,.1f}")
+            st.success(f"""
+            **Pesan {q_eoq:,.0f} unit setiap stok menyentuh {kebijakan.reorder_point:,.1f} unit**  
+            **Cycle service:** {kebijakan.cycle_service:.2%}  
+            **Fill rate:** {kebijakan.fill_rate:.2%}  
+            **Rata-rata kekurangan per siklus:** {kebijakan.expected_shortage:,.2f} unit  
+            **Biaya simpan safety stock:** Rp{max(float(kebijakan.safety_stock), 0) * H:,.0f}/tahun
+            """)
+
+        st.markdown("**Validasi Monte Carlo:** simulasikan kebijakan di atas terhadap permintaan acak selama satu tahun.")
+        jumlah_jalur = st.select_slider("Jumlah replikasi", [1000, 2000, 5000, 10000, 20000], 10000)
+        if st.button("🎲 SIMULASIKAN KEBIJAKAN", key="simulasi_rop"):
+            q_eoq = np.sqrt(2 * D * S / H)
+            kebijakan = reorder_point(D, L, q_eoq, demand_std=sd_harian, lead_time_std=sd_tunggu,
+                                      service=layanan / 100,
+                                      target="cycle" if jenis_target == "Cycle service" else "fill",
+                                      distribution=distribusi.lower())
+            try:
+                sim = simulate_inventory(D, S, H, L, float(kebijakan.reorder_point), float(q_eoq),
+                                         demand_std=sd_harian, lead_time_std=sd_tunggu, paths=jumlah_jalur,
+                                         distribution=distribusi.lower())
+            except ValueError as e:
+                st.error(f"Parameter tidak valid: {e}")
+                st.stop()
+            ringkas = sim.percentiles()
+            cols = st.columns(3)
+            cols[0].metric("Median biaya pesan + simpan", f"Rp{ringkas['cost'][1]:,.0f}",
+                           f"{ringkas['cost'][1] - np.sqrt(2 * D * S * H):+,.0f} vs EOQ")
+            cols[1].metric("Hari kehabisan stok (median)", f"{ringkas['stockout_days'][1]:.0f} hari")
+            cols[2].metric("Fill rate rata-rata", f"{np.nanmean(sim.fill_rate):.2%}")
+            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10,4))
+            ax1.hist(sim.cost, bins=50, color='skyblue')
+            ax1.set_xlabel('Biaya per tahun (Rp)')
+            ax1.set_ylabel('Jumlah replikasi')
+            ax2.hist(sim.stockout_days, bins=np.arange(sim.stockout_days.max() + 2) - 0.5, color='salmon')
+            ax2.set_xlabel('Hari kehabisan stok per tahun')
+            plt.tight_layout()
+            st.pyplot(fig)
+            st.table({
+                "Persentil": ["P5", "P50", "P95"],
+                "Biaya (Rp)": [f"{v:,.0f}" for v in ringkas["cost"]],
+                "Hari kehabisan stok": [f"{v:.0f}" for v in ringkas["stockout_days"]],
+                "Persediaan rata-rata": [f"{v:,.1f}" for v in ringkas["avg_inventory"]],
+            })
+            st.caption(f"{jumlah_jalur:,} replikasi x 365 hari dalam {sim.seconds:.2f} detik")
+
+    with st.expander("🏬 MULTI-ITEM DENGAN KAPASITAS GUDANG"):
+        st.markdown("""
+        EOQ per item mengabaikan bahwa semua item berbagi satu gudang. Isi satu item
+        per baris: **D, S, H, ruang per unit** (m²). Jika total ruang pesanan EOQ
+        melebihi kapasitas, ukuran pesanan diperkecil secara optimal (relaksasi
+        Lagrange) dan harga bayangan ruang gudang dilaporkan.
+        """)
+        teks_item = st.text_area("Data item (D, S, H, ruang)", "10000, 150000, 5000, 0.5\n"
+                                 "4000, 80000, 2000, 1.2\n25000, 60000, 1500, 0.2")
+        kapasitas_gudang = st.number_input("Kapasitas gudang (m²)", 1.0, value=800.0)
+        if st.button("🧮 HITUNG EOQ MULTI-ITEM", key="hitung_multi"):
+            try:
+                data_item = np.array([[float(v) for v in baris.split(",")]
+                                      for baris in teks_item.strip().splitlines() if baris.strip()])
+                if data_item.ndim != 2 or data_item.shape[1] != 4:
+                    raise ValueError("setiap baris harus berisi 4 angka")
+                hasil_multi = eoq_constrained(data_item[:, 0], data_item[:, 1], data_item[:, 2],
+                                              data_item[:, 3], kapasitas_gudang)
+            except ValueError as e:
+                st.error(f"Data tidak valid: {e}")
+                st.stop()
+            q_bebas = np.sqrt(2 * data_item[:, 0] * data_item[:, 1] / data_item[:, 2])
+            st.dataframe({"Item": np.arange(1, len(data_item) + 1),
+                          "EOQ tanpa kendala": np.round(q_bebas, 1),
+                          "Q dengan kendala": np.round(hasil_multi.Q, 1),
+                          "Ruang dipakai (m²)": np.round(hasil_multi.Q * data_item[:, 3], 1)})
+            cols = st.columns(3)
+            cols[0].metric("Ruang terpakai", f"{hasil_multi.usage:,.1f} m²",
+                           f"{float(q_bebas @ data_item[:, 3]):,.1f} m² tanpa kendala", delta_color="off")
+            cols[1].metric("Total biaya pesan + simpan", f"Rp{hasil_multi.total_cost:,.0f}")
+            cols[2].metric("Harga bayangan ruang", f"Rp{hasil_multi.shadow_price:,.0f}/m²")
+            st.caption(f"{hasil_multi.message} ({hasil_multi.iterations} iterasi). Menambah 1 m² gudang "
+                       f"menghemat sekitar Rp{hasil_multi.shadow_price:,.0f} per tahun.")
+
+    with st.expander("🤝 PEMESANAN GABUNGAN (SATU PEMASOK)"):
+        st.markdown("""
+        Item dari pemasok yang sama berbagi biaya pemesanan utama S. Semua item
+        dipesan pada siklus dasar T atau kelipatannya (k × T), sehingga biaya S
+        dibagi bersama. Isi satu item per baris: **D, biaya tambahan per item, H**.
+        """)
+        teks_gabungan = st.text_area("Data item (D, biaya tambahan, H)", "10000, 20000, 5000\n"
+                                     "4000, 15000, 2000\n1500, 10000, 3000\n600, 10000, 4000",
+                                     key="data_gabungan")
+        S_utama = st.number_input("Biaya pemesanan utama per pesanan gabungan (Rp)", 0, value=150000)
+        aturan = st.radio("Kelipatan siklus", ["Bilangan bulat (RAND)", "Pangkat dua (2, 4, 8, ...)"],
+                          horizontal=True)
+        if st.button("🧮 HITUNG PEMESANAN GABUNGAN", key="hitung_gabungan"):
+            try:
+                data_gabungan = np.array([[float(v) for v in baris.split(",")]
+                                          for baris in teks_gabungan.strip().splitlines() if baris.strip()])
+                if data_gabungan.ndim != 2 or data_gabungan.shape[1] != 3:
+                    raise ValueError("setiap baris harus berisi 3 angka")
+                jrp = joint_replenishment(data_gabungan[:, 0], S_utama, data_gabungan[:, 1],
+                                          data_gabungan[:, 2],
+                                          policy="rand" if aturan.startswith("Bilangan") else "power_of_two")
+            except ValueError as e:
+                st.error(f"Data tidak valid: {e}")
+                st.stop()
+            st.dataframe({"Item": np.arange(1, len(data_gabungan) + 1),
+                          "Dipesan tiap (x T)": jrp.multipliers,
+                          "Interval (hari)": np.round(jrp.multipliers * jrp.base_cycle * 365, 1),
+                          "Ukuran pesanan": np.round(jrp.order_quantity, 1)})
+            cols = st.columns(3)
+            cols[0].metric("Siklus dasar T", f"{jrp.base_cycle * 365:,.1f} hari")
+            cols[1].metric("Biaya gabungan", f"Rp{jrp.total_cost:,.0f}/tahun")
+            cols[2].metric("Penghematan", f"Rp{jrp.savings:,.0f}/tahun",
+                           f"{jrp.savings / jrp.independent_cost:.1%} vs pesan terpisah")
+
+    with st.expander("💸 DISKON KUANTITAS"):
+        st.markdown("""
+        Harga per unit turun jika jumlah pesanan mencapai batas tertentu.
+        - **Semua unit:** harga tingkat berlaku untuk seluruh unit pesanan
+        - **Inkremental:** harga tingkat hanya untuk unit di atas batasnya
+        
+        Biaya simpan per unit = H + persentase simpan × harga.
+        """)
+        batas_teks = st.text_input("Batas kuantitas minimum tiap tingkat (pisahkan koma)", "0, 1000, 2500")
+        harga_teks = st.text_input("Harga per unit tiap tingkat (Rp)", "60000, 58000, 57000")
+        persen_simpan = st.number_input("Biaya simpan (% harga per tahun)", 0.0, 100.0, 0.0)
+        skema = st.radio("Skema diskon", ["Semua unit", "Inkremental"], horizontal=True)
+        if st.button("🧮 HITUNG DENGAN DISKON", key="hitung_diskon"):
+            try:
+                batas = np.array([float(v) for v in batas_teks.split(",")])
+                harga = np.array([float(v) for v in harga_teks.split(",")])
+            except ValueError:
+                st.error("Batas dan harga harus berupa angka dipisahkan koma")
+                st.stop()
+            if batas.size != harga.size or np.any(np.diff(batas) <= 0):
+                st.error("Jumlah batas dan harga harus sama, dan batas harus naik")
+                st.stop()
+            q_diskon, tingkat, biaya_diskon = eoq_discount(
+                D, S, batas, harga, holding_cost=H, holding_rate=persen_simpan / 100,
+                scheme="all_units" if skema == "Semua unit" else "incremental")
+            if np.isnan(q_diskon):
+                st.error("Biaya simpan harus positif pada setiap tingkat")
+                st.stop()
+            tingkat = int(tingkat)
+            st.dataframe({"Tingkat": np.arange(1, batas.size + 1), "Batas minimum": batas, "Harga": harga})
+            st.success(f"""
+            **Pesan {q_diskon:,.0f} unit** (tingkat {tingkat + 1}, harga Rp{harga[tingkat]:,.0f}/unit)  
+            **Frekuensi pemesanan:** {D / q_diskon:.1f} kali/tahun  
+            **Total biaya (pembelian + pesan + simpan):** Rp{biaya_diskon:,.0f}/tahun
+            """)
+
+    with st.expander("📂 MODE MASSAL (KATALOG SKU)"):
+        st.markdown("""
+        Upload katalog berisi kolom **D, S, H, L** per SKU:
+        - CSV (boleh dengan header D,S,H,L dalam urutan bebas), atau
+        - NPY 2-D dengan empat kolom pertama D, S, H, L
+        
+        File diproses per potongan sehingga katalog jutaan SKU tetap hemat memori.
+        Dengan diskon kuantitas, katalog butuh kolom kelima **P** (harga dasar per unit).
+        """)
+        file_katalog = st.file_uploader("File katalog", type=["csv", "npy"], key="file_eoq")
+        pakai_diskon = st.checkbox("Pakai diskon kuantitas (kolom P)", key="diskon_massal")
+        opsi_diskon = {}
+        if pakai_diskon:
+            batas_massal = st.text_input("Batas kuantitas tiap tingkat", "0, 100, 500, 1000", key="batas_massal")
+            potongan_massal = st.text_input("Potongan harga tiap tingkat (%)", "0, 2, 5, 8", key="potongan_massal")
+            simpan_massal = st.number_input("Biaya simpan (% harga per tahun)", 0.0, 100.0, 20.0, key="simpan_massal")
+            skema_massal = st.radio("Skema diskon", ["Semua unit", "Inkremental"], horizontal=True, key="skema_massal")
+            try:
+                opsi_diskon = dict(breaks=[float(v) for v in batas_massal.split(",")],
+                                   discounts=[float(v) / 100 for v in potongan_massal.split(",")],
+                                   holding_rate=simpan_massal / 100,
+                                   scheme="all_units" if skema_massal == "Semua unit" else "incremental")
+            except ValueError:
+                st.error("Batas dan potongan harus berupa angka dipisahkan koma")
+                st.stop()
+        if file_katalog is not None and st.button("🚀 PROSES KATALOG", key="proses_eoq"):
+            keluaran = BytesIO()
+            try:
+                ringkasan = bulk_eoq(file_katalog, keluaran, **opsi_diskon)
+            except ValueError as e:
+                st.error(f"File tidak valid: {e}")
+                st.stop()
+            cols = st.columns(3)
+            cols[0].metric("Jumlah SKU", f"{ringkasan.rows:,}")
+            cols[1].metric("Baris tidak valid", f"{ringkasan.invalid:,}")
+            cols[2].metric("Total biaya persediaan", f"Rp{ringkasan.total_cost:,.0f}")
+            st.caption(f"Selesai dalam {ringkasan.seconds:.2f} detik")
+            st.download_button("💾 Unduh hasil (EOQ, ROP, frekuensi, total biaya)", keluaran.getvalue(),
+                               file_name="hasil_eoq.csv", mime="text/csv")
+
+# =============== HALAMAN LOT SIZING DINAMIS ===============
+elif st.session_state.current_page == "Lot Sizing":
+    st.title("📅 LOT SIZING DINAMIS (WAGNER-WHITIN)")
+    st.markdown("""
+    EOQ menganggap permintaan tahunan D konstan. Jika permintaan berubah tiap periode
+    (mingguan, musiman), model Wagner-Whitin menentukan **kapan** memesan dan
+    **berapa banyak** sehingga total biaya setup + simpan minimum. Setiap pesanan
+    menutup permintaan beberapa periode berurutan hingga pesanan berikutnya.
+    """)
+
+    with st.expander("🔧 PARAMETER", expanded=True):
+        teks_permintaan = st.text_area("Permintaan per periode (pisahkan koma)",
+                                       "120, 80, 150, 200, 60, 90, 300, 250, 100, 50, 180, 220")
+        cols = st.columns(2)
+        biaya_setup = cols[0].number_input("Biaya pemesanan/setup per pesanan (Rp)", 0, value=150000)
+        biaya_simpan_periode = cols[1].number_input("Biaya simpan per unit per periode (Rp)", 0.0, value=500.0)
+
+    if st.button("🧮 HITUNG RENCANA PESANAN", type="primary", use_container_width=True):
+        try:
+            permintaan = np.array([float(v) for v in teks_permintaan.split(",")])
+            rencana = wagner_whitin(permintaan, biaya_setup, biaya_simpan_periode)
+        except ValueError as e:
+            st.error(f"Data tidak valid: {e}")
+            st.stop()
+        periode = np.arange(1, permintaan.size + 1)
+        pesan_tiap = biaya_setup * np.count_nonzero(permintaan)
+        cols = st.columns(3)
+        cols[0].metric("Total biaya minimum", f"Rp{rencana.total_cost:,.0f}")
+        cols[1].metric("Jumlah pesanan", f"{rencana.setups} kali")
+        cols[2].metric("Pesan tiap periode", f"Rp{pesan_tiap:,.0f}",
+                       f"{pesan_tiap - rencana.total_cost:+,.0f} lebih mahal", delta_color="off")
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10,6), sharex=True)
+        ax1.bar(periode - 0.2, permintaan, width=0.4, color='skyblue', label='Permintaan')
+        ax1.bar(periode + 0.2, rencana.orders, width=0.4, color='orange', label='Pesanan')
+        ax1.set_ylabel('Unit')
+        ax1.legend()
+        ax2.step(periode, rencana.inventory, where='mid', color='green')
+        ax2.set_xlabel('Periode')
+        ax2.set_ylabel('Persediaan akhir')
+        plt.tight_layout()
+        st.pyplot(fig)
+        st.table({"Periode": periode, "Permintaan": permintaan, "Pesanan": rencana.orders,
+                  "Persediaan akhir": rencana.inventory})
+
+    with st.expander("📂 MODE MASSAL (BANYAK SKU)"):
+        st.markdown("""
+        Upload CSV tanpa header: satu baris per SKU, satu kolom per periode (misalnya
+        5 tahun harian = 1825 kolom). Biaya setup dan simpan di atas dipakai untuk semua SKU.
+        """)
+        file_deret = st.file_uploader("File permintaan", type=["csv"], key="file_ww")
+        if file_deret is not None and st.button("🚀 PROSES SEMUA SKU", key="proses_ww"):
+            try:
+                deret = np.atleast_2d(np.loadtxt(file_deret, delimiter=","))
+                rencana = wagner_whitin(deret, biaya_setup, biaya_simpan_periode)
+            except ValueError as e:
+                st.error(f"File tidak valid: {e}")
+                st.stop()
+            cols = st.columns(3)
+            cols[0].metric("Jumlah SKU x periode", f"{deret.shape[0]:,} x {deret.shape[1]:,}")
+            cols[1].metric("Total biaya semua SKU", f"Rp{rencana.total_cost.sum():,.0f}")
+            cols[2].metric("Rata-rata pesanan per SKU", f"{rencana.setups.mean():.1f}")
+            st.caption(f"Selesai dalam {rencana.seconds:.2f} detik")
+            keluaran = BytesIO()
+            np.savetxt(keluaran, rencana.orders, delimiter=",", fmt="%.6g")
+            st.download_button("💾 Unduh rencana pesanan (baris = SKU)", keluaran.getvalue(),
+                               file_name="rencana_pesanan.csv", mime="text/csv")
+
 # =============== HALAMAN ANTRIAN ===============
 elif st.session_state.current_page == "Antrian":
-    st.title("🔄 MODEL ANTRIAN (M/M/1)")
-        with st.expander("📚 Contoh Soal & Pembahasan", expanded=True):
+    st.title("🔄 MODEL ANTRIAN (M/M/c)")
+    with st.expander("📚 Contoh Soal & Pembahasan", expanded=True):
         st.subheader("Studi Kasus: Klinik Kesehatan")
         st.markdown("""
         **Klinik Sehat Bahagia** memiliki:
@@ -467,35 +864,42 @@ elif st.session_state.current_page == "Antrian":
         col1, col2 = st.columns(2)
         with col1:
             λ = st.number_input("Tingkat kedatangan (pelanggan/jam)", min_value=0.1, value=12.0, step=0.1)
+            c = st.number_input("Jumlah server (c)", min_value=1, value=1, step=1)
         with col2:
-            μ = st.number_input("Tingkat pelayanan (pelanggan/jam)", min_value=0.1, value=15.0, step=0.1)
+            μ = st.number_input("Tingkat pelayanan per server (pelanggan/jam)", min_value=0.1, value=15.0, step=0.1)
+            kapasitas = st.number_input("Kapasitas sistem K (0 = tanpa batas)", min_value=0, value=0, step=1,
+                                        help="Pelanggan yang datang saat sudah ada K orang di sistem akan ditolak")
         
         cost_waiting = st.number_input("Biaya menunggu per pelanggan/jam (Rp)", 50000)
         cost_add_server = st.number_input("Biaya tambahan server/jam (Rp)", 200000)
 
     if st.button("🧮 HITUNG PARAMETER", type="primary", use_container_width=True):
-        if μ <= λ:
-            st.error("Error: Tingkat pelayanan harus > tingkat kedatangan (μ > λ)")
+        K = np.inf if kapasitas == 0 else kapasitas
+        if np.isfinite(K) and K < c:
+            st.error("Error: Kapasitas sistem K tidak boleh lebih kecil dari jumlah server c")
+        elif not np.isfinite(K) and c*μ <= λ:
+            st.error("Error: Kapasitas pelayanan harus > tingkat kedatangan (cμ > λ)")
         else:
-            ρ = λ/μ
-            W = 1/(μ-λ)
-            Wq = W - (1/μ)
-            L = λ*W
-            Lq = λ*Wq
-            total_waiting_cost = Wq*λ*cost_waiting
+            hasil = mmc(λ, μ, c, K)
+            ρ = float(hasil.utilization)
+            W, Wq = float(hasil.W), float(hasil.Wq)
+            L, Lq = float(hasil.L), float(hasil.Lq)
+            total_waiting_cost = Wq*float(hasil.throughput)*cost_waiting
+            model = f"M/M/{c}" + (f"/{kapasitas}" if kapasitas else "")
             
             st.markdown("---")
-            st.header("📝 HASIL PERHITUNGAN")
+            st.header(f"📝 HASIL PERHITUNGAN ({model})")
             
             cols = st.columns(2)
             with cols[0]:
                 st.subheader("Parameter Utama")
                 st.latex(rf"""
                 \begin{{aligned}}
-                \rho &= \frac{{\lambda}}{{\mu}} = \frac{{{λ}}}{{{μ}}} = {ρ:.2f} \\
-                W &= \frac{{1}}{{\mu-\lambda}} = \frac{{1}}{{{μ}-{λ}}} = {W:.2f} \text{{ jam}} \\
-                W_q &= W - \frac{{1}}{{\mu}} = {Wq:.2f} \text{{ jam}} \\
-                &= {Wq*60:.1f} \text{{ menit}}
+                \rho &= \frac{{\lambda_{{efektif}}}}{{c\mu}} = {ρ:.2f} \\
+                P_0 &= {float(hasil.p0):.4f} \\
+                P(\text{{menunggu}}) &= {float(hasil.p_wait):.4f} \\
+                W &= {W:.3f} \text{{ jam}} \\
+                W_q &= {Wq:.3f} \text{{ jam}} = {Wq*60:.1f} \text{{ menit}}
                 \end{{aligned}}
                 """)
             
@@ -503,25 +907,38 @@ elif st.session_state.current_page == "Antrian":
                 st.subheader("Jumlah Pelanggan")
                 st.latex(rf"""
                 \begin{{aligned}}
-                L &= \lambda W = {λ} \times {W:.2f} = {L:.1f} \\
-                L_q &= \lambda W_q = {λ} \times {Wq:.2f} = {Lq:.1f}
+                L &= \lambda_{{efektif}} W = {L:.2f} \\
+                L_q &= \lambda_{{efektif}} W_q = {Lq:.2f}
                 \end{{aligned}}
                 """)
+                if kapasitas:
+                    st.write(f"**Pelanggan ditolak (sistem penuh):** {float(hasil.p_block):.2%}")
             
-            # Analisis biaya
+            # Analisis biaya: M/M/c eksak untuk c, c+1, ..., c+5 dalam satu panggilan
             st.subheader("Analisis Biaya")
             st.write(f"**Biaya menunggu total:** Rp{total_waiting_cost:,.0f}/jam")
             
             if cost_add_server > 0:
-                new_μ = μ + 15  # Asumsi penambahan 1 server meningkatkan μ sebesar 15
-                new_Wq = (λ)/(new_μ*(new_μ-λ))
-                new_cost = new_Wq*λ*cost_waiting + cost_add_server
-                improvement = (total_waiting_cost - new_cost)/total_waiting_cost*100
+                server = np.arange(c, c + 6)
+                alternatif = mmc(λ, μ, server, np.maximum(K, server))
+                biaya_tunggu = alternatif.Wq*alternatif.throughput*cost_waiting
+                biaya_total = biaya_tunggu + (server - c)*cost_add_server
+                terbaik = int(np.argmin(biaya_total))
                 
-                st.write(f"**Dengan tambahan server (μ={new_μ}):**")
-                st.write(f"- Waktu tunggu baru: {new_Wq*60:.1f} menit")
-                st.write(f"- Total biaya baru: Rp{new_cost:,.0f}/jam")
-                st.write(f"- Penghematan: {improvement:.1f}%")
+                st.write("**Perbandingan jumlah server (biaya server tambahan dihitung dari kondisi saat ini):**")
+                st.table({
+                    "Server": server,
+                    "Wq (menit)": np.round(alternatif.Wq*60, 2),
+                    "Lq": np.round(alternatif.Lq, 2),
+                    "Biaya menunggu (Rp/jam)": [f"{v:,.0f}" for v in biaya_tunggu],
+                    "Total biaya (Rp/jam)": [f"{v:,.0f}" for v in biaya_total],
+                })
+                if terbaik > 0:
+                    improvement = (biaya_total[0] - biaya_total[terbaik])/biaya_total[0]*100
+                    st.write(f"- Paling hemat dengan **{server[terbaik]} server** "
+                             f"(penghematan {improvement:.1f}%)")
+                else:
+                    st.write("- Menambah server tidak menurunkan total biaya")
             
             # Interpretasi Utilisasi
             util_status = ""
@@ -545,10 +962,255 @@ elif st.session_state.current_page == "Antrian":
             - {'Pertimbangkan penambahan server' if ρ > 0.7 else 'Sistem dalam kondisi baik'}
             """)
 
+    with st.expander("🎲 SIMULASI (LAYANAN NON-EKSPONENSIAL & BALKING)"):
+        st.caption("Rumus di atas mengasumsikan waktu antar kedatangan dan layanan eksponensial "
+                   "tanpa pelanggan yang batal mengantre. Simulasi kejadian diskrit melonggarkan keduanya.")
+        pilihan_dist = {"Eksponensial": "exponential", "Lognormal": "lognormal",
+                        "Gamma": "gamma", "Deterministik": "deterministic"}
+        cols = st.columns(2)
+        with cols[0]:
+            dist_datang = st.selectbox("Distribusi antar kedatangan", list(pilihan_dist), key="sim_datang")
+            cv_datang = st.number_input("Koefisien variasi antar kedatangan", min_value=0.0, value=1.0,
+                                        step=0.1, key="sim_cv_datang")
+        with cols[1]:
+            dist_layan = st.selectbox("Distribusi waktu layanan", list(pilihan_dist), key="sim_layan")
+            cv_layan = st.number_input("Koefisien variasi waktu layanan", min_value=0.0, value=1.0,
+                                       step=0.1, key="sim_cv_layan")
+        teks_balk = st.text_input("Peluang pelanggan batal jika melihat 0, 1, 2, ... orang di sistem",
+                                  "", help="Contoh: 0, 0.1, 0.3, 0.6, 1 (kosongkan jika tidak ada balking)")
+        jumlah_pelanggan = st.number_input("Jumlah pelanggan disimulasikan", min_value=10_000,
+                                           value=1_000_000, step=100_000)
+        paralel = st.checkbox("Replikasi independen paralel (semua inti CPU)", key="sim_paralel",
+                              help="Jumlah pelanggan di atas berlaku per replikasi; berhenti lebih awal "
+                                   "jika presisi target tercapai")
+        if paralel:
+            cols = st.columns(2)
+            jumlah_replikasi = cols[0].number_input("Replikasi maksimum", min_value=2, value=50, key="sim_rep")
+            presisi = cols[1].number_input("Presisi relatif target (%)", min_value=0.0, value=1.0,
+                                           step=0.5, key="sim_presisi",
+                                           help="Setengah lebar selang 95% dibanding rata-rata; 0 = jalankan semua")
+
+        if st.button("🎲 Jalankan Simulasi", use_container_width=True):
+            K = np.inf if kapasitas == 0 else kapasitas
+            ukuran = ["W", "Wq", "L", "Lq"]
+            try:
+                balking = [float(p) for p in teks_balk.split(",")] if teks_balk.strip() else None
+                model = partial(simulate_queue, λ, μ, c, int(jumlah_pelanggan),
+                                arrival=pilihan_dist[dist_datang], arrival_cv=cv_datang,
+                                service=pilihan_dist[dist_layan], service_cv=cv_layan,
+                                K=K, balking=balking)
+                if paralel:
+                    bar = st.progress(0.0, text="Replikasi berjalan...")
+                    def kemajuan(n, total):
+                        bar.progress(n/total, text=f"Replikasi {n}/{total}")
+                    rep = run_replications(model, ukuran + ["utilization", "balk_rate"], int(jumlah_replikasi),
+                                           rel_precision=presisi/100 if presisi > 0 else None,
+                                           progress=kemajuan)
+                    bar.empty()
+                    nilai = {u: rep.mean[u] for u in rep.mean}
+                    selang = {u: rep.interval(u) for u in ukuran}
+                else:
+                    with st.spinner("Mensimulasikan..."):
+                        sim = model()
+                    nilai = {u: getattr(sim, u) for u in ukuran + ["utilization", "balk_rate"]}
+                    selang = {u: sim.interval(u) for u in ukuran}
+            except ValueError as e:
+                st.error(f"Input tidak valid: {e}")
+            else:
+                analitik = mmc(λ, μ, c, K) if np.isfinite(K) or c*μ > λ else None
+                st.table({
+                    "Ukuran": ukuran,
+                    "Simulasi": [f"{nilai[u]:.4f}" for u in ukuran],
+                    "Selang 95%": [f"{selang[u][0]:.4f} – {selang[u][1]:.4f}" for u in ukuran],
+                    "Analitik M/M/c": [f"{float(getattr(analitik, u)):.4f}" if analitik else "tidak stabil"
+                                       for u in ukuran],
+                })
+                cols = st.columns(3)
+                cols[0].metric("Utilisasi server", f"{nilai['utilization']:.1%}")
+                cols[1].metric("Pelanggan batal/ditolak", f"{nilai['balk_rate']:.2%}")
+                if paralel:
+                    cols[2].metric("Replikasi", f"{rep.replications}",
+                                   "presisi tercapai" if rep.converged else "presisi belum tercapai")
+                    st.caption(f"Selesai dalam {rep.seconds:.1f} detik; W dan Wq dalam jam")
+                else:
+                    cols[2].metric("Pelanggan tercatat", f"{sim.customers:,}")
+                    st.caption(f"Selesai dalam {sim.seconds:.1f} detik; W dan Wq dalam jam")
+
+    with st.expander("⚡ SIMULASI CEPAT SATU SERVER (G/G/1)"):
+        st.caption("Rekursi Lindley Wq(n+1) = max(0, Wq(n) + S(n) − A(n+1)) dihitung per blok array, "
+                   "cukup untuk jutaan pelanggan dalam hitungan detik. Memakai λ dan μ di atas (c = 1).")
+        pilihan_gg1 = {"Eksponensial": "exponential", "Lognormal": "lognormal", "Gamma": "gamma",
+                       "Deterministik": "deterministic", "Empiris (unggah data)": "empirical"}
+        cols = st.columns(2)
+        data_gg1 = {}
+        for kolom, (judul, kunci) in zip(cols, (("antar kedatangan", "datang"), ("waktu layanan", "layan"))):
+            with kolom:
+                dist = st.selectbox(f"Distribusi {judul}", list(pilihan_gg1), key=f"gg1_{kunci}")
+                if pilihan_gg1[dist] == "empirical":
+                    berkas = st.file_uploader(f"Data {judul} (CSV satu kolom, dalam jam)", type=["csv"],
+                                              key=f"gg1_file_{kunci}")
+                    cv = 1.0
+                    data = np.loadtxt(berkas, delimiter=",").ravel() if berkas is not None else None
+                else:
+                    cv = st.number_input(f"Koefisien variasi {judul}", min_value=0.0, value=1.0,
+                                         step=0.1, key=f"gg1_cv_{kunci}")
+                    data = None
+                data_gg1[kunci] = (pilihan_gg1[dist], cv, data)
+        pelanggan_gg1 = st.number_input("Jumlah pelanggan", min_value=10_000, value=10_000_000,
+                                        step=1_000_000, key="gg1_n")
+
+        if st.button("⚡ Simulasikan G/G/1", use_container_width=True):
+            d_datang, cv_datang, data_datang = data_gg1["datang"]
+            d_layan, cv_layan, data_layan = data_gg1["layan"]
+            try:
+                with st.spinner("Mensimulasikan..."):
+                    sim = simulate_gg1(λ, μ, int(pelanggan_gg1), arrival=d_datang, arrival_cv=cv_datang,
+                                       service=d_layan, service_cv=cv_layan,
+                                       arrival_data=data_datang, service_data=data_layan)
+            except ValueError as e:
+                st.error(f"Input tidak valid: {e}")
+            else:
+                mm1 = mmc(λ, μ, 1) if μ > λ else None
+                ukuran = ["W", "Wq", "L", "Lq"]
+                nilai_mm1 = [float(getattr(mm1, u)) if mm1 else np.inf for u in ukuran]
+                st.table({
+                    "Ukuran": ukuran,
+                    "Simulasi G/G/1": [f"{getattr(sim, u):.4f} ± {getattr(sim, u + '_hw'):.4f}" for u in ukuran],
+                    "Rumus M/M/1": [f"{v:.4f}" if np.isfinite(v) else "tidak stabil" for v in nilai_mm1],
+                    "Selisih": [f"{(getattr(sim, u) - v)/v:+.1%}" if np.isfinite(v) and v > 0 else "-"
+                                for u, v in zip(ukuran, nilai_mm1)],
+                })
+                if sim.utilization >= 0.999:
+                    st.warning("Server hampir selalu sibuk: antrian tidak stabil dan hasil bergantung pada panjang simulasi")
+                st.caption(f"{sim.customers:,} pelanggan dalam {sim.seconds:.2f} detik; "
+                           f"utilisasi {sim.utilization:.1%}; W dan Wq dalam jam")
+
+    with st.expander("📞 PENJADWALAN PETUGAS PER INTERVAL (PROFIL KEDATANGAN)"):
+        st.caption("Jumlah server minimum per interval agar SLA waktu tunggu terpenuhi (Erlang C), "
+                   "lalu ditambah selama biaya menunggu + biaya server per jam masih turun. "
+                   "Memakai μ dan biaya di atas.")
+        cols = st.columns(2)
+        with cols[0]:
+            lama_interval = st.number_input("Lama interval (menit)", min_value=1, value=15, key="stf_menit")
+            file_profil = st.file_uploader("Profil laju kedatangan (CSV, pelanggan/jam per interval)",
+                                           type=["csv"], key="stf_file")
+        with cols[1]:
+            jenis_sla = st.radio("Jenis SLA", ["Tingkat layanan", "Rata-rata waktu tunggu"], key="stf_jenis")
+            batas_detik = st.number_input("Batas waktu tunggu (detik)", min_value=1, value=20, key="stf_detik")
+            target_sl = st.number_input("Target tingkat layanan (%)", min_value=1.0, max_value=99.9,
+                                        value=80.0, key="stf_target",
+                                        disabled=jenis_sla != "Tingkat layanan")
+
+        if st.button("📞 Hitung Kebutuhan Petugas", use_container_width=True):
+            if file_profil is not None:
+                profil = np.loadtxt(file_profil, delimiter=",").ravel()
+            else:
+                # contoh: 96 interval 15 menit dengan puncak siang, skala dari λ di atas
+                jam = np.arange(96) / 4
+                profil = λ * np.maximum(0.1, np.exp(-((jam - 11) / 3) ** 2) + 0.6*np.exp(-((jam - 16) / 2) ** 2))
+                st.info("Belum ada file profil: memakai contoh profil harian 96 interval berpuncak pukul 11 dan 16")
+            try:
+                rencana = staffing(profil, μ, batas_detik/3600,
+                                   service_level=target_sl/100 if jenis_sla == "Tingkat layanan" else None,
+                                   cost_waiting=cost_waiting, cost_add_server=cost_add_server,
+                                   interval_hours=lama_interval/60)
+            except ValueError as e:
+                st.error(f"Input tidak valid: {e}")
+            else:
+                cols = st.columns(3)
+                cols[0].metric("Server puncak", f"{rencana.servers.max()}")
+                cols[1].metric("Jam-server total", f"{rencana.servers.sum()*lama_interval/60:,.1f}")
+                cols[2].metric("Total biaya", f"Rp{rencana.total_cost:,.0f}")
+
+                fig, ax1 = plt.subplots(figsize=(10, 4))
+                waktu = np.arange(profil.size) * lama_interval / 60
+                ax1.plot(waktu, profil, color="tab:blue", label="Laju kedatangan")
+                ax1.set_xlabel("Jam sejak awal profil")
+                ax1.set_ylabel("Pelanggan/jam")
+                ax2 = ax1.twinx()
+                ax2.step(waktu, rencana.servers, where="post", color="tab:red", label="Server (biaya)")
+                ax2.step(waktu, rencana.sla_servers, where="post", color="tab:orange", linestyle="--",
+                         label="Server minimum SLA")
+                ax2.set_ylabel("Jumlah server")
+                fig.legend(loc="upper left")
+                ax1.grid(True)
+                st.pyplot(fig)
+
+                keluaran = BytesIO()
+                np.savetxt(keluaran, np.column_stack([profil, rencana.sla_servers, rencana.servers,
+                                                      rencana.Wq*3600, rencana.service_level]),
+                           delimiter=",", fmt="%.6g", header="lambda,server_sla,server,Wq_detik,tingkat_layanan",
+                           comments="")
+                st.download_button("💾 Unduh jadwal petugas", keluaran.getvalue(),
+                                   file_name="jadwal_petugas.csv", mime="text/csv")
+                st.caption(f"{profil.size} interval dihitung dalam {rencana.seconds*1000:.1f} ms")
+
+    with st.expander("🏥 JARINGAN ANTRIAN (ALUR PASIEN ANTAR LOKET)"):
+        st.markdown("""
+        Pasien **Klinik Sehat Bahagia** melewati beberapa loket: pendaftaran → dokter → apotek,
+        dengan sebagian pasien kembali ke dokter atau langsung pulang. Isi satu stasiun per baris:
+        **nama, kedatangan dari luar (/jam), μ per server (/jam), jumlah server**, lalu routing
+        per baris: **dari, ke, peluang** (sisa peluang = keluar dari klinik).
+        """)
+        cols = st.columns(2)
+        with cols[0]:
+            teks_stasiun = st.text_area("Stasiun", "Pendaftaran, 12, 30, 1\nDokter, 0, 8, 2\nApotek, 0, 20, 1",
+                                        key="jrg_stasiun")
+        with cols[1]:
+            teks_routing = st.text_area("Routing (dari, ke, peluang)",
+                                        "Pendaftaran, Dokter, 1\nDokter, Apotek, 0.7\nApotek, Dokter, 0.1",
+                                        key="jrg_routing")
+
+        if st.button("🏥 Analisis Jaringan", use_container_width=True):
+            try:
+                baris_stasiun = [[v.strip() for v in b.split(",")] for b in teks_stasiun.strip().splitlines()
+                                 if b.strip()]
+                if any(len(b) != 4 for b in baris_stasiun):
+                    raise ValueError("setiap baris stasiun harus berisi 4 nilai")
+                nama = [b[0] for b in baris_stasiun]
+                indeks = {n: i for i, n in enumerate(nama)}
+                angka = np.array([[float(v) for v in b[1:]] for b in baris_stasiun])
+                rute = {}
+                for b in teks_routing.strip().splitlines():
+                    if not b.strip():
+                        continue
+                    dari, ke, peluang = (v.strip() for v in b.split(","))
+                    if dari not in indeks or ke not in indeks:
+                        raise ValueError(f"stasiun tidak dikenal pada routing: {b.strip()}")
+                    # baris ganda untuk pasangan yang sama dijumlahkan
+                    kunci = (indeks[dari], indeks[ke])
+                    rute[kunci] = rute.get(kunci, 0.0) + float(peluang)
+                P = CSRMatrix.from_coo([k[0] for k in rute], [k[1] for k in rute], list(rute.values()),
+                                       (len(nama), len(nama)))
+                jaringan = jackson_network(angka[:, 0], angka[:, 1], angka[:, 2], P)
+            except ValueError as e:
+                st.error(f"Data tidak valid: {e}")
+                st.stop()
+            stasiun = jaringan.stations
+            st.dataframe({
+                "Stasiun": nama,
+                "λ total (/jam)": np.round(jaringan.arrival_rates, 3),
+                "Kunjungan per pasien": np.round(jaringan.visits, 3),
+                "Utilisasi": [f"{u:.1%}" for u in stasiun.utilization],
+                "Wq (menit)": np.round(stasiun.Wq*60, 2),
+                "L": np.round(stasiun.L, 2),
+                "Sisa waktu di klinik (menit)": np.round(jaringan.sojourn_from*60, 1),
+            })
+            if jaringan.stable:
+                cols = st.columns(2)
+                cols[0].metric("Waktu rata-rata di klinik", f"{jaringan.sojourn_time*60:.1f} menit")
+                cols[1].metric("Pasien rata-rata di klinik", f"{jaringan.L:.1f}")
+                terpadat = int(np.argmax(stasiun.utilization))
+                st.info(f"Stasiun tersibuk: **{nama[terpadat]}** ({stasiun.utilization[terpadat]:.0%}). "
+                        "Penambahan server di stasiun ini paling berpengaruh pada waktu total.")
+            else:
+                kewalahan = [n for n, ok in zip(nama, stasiun.stable) if not ok]
+                st.error(f"Tidak stabil: λ ≥ cμ di {', '.join(kewalahan)}. Tambah server atau percepat layanan.")
+
 # =============== HALAMAN JOHNSON ===============
 elif st.session_state.current_page == "Johnson":
     st.title("⏱ PENJADWALAN DENGAN JOHNSON'S RULE")
-        with st.expander("📚 Contoh Soal & Pembahasan", expanded=True):
+    with st.expander("📚 Contoh Soal & Pembahasan", expanded=True):
         st.subheader("Studi Kasus: Bengkel Mobil")
         st.markdown("""
         **Bengkel Cepat** memiliki 5 pekerjaan dengan waktu proses:
@@ -0,0 +1,261 @@
+import math
+
+import numpy as np
+import pytest
+
+from antrian import erlang_b, erlang_c, jackson_network, mmc, simulate_gg1, simulate_queue, staffing
+from optimasi import CSRMatrix
+
+
+# =============== M/M/c DAN M/M/c/K ===============
+def _mmc_brute(lam, mu, c, K):
+    """Ukuran kinerja dari distribusi stasioner proses lahir-mati secara langsung
+    (K tak hingga dipotong jauh di ekor)."""
+    n_max = int(K) if np.isfinite(K) else 20000
+    n = np.arange(n_max + 1)
+    laju_layan = mu * np.minimum(n, c)
+    log_p = np.concatenate([[0.0], np.cumsum(np.log(lam) - np.log(laju_layan[1:]))])
+    p = np.exp(log_p - log_p.max())
+    p /= p.sum()
+    p_block = p[-1] if np.isfinite(K) else 0.0
+    masuk = lam * (1 - p_block)
+    Lq = p @ np.maximum(n - c, 0)
+    L = p @ n
+    # PASTA: pelanggan yang diterima melihat distribusi p tanpa keadaan penuh
+    terima = p[:-1] if np.isfinite(K) else p
+    p_wait = terima[c:].sum() / terima.sum()
+    return dict(p0=p[0], p_block=p_block, Lq=Lq, L=L, Wq=Lq / masuk, W=L / masuk,
+                p_wait=p_wait, throughput=masuk)
+
+
+@pytest.mark.parametrize("K", [np.inf, "hingga"])
+def test_mmc_cocok_dengan_distribusi_lahir_mati(K):
+    rng = np.random.default_rng(21)
+    for _ in range(150):
+        c = int(rng.integers(1, 40))
+        rho = rng.uniform(0.02, 0.97) if K == np.inf else rng.choice([rng.uniform(0.02, 2.5), 1.0])
+        kapasitas = np.inf if K == np.inf else c + int(rng.integers(0, 300))
+        mu = rng.uniform(0.5, 20)
+        lam = rho * c * mu
+        hasil = mmc(lam, mu, c, kapasitas)
+        ref = _mmc_brute(lam, mu, c, kapasitas)
+        assert hasil.stable
+        for nama, nilai in ref.items():
+            assert float(getattr(hasil, nama)) == pytest.approx(nilai, rel=1e-8, abs=1e-300), nama
+
+
+def test_mmc_vektor_sama_dengan_skalar_dan_tidak_stabil():
+    lam = np.array([1.0, 5.0, 9.5, 12.0])
+    hasil = mmc(lam, 1.0, 10)
+    for i, l in enumerate(lam[:3]):
+        assert float(mmc(l, 1.0, 10).L) == pytest.approx(hasil.L[i], rel=1e-14)
+    assert not hasil.stable[-1] and np.isinf(hasil.Wq[-1]) and hasil.p_wait[-1] == 1
+    np.testing.assert_allclose(erlang_c(lam[:3], 10), hasil.p_wait[:3], rtol=1e-12)
+
+
+def test_erlang_b_ribuan_server():
+    # rekursi stabil untuk c besar; bandingkan dengan bentuk log-faktorial
+    special = pytest.importorskip("scipy.special")
+    a, c = 2900.0, 3000
+    k = np.arange(c + 1)
+    log_suku = k * np.log(a) - special.gammaln(k + 1)
+    ref = np.exp(log_suku[-1] - special.logsumexp(log_suku))
+    assert float(erlang_b(a, c)) == pytest.approx(ref, rel=1e-10)
+
+
+# =============== PENJADWALAN PETUGAS ===============
+def _erlang_c_brute(lam, mu, c):
+    """Erlang C dari jumlah suku distribusi M/M/c (tanpa rekursi Erlang B)."""
+    a = lam / mu
+    suku = [a ** k / math.factorial(k) for k in range(c)]
+    ekor = a ** c / math.factorial(c) * c / (c - a)
+    return ekor / (sum(suku) + ekor)
+
+
+def _staffing_brute(lam, mu, sla_wait, service_level, cost_waiting, cost_add_server):
+    if lam == 0:
+        return 0, 0
+    c = math.floor(lam / mu) + 1
+    while True:
+        C = _erlang_c_brute(lam, mu, c)
+        if service_level is None:
+            ok = C / (c * mu - lam) <= sla_wait
+        else:
+            ok = 1 - C * math.exp(-(c * mu - lam) * sla_wait) >= service_level
+        if ok:
+            break
+        c += 1
+    sla_c = c
+
+    def biaya(c):
+        return cost_add_server * c + cost_waiting * lam * _erlang_c_brute(lam, mu, c) / (c * mu - lam)
+
+    while biaya(c + 1) < biaya(c):
+        c += 1
+    return sla_c, c
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+@pytest.mark.parametrize("service_level", [None, 0.8])
+def test_staffing_cocok_dengan_brute_force(vectorized, service_level):
+    rng = np.random.default_rng(5)
+    lam = np.concatenate([[0.0], rng.uniform(1, 120, 60)])
+    mu, batas = 6.0, 20 / 3600
+    rencana = staffing(lam, mu, batas, service_level=service_level, cost_waiting=50000,
+                       cost_add_server=200000, vectorized=vectorized)
+    for i, l in enumerate(lam):
+        sla_c, c = _staffing_brute(l, mu, batas, service_level, 50000, 200000)
+        assert rencana.sla_servers[i] == sla_c
+        assert rencana.servers[i] == c
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_staffing_c_max(vectorized):
+    lam = np.array([50.0, 120.0, 300.0])
+    with pytest.raises(ValueError, match="c_max=30"):
+        staffing(lam, 10, 20 / 3600, service_level=0.8, vectorized=vectorized, c_max=30)
+    with pytest.raises(ValueError, match="c_max=35"):
+        staffing(lam, 10, 20 / 3600, service_level=0.8, cost_waiting=50, cost_add_server=20,
+                 vectorized=vectorized, c_max=35)
+    rencana = staffing(lam, 10, 20 / 3600, service_level=0.8, cost_waiting=50, cost_add_server=20,
+                       vectorized=vectorized, c_max=36)
+    assert rencana.servers.max() == 36
+
+
+def test_staffing_biaya_server_nol_ditolak():
+    with pytest.raises(ValueError, match="biaya tambah server"):
+        staffing([50.0], 10, 20 / 3600, cost_waiting=50, cost_add_server=0)
+
+
+# =============== SIMULASI KEJADIAN DISKRIT ===============
+def _cocok(sim, ref, nama_nama=("W", "Wq", "L", "Lq")):
+    """Nilai eksak harus berada di dalam selang kepercayaan batch means."""
+    for nama in nama_nama:
+        bawah, atas = sim.interval(nama)
+        assert bawah <= ref[nama] <= atas, (nama, sim.interval(nama), ref[nama])
+
+
+@pytest.mark.parametrize("c, K", [(1, np.inf), (12, np.inf), (3, 6)])
+def test_simulate_queue_mmc_di_dalam_selang(c, K):
+    lam = 0.75 * c
+    sim = simulate_queue(lam, 1.0, c=c, K=K, customers=200_000, seed=c, confidence=0.999)
+    m = mmc(lam, 1.0, c, K)
+    _cocok(sim, {nama: float(getattr(m, nama)) for nama in ("W", "Wq", "L", "Lq")})
+    assert sim.balk_rate == pytest.approx(float(m.p_block), abs=5e-3)
+    assert sim.utilization == pytest.approx(float(m.utilization), rel=2e-2)
+
+
+@pytest.mark.parametrize("service, cv", [("deterministic", 0.0), ("gamma", 0.5), ("lognormal", 2.0)])
+def test_simulate_queue_mg1_pollaczek_khinchine(service, cv):
+    lam, mu = 0.7, 1.0
+    sim = simulate_queue(lam, mu, customers=300_000, service=service, service_cv=cv, seed=4,
+                         confidence=0.999)
+    rho = lam / mu
+    Wq = lam * (1 + cv * cv) / mu ** 2 / (2 * (1 - rho))
+    _cocok(sim, {"Wq": Wq, "W": Wq + 1 / mu, "Lq": lam * Wq, "L": lam * (Wq + 1 / mu)})
+
+
+def test_simulate_queue_balking_cocok_dengan_rantai_lahir_mati():
+    lam, mu, c = 3.0, 1.0, 2
+    balking = [0.0, 0.1, 0.4, 0.7, 0.9]
+    sim = simulate_queue(lam, mu, c=c, balking=balking, customers=200_000, seed=8, confidence=0.999)
+    n = np.arange(200)
+    datang = lam * (1 - np.array([balking[min(k, len(balking) - 1)] for k in n]))
+    p = np.concatenate([[1.0], np.cumprod(datang[:-1] / (mu * np.minimum(n[1:], c)))])
+    p /= p.sum()
+    masuk = p @ datang
+    L, Lq = p @ n, p @ np.maximum(n - c, 0)
+    _cocok(sim, {"L": L, "Lq": Lq, "W": L / masuk, "Wq": Lq / masuk})
+    assert sim.balk_rate == pytest.approx(1 - masuk / lam, abs=5e-3)
+
+
+# =============== SIMULASI G/G/1 (LINDLEY) ===============
+@pytest.mark.parametrize("chunk", [997, 1 << 20])
+def test_simulate_gg1_sama_dengan_loop_lindley(chunk):
+    lam, mu, customers, warmup, batches, seed = 0.9, 1.0, 20_000, 0.1, 10, 3
+    sim = simulate_gg1(lam, mu, customers=customers, warmup=warmup, batches=batches, chunk=chunk,
+                       seed=seed)
+    # aliran acak yang sama: per potongan antar kedatangan lalu waktu layanan
+    rng = np.random.default_rng(seed)
+    A, S = [], []
+    for awal in range(0, customers, chunk):
+        m = min(chunk, customers - awal)
+        A.append(rng.exponential(1 / lam, m))
+        S.append(rng.exponential(1 / mu, m))
+    A, S = np.concatenate(A), np.concatenate(S)
+    Wq = np.zeros(customers)
+    for i in range(1, customers):
+        Wq[i] = max(0.0, Wq[i - 1] + S[i - 1] - A[i])
+    n_buang = int(warmup * customers)
+    bagian = slice(n_buang, None)
+    per_batch = (Wq[bagian] + S[bagian]).reshape(batches, -1)
+    rentang = A[bagian].reshape(batches, -1).sum(axis=1)
+    assert sim.W == pytest.approx(per_batch.mean(), rel=1e-9)
+    assert sim.Wq == pytest.approx(Wq[bagian].mean(), rel=1e-9)
+    assert sim.L == pytest.approx((per_batch.sum(axis=1) / rentang).mean(), rel=1e-9)
+
+
+@pytest.mark.parametrize("service, cv", [("exponential", 1.0), ("deterministic", 0.0), ("gamma", 0.5)])
+def test_simulate_gg1_mg1_pollaczek_khinchine(service, cv):
+    lam, mu = 0.8, 1.0
+    sim = simulate_gg1(lam, mu, customers=2_000_000, service=service, service_cv=cv, seed=6,
+                       confidence=0.999)
+    Wq = lam * (1 + cv * cv) / mu ** 2 / (2 * (1 - lam / mu))
+    _cocok(sim, {"Wq": Wq, "W": Wq + 1 / mu, "Lq": lam * Wq, "L": lam * (Wq + 1 / mu)})
+    assert sim.utilization == pytest.approx(lam / mu, rel=1e-2)
+
+
+def test_simulate_gg1_dm1_eksak():
+    optimize = pytest.importorskip("scipy.optimize")
+    lam, mu = 0.8, 1.0
+    # D/M/1: Wq = sigma / (mu (1 - sigma)), sigma akar sigma = exp(-mu (1 - sigma) / lam) di (0, 1)
+    sigma = optimize.brentq(lambda x: x - np.exp(-mu * (1 - x) / lam), 1e-12, 1 - 1e-12)
+    sim = simulate_gg1(lam, mu, customers=2_000_000, arrival="deterministic", seed=7, confidence=0.999)
+    Wq = sigma / (mu * (1 - sigma))
+    _cocok(sim, {"Wq": Wq, "W": Wq + 1 / mu, "Lq": lam * Wq, "L": lam * (Wq + 1 / mu)})
+
+
+# =============== JARINGAN JACKSON ===============
+def _jaringan_acak(rng, n, kepadatan):
+    P = rng.uniform(0, 1, (n, n)) * (rng.random((n, n)) < kepadatan)
+    # setiap baris menyisakan peluang keluar agar jaringan terbuka
+    P *= rng.uniform(0.3, 0.9, (n, 1)) / np.maximum(P.sum(axis=1, keepdims=True), 1e-12)
+    gamma = rng.uniform(0, 2, n) * (rng.random(n) < 0.5)
+    gamma[0] += 1.0
+    return P, gamma
+
+
+def test_jackson_network_cocok_dengan_penyelesaian_langsung():
+    rng = np.random.default_rng(25)
+    for _ in range(20):
+        n = int(rng.integers(2, 30))
+        P, gamma = _jaringan_acak(rng, n, 0.3)
+        lam = np.linalg.solve(np.eye(n) - P.T, gamma)
+        c = rng.integers(1, 5, n)
+        mu = lam / c / rng.uniform(0.3, 0.95, n) + 0.1
+        hasil = jackson_network(gamma, mu, c, P)
+        assert hasil.stable
+        np.testing.assert_allclose(hasil.arrival_rates, lam, rtol=1e-10)
+        m = mmc(lam, mu, c)
+        np.testing.assert_allclose(hasil.stations.W, m.W, rtol=1e-12)
+        np.testing.assert_allclose(hasil.sojourn_from, np.linalg.solve(np.eye(n) - P, m.W), rtol=1e-10)
+        # hukum Little untuk seluruh jaringan = rata-rata waktu dari titik masuk
+        assert hasil.sojourn_time == pytest.approx(gamma @ hasil.sojourn_from / gamma.sum(), rel=1e-10)
+
+
+def test_jackson_network_iteratif_sama_dengan_padat():
+    rng = np.random.default_rng(26)
+    n = 400
+    P, gamma = _jaringan_acak(rng, n, 0.01)
+    mu = 2.0 * np.linalg.solve(np.eye(n) - P.T, gamma) + 0.5
+    padat = jackson_network(gamma, mu, 1, P)
+    jarang = jackson_network(gamma, mu, 1, CSRMatrix.from_dense(P), dense_limit=10)
+    np.testing.assert_allclose(jarang.arrival_rates, padat.arrival_rates, rtol=1e-10)
+    np.testing.assert_allclose(jarang.sojourn_from, padat.sojourn_from, rtol=1e-10)
+
+
+def test_jackson_network_tidak_stabil_dan_tertutup():
+    hasil = jackson_network([1.0, 0.0], [1.5, 0.5], routing=[[0, 0.5], [0, 0]])
+    assert not hasil.stable and np.isinf(hasil.sojourn_time)
+    with pytest.raises(ValueError, match="tidak terbuka"):
+        jackson_network([1.0, 0.0], [5.0, 5.0], routing=[[0, 1.0], [1.0, 0]])
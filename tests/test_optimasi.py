@@ -0,0 +1,512 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import optimasi
+from optimasi import (CSRMatrix, LPCache, _BandNormal, _DenseNormal, _normal_equations, plan_multiperiod, sensitivity,
+                      solve_lp, solve_milp)
+
+STATUS_SCIPY = {0: "optimal", 2: "infeasible", 3: "unbounded"}
+
+
+# =============== SIMPLEKS ===============
+def _lp_acak(rng, m=None, n=None, jarang=0.0):
+    """LP acak berdata kontinu (praktis tak degenerat) dengan tanda dan batas campuran."""
+    m = rng.integers(1, 9) if m is None else m
+    n = rng.integers(1, 9) if n is None else n
+    A = rng.normal(size=(m, n)) * (rng.random((m, n)) >= jarang)
+    b = rng.normal(size=m) * 3 + 1
+    c = rng.normal(size=n)
+    sense = rng.choice(["<", ">", "="], m, p=[0.5, 0.3, 0.2])
+    pilihan = [(0.0, np.inf), (-np.inf, np.inf), (-2.0, 4.0), (1.0, np.inf), (-np.inf, 3.0)]
+    bounds = np.array([pilihan[k] for k in rng.integers(0, len(pilihan), n)])
+    return c, A, b, sense, bounds
+
+
+def _linprog(c, A, b, sense, bounds, maximize):
+    """Rujukan scipy.optimize.linprog (HiGHS) untuk bentuk masalah solve_lp."""
+    optimize = pytest.importorskip("scipy.optimize")
+    kecil, besar, sama = sense == "<", sense == ">", sense == "="
+    A_ub = np.vstack([A[kecil], -A[besar]])
+    b_ub = np.concatenate([b[kecil], -b[besar]])
+    return optimize.linprog(-c if maximize else c, A_ub=A_ub if A_ub.size else None,
+                            b_ub=b_ub if A_ub.size else None, A_eq=A[sama] if sama.any() else None,
+                            b_eq=b[sama] if sama.any() else None, bounds=bounds, method="highs")
+
+
+def _status_rujukan(ref, c, A, b, sense, bounds):
+    """Presolve HiGHS kadang melaporkan LP tak terbatas sebagai 'infeasible';
+    ulangi dengan tujuan nol untuk memastikan daerah layaknya memang kosong."""
+    if ref.status == 2 and _linprog(np.zeros_like(c), A, b, sense, bounds, False).status == 0:
+        return "unbounded"
+    return STATUS_SCIPY[ref.status]
+
+
+def _cek_layak(hasil, A, b, sense, bounds, tol=1e-7):
+    act = A @ hasil.x
+    assert np.all(act[sense == "<"] <= b[sense == "<"] + tol)
+    assert np.all(act[sense == ">"] >= b[sense == ">"] - tol)
+    np.testing.assert_allclose(act[sense == "="], b[sense == "="], atol=tol)
+    assert np.all(hasil.x >= bounds[:, 0] - tol) and np.all(hasil.x <= bounds[:, 1] + tol)
+    np.testing.assert_allclose(hasil.slack, b - act, atol=1e-9)
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+def test_simpleks_cocok_dengan_linprog(maximize):
+    rng = np.random.default_rng(11 if maximize else 12)
+    dilihat = set()
+    for _ in range(400):
+        c, A, b, sense, bounds = _lp_acak(rng)
+        ref = _linprog(c, A, b, sense, bounds, maximize)
+        hasil = solve_lp(c, A, b, bounds=bounds, sense=sense, maximize=maximize, method="simplex")
+        assert hasil.status == _status_rujukan(ref, c, A, b, sense, bounds)
+        dilihat.add(hasil.status)
+        if hasil.success:
+            nilai = -ref.fun if maximize else ref.fun
+            assert hasil.objective == pytest.approx(nilai, rel=1e-7, abs=1e-7)
+            _cek_layak(hasil, A, b, sense, bounds)
+    assert dilihat == {"optimal", "infeasible", "unbounded"}
+
+
+def test_simpleks_masalah_kecil_dan_kasus_tepi():
+    # bauran dua produk: sudut (2, 6) dengan z = 36
+    hasil = solve_lp([3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18])
+    assert hasil.status == "optimal"
+    np.testing.assert_allclose(hasil.x, [2, 6])
+    assert hasil.objective == pytest.approx(36)
+    assert solve_lp([1, 1], [[1, 1]], [-1]).status == "infeasible"
+    assert solve_lp([1, 0], [[0, 1]], [5], method="simplex").status == "unbounded"
+    # satu kendala '<' tak-negatif lewat jalur cepat solve_single_resource
+    hasil = solve_lp([4, 3, 1], [[2, 1, 1]], [10], bounds=[(0, 3), (0, 2), (0, 10)])
+    ref = solve_lp([4, 3, 1], [[2, 1, 1]], [10], bounds=[(0, 3), (0, 2), (0, 10)], method="simplex")
+    assert hasil.objective == pytest.approx(ref.objective)
+    with pytest.raises(ValueError):
+        solve_lp([1, 2], [[1, 1]], [1, 2])
+    with pytest.raises(ValueError):
+        solve_lp([1], [[1]], [1], sense=["!"])
+    with pytest.raises(ValueError):
+        solve_lp([1], [[1]], [1], bounds=[(3, 1)])
+
+
+# =============== MATRIKS JARANG (CSR) ===============
+def test_csr_operasi_sama_dengan_padat():
+    rng = np.random.default_rng(4)
+    A = rng.normal(size=(9, 7)) * (rng.random((9, 7)) < 0.3)
+    A[3] = 0.0                                      # baris dan kolom kosong
+    A[:, 5] = 0.0
+    baris, kolom = np.nonzero(A)
+    acak = rng.permutation(baris.size)
+    S = CSRMatrix.from_coo(baris[acak], kolom[acak], A[baris, kolom][acak], A.shape)
+    np.testing.assert_array_equal(S.toarray(), A)
+    np.testing.assert_array_equal(CSRMatrix.from_dense(A).toarray(), A)
+    assert S.nnz == np.count_nonzero(A)
+    x, y, Y = rng.normal(size=7), rng.normal(size=9), rng.normal(size=(4, 9))
+    np.testing.assert_allclose(S.dot(x), A @ x, atol=1e-14)
+    np.testing.assert_allclose(S.tdot(y), A.T @ y, atol=1e-14)
+    np.testing.assert_allclose(S.col_norms2(), (A ** 2).sum(axis=0), atol=1e-14)
+    np.testing.assert_allclose(S.rmatmat(Y), Y @ A, atol=1e-14)
+    for j in range(7):
+        np.testing.assert_array_equal(S.column(j), A[:, j])
+    r, k, v = S.to_coo()
+    np.testing.assert_array_equal(A[r, k], v)
+
+
+def test_csr_menolak_struktur_tidak_konsisten():
+    with pytest.raises(ValueError):
+        CSRMatrix([0, 1], [0], [1.0, 2.0], (1, 2))
+    with pytest.raises(ValueError):
+        CSRMatrix([0, 2], [0], [1.0, 2.0], (1, 2))
+    with pytest.raises(ValueError):
+        CSRMatrix([0, 1], [2], [1.0], (1, 2))
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+def test_solve_lp_csr_sama_dengan_padat(maximize):
+    rng = np.random.default_rng(21 if maximize else 22)
+    for _ in range(200):
+        c, A, b, sense, bounds = _lp_acak(rng, jarang=0.6)
+        padat = solve_lp(c, A, b, bounds=bounds, sense=sense, maximize=maximize, method="simplex")
+        jarang = solve_lp(c, CSRMatrix.from_dense(A), b, bounds=bounds, sense=sense, maximize=maximize,
+                          method="simplex")
+        assert jarang.status == padat.status
+        if padat.success:
+            assert jarang.objective == pytest.approx(padat.objective, rel=1e-9, abs=1e-9)
+            np.testing.assert_allclose(jarang.duals, padat.duals, rtol=1e-7, atol=1e-9)
+            _cek_layak(jarang, A, b, sense, bounds)
+
+
+def test_solve_lp_csr_besar_cocok_dengan_linprog():
+    rng = np.random.default_rng(5)
+    m, n = 120, 200
+    A = np.abs(rng.normal(size=(m, n))) * (rng.random((m, n)) < 0.03)
+    A[np.arange(m), rng.integers(0, n, m)] += 1.0    # setiap baris berisi
+    b = rng.uniform(10, 50, m)
+    c = rng.uniform(1, 5, n)
+    sense = np.full(m, "<")
+    bounds = np.column_stack([np.zeros(n), rng.uniform(1, 10, n)])
+    ref = _linprog(c, A, b, sense, bounds, True)
+    hasil = solve_lp(c, CSRMatrix.from_dense(A), b, bounds=bounds)
+    assert hasil.status == "optimal"
+    assert hasil.objective == pytest.approx(-ref.fun, rel=1e-9)
+    _cek_layak(hasil, A, b, sense, bounds)
+
+
+# =============== WARM START ===============
+@pytest.mark.parametrize("ubah", ["c", "b", "bounds", "semua"])
+def test_warm_start_sama_dengan_solve_dingin(ubah):
+    rng = np.random.default_rng(["c", "b", "bounds", "semua"].index(ubah))
+    diuji = iterasi_hangat = iterasi_dingin = 0
+    while diuji < 150:
+        c, A, b, sense, bounds = _lp_acak(rng)
+        awal = solve_lp(c, A, b, bounds=bounds, sense=sense, method="simplex")
+        if not awal.success:
+            continue
+        diuji += 1
+        if ubah in ("c", "semua"):
+            c = c + rng.normal(size=c.size) * 0.3
+        if ubah in ("b", "semua"):
+            b = b + rng.normal(size=b.size) * 0.5
+        if ubah in ("bounds", "semua"):
+            bounds = bounds.copy()
+            bounds[:, 1] = np.where(np.isfinite(bounds[:, 1]), bounds[:, 1] + rng.uniform(-1, 1, c.size),
+                                    bounds[:, 1])
+        hangat = solve_lp(c, A, b, bounds=bounds, sense=sense, basis=awal.basis)
+        dingin = solve_lp(c, A, b, bounds=bounds, sense=sense, method="simplex")
+        assert hangat.status == dingin.status
+        if dingin.success:
+            assert "warm start" in hangat.message
+            assert hangat.objective == pytest.approx(dingin.objective, rel=1e-8, abs=1e-8)
+            _cek_layak(hangat, A, b, sense, bounds)
+            iterasi_hangat += hangat.iterations
+            iterasi_dingin += dingin.iterations
+    assert iterasi_hangat < iterasi_dingin
+
+
+def test_warm_start_basis_optimal_tanpa_pivot():
+    c, A, b = [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18]
+    awal = solve_lp(c, A, b)
+    ulang = solve_lp(c, A, b, basis=awal.basis)
+    assert ulang.iterations == 0
+    np.testing.assert_allclose(ulang.x, awal.x)
+    # kapasitas berubah: basis lama tetap layak dual, cukup simpleks dual
+    ulang = solve_lp(c, A, [4, 12, 6], basis=awal.basis)
+    assert "simpleks dual" in ulang.message
+    assert ulang.objective == pytest.approx(solve_lp(c, A, [4, 12, 6]).objective)
+
+
+# =============== ANALISIS SENSITIVITAS ===============
+def _dual_linprog(ref, sense, maximize):
+    """dz/db per baris dari marginal HiGHS (baris '>' dinegasikan saat dikirim)."""
+    df = np.zeros(sense.size)
+    ineq = np.flatnonzero(sense != "=")
+    urutan = np.concatenate([ineq[sense[ineq] == "<"], ineq[sense[ineq] == ">"]])
+    df[urutan] = ref.ineqlin.marginals
+    df[sense == ">"] *= -1
+    if (sense == "=").any():
+        df[sense == "="] = ref.eqlin.marginals
+    return -df if maximize else df
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+def test_harga_bayangan_cocok_dengan_linprog(maximize):
+    rng = np.random.default_rng(31 if maximize else 32)
+    diuji = 0
+    while diuji < 200:
+        c, A, b, sense, bounds = _lp_acak(rng)
+        hasil = solve_lp(c, A, b, bounds=bounds, sense=sense, maximize=maximize, method="simplex")
+        if not hasil.success:
+            continue
+        diuji += 1
+        ref = _linprog(c, A, b, sense, bounds, maximize)
+        np.testing.assert_allclose(hasil.duals, _dual_linprog(ref, sense, maximize), rtol=1e-6, atol=1e-8)
+        np.testing.assert_allclose(hasil.reduced_costs, c - A.T @ hasil.duals, atol=1e-9)
+        sens = sensitivity(hasil)
+        np.testing.assert_allclose(sens.duals, hasil.duals, atol=1e-12)
+        np.testing.assert_allclose(sens.reduced_costs, hasil.reduced_costs, atol=1e-12)
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+def test_rentang_sensitivitas_dengan_solve_ulang(maximize):
+    rng = np.random.default_rng(41 if maximize else 42)
+    diuji = 0
+    while diuji < 60:
+        c, A, b, sense, bounds = _lp_acak(rng)
+        hasil = solve_lp(c, A, b, bounds=bounds, sense=sense, maximize=maximize, method="simplex")
+        if not hasil.success:
+            continue
+        diuji += 1
+        sens = sensitivity(hasil)
+
+        def solve(c2=c, b2=b):
+            return solve_lp(c2, A, b2, bounds=bounds, sense=sense, maximize=maximize, method="simplex")
+
+        for j in range(c.size):
+            for arah, rentang in ((1, sens.c_increase[j]), (-1, sens.c_decrease[j])):
+                # di dalam rentang titik optimal tetap sama
+                delta = 0.9 * min(rentang, 1.0)
+                c2 = c.copy()
+                c2[j] += arah * delta
+                np.testing.assert_allclose(solve(c2=c2).x, hasil.x, atol=1e-7)
+                if np.isfinite(rentang) and rentang > 1e-6:
+                    # lewat batas rentang basis (dan titik sudutnya) berganti
+                    c2[j] = c[j] + arah * 1.1 * rentang
+                    ulang = solve(c2=c2)
+                    assert not ulang.success or np.abs(ulang.x - hasil.x).max() > 1e-7
+        for i in range(b.size):
+            for arah, rentang in ((1, sens.b_increase[i]), (-1, sens.b_decrease[i])):
+                # di dalam rentang nilai optimal berubah linear menurut harga bayangan
+                delta = arah * 0.9 * min(rentang, 1.0)
+                b2 = b.copy()
+                b2[i] += delta
+                ulang = solve(b2=b2)
+                assert ulang.success
+                assert ulang.objective == pytest.approx(hasil.objective + hasil.duals[i] * delta, abs=1e-7)
+
+
+# =============== INTERIOR-POINT ===============
+@pytest.mark.parametrize("crossover", [False, True])
+@pytest.mark.parametrize("maximize", [True, False])
+def test_interior_point_cocok_dengan_linprog(maximize, crossover):
+    rng = np.random.default_rng(61 + 2 * maximize + crossover)
+    for _ in range(200):
+        c, A, b, sense, bounds = _lp_acak(rng)
+        ref = _linprog(c, A, b, sense, bounds, maximize)
+        hasil = solve_lp(c, A, b, bounds=bounds, sense=sense, maximize=maximize, method="ipm",
+                         crossover=crossover)
+        # masalah tak layak/tak terbatas diserahkan ke simpleks
+        assert hasil.status == _status_rujukan(ref, c, A, b, sense, bounds)
+        if hasil.success:
+            nilai = -ref.fun if maximize else ref.fun
+            assert hasil.objective == pytest.approx(nilai, rel=1e-6, abs=1e-6)
+            _cek_layak(hasil, A, b, sense, bounds, tol=1e-6)
+            if crossover:
+                assert hasil.basis is not None
+                assert sensitivity(hasil).duals == pytest.approx(hasil.duals)
+            else:
+                np.testing.assert_allclose(hasil.duals, _dual_linprog(ref, sense, maximize), rtol=1e-4,
+                                           atol=1e-6)
+
+
+def test_interior_point_model_padat_besar():
+    rng = np.random.default_rng(7)
+    m, n = optimasi.IPM_MIN_ROWS, 400
+    A = rng.uniform(0, 1, (m, n))
+    b = rng.uniform(50, 100, m)
+    c = rng.uniform(1, 10, n)
+    sense = np.where(rng.random(m) < 0.8, "<", ">")
+    b[sense == ">"] = rng.uniform(0, 5, (sense == ">").sum())
+    bounds = np.column_stack([np.zeros(n), np.full(n, 20.0)])
+    ref = _linprog(c, A, b, sense, bounds, True)
+    for crossover in (False, True):
+        hasil = solve_lp(c, A, b, bounds=bounds, sense=sense, crossover=crossover)
+        assert "interior-point" in hasil.message
+        assert hasil.objective == pytest.approx(-ref.fun, rel=1e-7)
+        _cek_layak(hasil, A, b, sense, bounds, tol=1e-6)
+    assert hasil.basis is not None
+    assert solve_lp(c, A, b, bounds=bounds, sense=sense, basis=hasil.basis).iterations == 0
+
+
+# =============== CACHE LP ===============
+def test_cache_baris_dipermutasi_dan_diskalakan():
+    rng = np.random.default_rng(51)
+    cache = LPCache()
+    diuji = 0
+    while diuji < 80:
+        c, A, b, sense, bounds = _lp_acak(rng)
+        langsung = solve_lp(c, A, b, bounds=bounds, sense=sense, method="simplex")
+        if not langsung.success:
+            continue
+        diuji += 1
+        pertama = cache.solve(c, A, b, bounds=bounds, sense=sense, method="simplex")
+        assert pertama.objective == pytest.approx(langsung.objective, rel=1e-12, abs=1e-12)
+        # urutan baris diacak, baris diskalakan, dan baris '>' ditulis ulang sebagai '<'
+        p = rng.permutation(b.size)
+        skala = rng.uniform(0.1, 10, b.size)
+        A2, b2, s2 = A[p] * skala[p, None], b[p] * skala[p], sense[p].copy()
+        balik = rng.random(b.size) < 0.5
+        balik &= s2 != "="
+        A2[balik], b2[balik] = -A2[balik], -b2[balik]
+        s2[balik] = np.where(s2[balik] == "<", ">", "<")
+        hit = cache.stats()["hits"]
+        kedua = cache.solve(c, A2, b2, bounds=bounds, sense=s2, method="simplex")
+        assert cache.stats()["hits"] == hit + 1
+        assert kedua.iterations == 0
+        rujukan = solve_lp(c, A2, b2, bounds=bounds, sense=s2, method="simplex")
+        assert kedua.objective == pytest.approx(rujukan.objective, rel=1e-9, abs=1e-9)
+        np.testing.assert_allclose(kedua.duals, rujukan.duals, rtol=1e-7, atol=1e-9)
+        np.testing.assert_allclose(kedua.slack, b2 - A2 @ kedua.x, atol=1e-9)
+    assert cache.stats()["misses"] == 80
+
+
+def test_cache_hit_mengembalikan_salinan():
+    cache = LPCache()
+    c, A, b = [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18]
+    pertama = cache.solve(c, A, b)
+    pertama.x[:] = -1
+    pertama.basis.head[:] = 0
+    kedua = cache.solve(c, A, b)
+    assert kedua.message.endswith("[cache]")
+    np.testing.assert_allclose(kedua.x, [2, 6])
+    assert sensitivity(kedua).duals == pytest.approx(solve_lp(c, A, b).duals)
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1, "bytes": cache.nbytes, "hit_rate": 0.5}
+
+
+def test_cache_kunci_opsi_status_dan_batas():
+    cache = LPCache(maxsize=2)
+    A, b = [[1, 1]], [4]
+    cache.solve([1, 2], A, b)
+    cache.solve([1, 2], A, b, method="simplex")          # opsi solver berbeda: entri baru
+    assert cache.stats()["misses"] == 2 and len(cache) == 2
+    cache.solve([1, 2.5], A, b)                          # c berbeda; entri tertua dibuang
+    assert len(cache) == 2
+    cache.solve([1, 2], A, b)
+    assert cache.stats()["hits"] == 0
+    # hasil tak layak juga disimpan
+    assert cache.solve([1, 1], [[1, 1]], [-1], method="simplex").status == "infeasible"
+    assert cache.solve([1, 1], [[2, 2]], [-2], method="simplex").status == "infeasible"
+    assert cache.stats()["hits"] == 1
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()["misses"] == 0 and cache.nbytes == 0
+    kecil = LPCache(max_bytes=16)
+    kecil.solve([1, 2], A, b)
+    assert len(kecil) == 0 and kecil.nbytes == 0
+
+
+# =============== BRANCH-AND-BOUND ===============
+def _milp_brute(c, A, b, sense, ub, maximize):
+    """Enumerasi semua titik bulat 0..ub; (status, nilai terbaik)."""
+    terbaik = None
+    for x in itertools.product(*(range(int(u) + 1) for u in ub)):
+        x = np.array(x, dtype=float)
+        act = A @ x
+        ok = all((s == "<" and a <= bi + 1e-9) or (s == ">" and a >= bi - 1e-9) or
+                 (s == "=" and abs(a - bi) <= 1e-9) for s, a, bi in zip(sense, act, b))
+        if ok:
+            z = c @ x
+            if terbaik is None or (z > terbaik if maximize else z < terbaik):
+                terbaik = z
+    return ("infeasible", None) if terbaik is None else ("optimal", terbaik)
+
+
+def test_milp_contoh_review():
+    hasil = solve_milp([3, 2], [[2, 3]], [7], sense=["="], bounds=(0, 10), maximize=True)
+    assert hasil.status == "optimal"
+    np.testing.assert_allclose(hasil.x, [2, 1])
+    assert hasil.objective == pytest.approx(8)
+    hasil = solve_milp([1, 1], [[1, 2]], [5], sense=[">"], bounds=(0, 10), maximize=False)
+    assert hasil.status == "optimal"
+    assert hasil.objective == pytest.approx(3)
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+def test_milp_cocok_dengan_enumerasi(maximize):
+    rng = np.random.default_rng(7 if maximize else 8)
+    for _ in range(150):
+        m, n = rng.integers(1, 4), rng.integers(1, 4)
+        A = rng.integers(-3, 5, (m, n)).astype(float)
+        b = rng.integers(-2, 12, m).astype(float)
+        c = rng.integers(-5, 6, n).astype(float)
+        sense = list(rng.choice(["<", ">", "="], m))
+        ub = rng.integers(1, 5, n).astype(float)
+        hasil = solve_milp(c, A, b, bounds=np.column_stack([np.zeros(n), ub]), sense=sense,
+                           maximize=maximize)
+        status, nilai = _milp_brute(c, A, b, sense, ub, maximize)
+        assert hasil.status == status
+        if nilai is not None:
+            assert hasil.objective == pytest.approx(nilai, abs=1e-7)
+
+
+def test_milp_cocok_dengan_scipy():
+    optimize = pytest.importorskip("scipy.optimize")
+    rng = np.random.default_rng(3)
+    for _ in range(40):
+        m, n = 4, 6
+        A = rng.integers(0, 6, (m, n)).astype(float)
+        sense = rng.choice(["<", ">", "="], m, p=[0.6, 0.3, 0.1])
+        x0 = rng.integers(0, 6, n).astype(float)
+        b = A @ x0                                  # x0 layak untuk baris '='
+        b[sense == "<"] += rng.integers(0, 5, (sense == "<").sum())
+        b[sense == ">"] -= rng.integers(0, 5, (sense == ">").sum())
+        c = rng.integers(-4, 8, n).astype(float)
+        lo = np.where(sense == "<", -np.inf, b)
+        hi = np.where(sense == ">", np.inf, b)
+        for maximize in (True, False):
+            ref = optimize.milp(-c if maximize else c, integrality=np.ones(n),
+                                bounds=optimize.Bounds(0, 10),
+                                constraints=optimize.LinearConstraint(A, lo, hi))
+            hasil = solve_milp(c, A, b, bounds=(0, 10), sense=list(sense), maximize=maximize,
+                               time_limit=30.0)
+            assert hasil.status == "optimal"
+            assert hasil.objective == pytest.approx(c @ ref.x, abs=1e-6)
+
+
+# =============== PRESOLVE ===============
+def test_presolve_variabel_bebas_bukan_variabel_tetap():
+    hasil = solve_lp([1, 1], [[1, 1], [1, -1]], [4, 2], bounds=[(-np.inf, np.inf), (0, np.inf)],
+                     presolve=True)
+    assert hasil.status == "optimal"
+    assert hasil.objective == pytest.approx(4)
+
+
+def test_presolve_sama_dengan_tanpa_presolve():
+    rng = np.random.default_rng(1)
+    pilihan_batas = [(-np.inf, np.inf), (0, np.inf), (-3, 5), (2, 2)]
+    for _ in range(400):
+        m, n = rng.integers(1, 8, 2)
+        A = np.round(rng.normal(size=(m, n)), 1) * (rng.random((m, n)) > 0.3)
+        b = np.round(rng.normal(size=m) * 5, 1)
+        c = np.round(rng.normal(size=n), 1)
+        sense = rng.choice(["<", ">", "="], m)
+        bounds = [pilihan_batas[k] for k in rng.integers(0, 4, n)]
+        tanpa = solve_lp(c, A, b, bounds=bounds, sense=sense)
+        dengan = solve_lp(c, A, b, bounds=bounds, sense=sense, presolve=True)
+        assert dengan.status == tanpa.status
+        if tanpa.success:
+            assert dengan.objective == pytest.approx(tanpa.objective, rel=1e-6, abs=1e-6)
+            # solusi hasil postsolve harus layak di model asli
+            act = A @ dengan.x
+            assert np.all(act[sense == "<"] <= b[sense == "<"] + 1e-6)
+            assert np.all(act[sense == ">"] >= b[sense == ">"] - 1e-6)
+            np.testing.assert_allclose(act[sense == "="], b[sense == "="], atol=1e-6)
+            lb, ub = np.array(bounds, dtype=float).T
+            assert np.all(dengan.x >= lb - 1e-6) and np.all(dengan.x <= ub + 1e-6)
+
+
+# =============== RENCANA MULTI-PERIODE ===============
+def test_persamaan_normal_berpita_sama_dengan_padat():
+    rng = np.random.default_rng(2)
+    m, n, w = 60, 150, 4
+    baris = np.concatenate([rng.integers(0, m - w, n) + rng.integers(0, w + 1, (3, n))]).ravel()
+    kolom = np.tile(np.arange(n), 3)
+    pasangan = np.unique(np.column_stack([baris, kolom]), axis=0)
+    A = CSRMatrix.from_coo(pasangan[:, 0], pasangan[:, 1], rng.normal(size=len(pasangan)), (m, n))
+    band = _normal_equations(A)
+    assert isinstance(band, _BandNormal)
+    padat = _DenseNormal(A)
+    theta = rng.uniform(0.01, 10, n + m)
+    r = rng.normal(size=m)
+    band.factor(theta, 0.0)
+    padat.factor(theta, 0.0)
+    np.testing.assert_allclose(band.solve(r), padat.solve(r), rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_plan_multiperiod_interior_point_sama_dengan_simpleks(monkeypatch, seed):
+    rng = np.random.default_rng(seed)
+    T, K, R = rng.integers(2, 40), rng.integers(1, 6), rng.integers(1, 4)
+    demand = rng.uniform(0, 80, (T, K))
+    demand[rng.random((T, K)) < 0.1] = np.inf
+    args = (rng.uniform(5, 50, K), rng.uniform(0.5, 3, (R, K)), rng.uniform(20, 200, (T, R)), demand)
+    kw = dict(holding_cost=rng.uniform(0, 5, K), initial_inventory=rng.uniform(0, 50, K),
+              max_inventory=rng.uniform(50, 100))
+    monkeypatch.setattr(optimasi, "PLAN_SIMPLEX_MAX_ROWS", 10 ** 9)
+    simpleks = plan_multiperiod(*args, **kw)
+    monkeypatch.setattr(optimasi, "PLAN_SIMPLEX_MAX_ROWS", 0)
+    interior = plan_multiperiod(*args, **kw)
+    assert simpleks.status == interior.status == "optimal"
+    assert simpleks.lp.basis is not None and interior.lp.basis is None
+    assert interior.objective == pytest.approx(simpleks.objective, rel=1e-7)
+    np.testing.assert_allclose(interior.capacity_duals, simpleks.capacity_duals, atol=1e-5)
+    assert interior.inventory.min() >= -1e-6
+    assert np.all(interior.sales <= demand + 1e-6)
@@ -0,0 +1,233 @@
+import io
+import itertools
+
+import numpy as np
+import pytest
+
+from persediaan import (bulk_eoq, eoq, eoq_constrained, eoq_discount, joint_replenishment, reorder_point,
+                        simulate_inventory, wagner_whitin)
+
+
+# =============== KATALOG CSV ===============
+def _jalankan_csv(isi, tmp_path, chunk_rows):
+    sumber = tmp_path / "katalog.csv"
+    sumber.write_bytes(isi)
+    tujuan = tmp_path / "hasil.npy"
+    ringkasan = bulk_eoq(sumber, tujuan, chunk_rows=chunk_rows)
+    return ringkasan, np.load(tujuan)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 1 << 18])
+def test_csv_baris_kosong_tidak_menambah_baris(tmp_path, chunk_rows):
+    isi = b"D,S,H,L\n1000,50,2,5\n\n2000,40,3,4\r\n  \n500,10,1,2\n\n"
+    ringkasan, hasil = _jalankan_csv(isi, tmp_path, chunk_rows)
+    assert ringkasan.rows == 3
+    assert hasil.shape == (3, 4)
+    np.testing.assert_allclose(hasil[:, 0], eoq([1000, 2000, 500], [50, 40, 10], [2, 3, 1])[0])
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 1 << 18])
+@pytest.mark.parametrize("isi, pesan", [
+    (b"D,S,H,L\n1,2,3,4\n\n1,,3,4\n", "Baris 4: ada nilai kosong"),
+    (b"1,2,3,4\n1,2,x,4\n", "Baris 2: nilai bukan angka 'x'"),
+    (b"1,2,3,4\n1,2,3\n", "Baris 2: jumlah kolom 3, seharusnya 4"),
+])
+def test_csv_rusak_melaporkan_nomor_baris(isi, pesan, chunk_rows):
+    with pytest.raises(ValueError, match=pesan):
+        bulk_eoq(io.BytesIO(isi), io.BytesIO(), chunk_rows=chunk_rows)
+
+
+def test_csv_sama_dengan_npy(tmp_path):
+    rng = np.random.default_rng(0)
+    katalog = rng.uniform(1, 100, (2000, 4))
+    teks = io.BytesIO()
+    np.savetxt(teks, katalog, delimiter=",")
+    sumber = tmp_path / "katalog.npy"
+    np.save(sumber, katalog)
+    _, dari_csv = _jalankan_csv(teks.getvalue(), tmp_path, 333)
+    tujuan = tmp_path / "dari_npy.npy"
+    bulk_eoq(sumber, tujuan, chunk_rows=333)
+    np.testing.assert_allclose(dari_csv, np.load(tujuan))
+
+
+# =============== TITIK PESAN ULANG ===============
+@pytest.mark.parametrize("distribution", ["normal", "gamma"])
+def test_reorder_point_fill_rate_cocok_dengan_scipy(distribution):
+    special = pytest.importorskip("scipy.special")
+    optimize = pytest.importorskip("scipy.optimize")
+    rng = np.random.default_rng(3)
+    n = 300
+    D = rng.uniform(100, 1e5, n)
+    L = rng.uniform(1, 30, n)
+    Q = np.sqrt(2 * D * 50 / 2)
+    sd = rng.uniform(0.01, 0.5, n) * D / 365
+    service = rng.uniform(0.8, 0.999, n)
+    hasil = reorder_point(D, L, Q, sd, 2.0, service, target="fill", distribution=distribution)
+    mu, sigma = hasil.lead_time_demand_mean, hasil.lead_time_demand_std
+    k, skala = mu ** 2 / sigma ** 2, sigma ** 2 / mu
+
+    def rugi(s, i):
+        if distribution == "normal":
+            z = (s - mu[i]) / sigma[i]
+            return sigma[i] * (np.exp(-z * z / 2) / np.sqrt(2 * np.pi) - z * special.ndtr(-z))
+        if s <= 0:
+            return mu[i] - s
+        return mu[i] * special.gammaincc(k[i] + 1, s / skala[i]) - s * special.gammaincc(k[i], s / skala[i])
+
+    for i in range(n):
+        target = (1 - service[i]) * Q[i]
+        s = optimize.brentq(lambda s: rugi(s, i) - target, mu[i] - Q[i] - 10 * sigma[i],
+                            mu[i] + 40 * sigma[i], xtol=1e-12 * mu[i])
+        assert hasil.reorder_point[i] == pytest.approx(s, rel=1e-7)
+    np.testing.assert_allclose(hasil.fill_rate, service, rtol=1e-9)
+
+
+# =============== LOT SIZING WAGNER-WHITIN ===============
+def _wagner_whitin_brute(d, K, h):
+    """Coba semua himpunan periode pesan; permintaan periode t dipenuhi pesanan
+    terakhir sebelum atau pada t. Biaya = setup + sum h_t * persediaan akhir t."""
+    n = d.size
+    terbaik = np.inf
+    for kode in range(1 << n):
+        pesan = np.array([(kode >> t) & 1 for t in range(n)], dtype=bool)
+        orders = np.zeros(n)
+        terakhir = -1
+        for t in range(n):
+            if pesan[t]:
+                terakhir = t
+            if d[t] > 0:
+                if terakhir < 0:
+                    break
+                orders[terakhir] += d[t]
+        else:
+            inventory = np.cumsum(orders - d)
+            terbaik = min(terbaik, K[orders > 0].sum() + h @ inventory)
+    return terbaik
+
+
+def test_wagner_whitin_cocok_dengan_brute_force():
+    rng = np.random.default_rng(7)
+    m, n = 150, 9
+    d = rng.integers(0, 60, (m, n)).astype(float)
+    d[rng.random((m, n)) < 0.2] = 0
+    K = rng.uniform(10, 200, (m, n))
+    h = rng.uniform(0.1, 3, (m, n))
+    rencana = wagner_whitin(d, K, h, chunk_skus=16)
+    assert np.all(rencana.inventory >= -1e-9)
+    for i in range(m):
+        biaya = K[i][rencana.orders[i] > 0].sum() + h[i] @ rencana.inventory[i]
+        assert rencana.total_cost[i] == pytest.approx(biaya, rel=1e-12)
+        assert rencana.total_cost[i] == pytest.approx(_wagner_whitin_brute(d[i], K[i], h[i]), rel=1e-12)
+    satu = wagner_whitin(d[3], K[3], h[3])
+    np.testing.assert_allclose(satu.orders, rencana.orders[3])
+    assert satu.total_cost == pytest.approx(rencana.total_cost[3])
+
+
+# =============== EOQ DISKON KUANTITAS ===============
+def _biaya_diskon(Q, D, S, b, p, h, r, scheme):
+    """Biaya tahunan pada setiap Q langsung dari definisi skema harga."""
+    Q = np.asarray(Q, dtype=float)
+    k = np.searchsorted(b, Q, side="right") - 1
+    if scheme == "all_units":
+        beli = p[k] * Q
+    else:
+        lebar = np.diff(b)
+        kumulatif = np.concatenate([[0.0], np.cumsum(p[:-1] * lebar)])
+        beli = kumulatif[k] + p[k] * (Q - b[k])
+    harga = beli / Q
+    return D * harga + D * S / Q + (h + r * harga) * Q / 2
+
+
+@pytest.mark.parametrize("scheme", ["all_units", "incremental"])
+def test_eoq_discount_cocok_dengan_grid(scheme):
+    rng = np.random.default_rng(11)
+    for _ in range(60):
+        K = rng.integers(1, 5)
+        b = np.concatenate([[0.0], np.sort(rng.uniform(10, 2000, K - 1))])
+        p = np.sort(rng.uniform(2, 20, K))[::-1]
+        D, S = rng.uniform(100, 50000), rng.uniform(5, 500)
+        h, r = rng.uniform(0, 3), rng.uniform(0, 0.4)
+        if h == 0 and r == 0:
+            continue
+        Q, k, biaya = eoq_discount(D, S, b, p, holding_cost=h, holding_rate=r, scheme=scheme)
+        assert biaya == pytest.approx(_biaya_diskon(Q, D, S, b, p, h, r, scheme), rel=1e-12)
+        grid = np.concatenate([np.geomspace(1e-2, 1e5, 400_001), b[1:], np.nextafter(b[1:], 0)])
+        assert biaya <= _biaya_diskon(grid, D, S, b, p, h, r, scheme).min() * (1 + 1e-12)
+        assert b[k] <= Q
+
+
+# =============== EOQ DENGAN KENDALA KAPASITAS ===============
+def test_eoq_constrained_cocok_dengan_scipy():
+    optimize = pytest.importorskip("scipy.optimize")
+    rng = np.random.default_rng(13)
+    for _ in range(20):
+        n = rng.integers(2, 12)
+        D, S, H = rng.uniform(100, 1e4, n), rng.uniform(10, 300, n), rng.uniform(0.5, 10, n)
+        w = rng.uniform(0.1, 3, n)
+        bebas = np.sqrt(2 * D * S / H)
+        kapasitas = rng.uniform(0.2, 1.5) * (w @ bebas)
+        hasil = eoq_constrained(D, S, H, w, kapasitas)
+        assert hasil.success
+        assert hasil.usage <= kapasitas * (1 + 1e-9)
+        ref = optimize.minimize(lambda q: np.sum(D * S / q + H * q / 2), bebas * 0.5, method="SLSQP",
+                                bounds=[(1e-6, None)] * n, options={"ftol": 1e-14, "maxiter": 500},
+                                constraints=[{"type": "ineq", "fun": lambda q: kapasitas - w @ q}])
+        assert hasil.total_cost == pytest.approx(ref.fun, rel=1e-7)
+        # harga bayangan = turunan biaya optimum terhadap kapasitas
+        eps = 1e-4 * kapasitas
+        turunan = (eoq_constrained(D, S, H, w, kapasitas - eps).total_cost
+                   - eoq_constrained(D, S, H, w, kapasitas + eps).total_cost) / (2 * eps)
+        assert hasil.shadow_price == pytest.approx(turunan, rel=1e-5, abs=1e-9)
+
+
+# =============== PEMESANAN GABUNGAN ===============
+@pytest.mark.parametrize("policy, pilihan", [("rand", np.arange(1, 13)), ("power_of_two", 2 ** np.arange(7))])
+def test_joint_replenishment_cocok_dengan_enumerasi(policy, pilihan):
+    rng = np.random.default_rng(17)
+    for _ in range(100):
+        n = rng.integers(1, 5)
+        D, s, H = rng.uniform(100, 1e4, n), rng.uniform(0, 200, n), rng.uniform(0.5, 10, n)
+        S = rng.uniform(0, 500)
+        hasil = joint_replenishment(D, S, s, H, policy=policy)
+        # untuk k tetap, T optimum tertutup dan biayanya sqrt(2 (S + sum s/k) sum k D H)
+        k = np.array(list(itertools.product(pilihan, repeat=n)), dtype=float)
+        terbaik = np.sqrt(2 * (S + (s / k).sum(axis=1)) * (k * D * H).sum(axis=1)).min()
+        assert hasil.total_cost <= terbaik * (1 + 1e-9)
+        assert np.isin(hasil.multipliers, pilihan).all()
+        biaya = (S + (s / hasil.multipliers).sum()) / hasil.base_cycle \
+            + hasil.base_cycle / 2 * (hasil.multipliers * D * H).sum()
+        assert hasil.total_cost == pytest.approx(biaya, rel=1e-12)
+        np.testing.assert_allclose(hasil.order_quantity, hasil.multipliers * hasil.base_cycle * D)
+
+
+# =============== SIMULASI MONTE CARLO (s, Q) ===============
+def test_simulate_inventory_poisson_cocok_dengan_rumus_eksak():
+    stats = pytest.importorskip("scipy.stats")
+    d, L, s, Q, horizon, paths = 10.0, 5, 40, 30, 3650, 1000
+    hasil = simulate_inventory(d * 365, 50, 2, L, s, Q, paths=paths, horizon=horizon,
+                               distribution="poisson", seed=5)
+    # permintaan bulat: posisi persediaan setelah memesan seragam di s+1..s+Q dan
+    # stok bersih akhir hari = posisi L hari sebelumnya - permintaan L hari itu
+    posisi = np.arange(s + 1, s + Q + 1)[:, None]
+    x = np.arange(0, 400)
+    peluang = stats.poisson.pmf(x, d * L)
+    bersih = posisi - x
+    fisik = (np.maximum(bersih, 0) * peluang).sum(axis=1).mean()
+    p_habis = ((bersih < 0) * peluang).sum(axis=1).mean()
+    # selisih awal (mulai dari s + Q) menggeser rata-rata sebanding 1 / horizon
+    se = hasil.avg_inventory.std() / np.sqrt(paths)
+    assert abs(hasil.avg_inventory.mean() - fisik) <= 4 * se + 250 / horizon
+    se = hasil.stockout_days.std() / np.sqrt(paths)
+    assert abs(hasil.stockout_days.mean() - p_habis * horizon) <= 4 * se + 5
+    assert hasil.orders.mean() == pytest.approx(d * 365 / Q, rel=5e-3)
+
+
+def test_simulate_inventory_tanpa_variasi_dan_seed_tetap():
+    hasil = simulate_inventory(3650, 50, 2, 5, 50, 100, paths=50, seed=1)
+    assert np.ptp(hasil.cost) == 0
+    assert hasil.stockout_days.max() == 0 and hasil.fill_rate.min() == 1
+    ulang = simulate_inventory(36500, 50, 2, 10, 1000, 1000, demand_std=30, lead_time_std=2,
+                               paths=300, chunk_paths=128, seed=9)
+    lagi = simulate_inventory(36500, 50, 2, 10, 1000, 1000, demand_std=30, lead_time_std=2,
+                              paths=300, chunk_paths=128, seed=9)
+    np.testing.assert_array_equal(ulang.cost, lagi.cost)
@@ -0,0 +1,63 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from antrian import simulate_gg1
+from replikasi import run_replications
+
+MODEL = partial(simulate_gg1, 0.8, 1.0, customers=5_000, batches=5)
+METRICS = ("W", "Wq")
+
+
+# =============== REPLIKASI PARALEL ===============
+def _replikasi_manual(seed, n):
+    """Nilai tiap replikasi dengan aliran SeedSequence.spawn yang sama."""
+    nilai = []
+    for s in np.random.SeedSequence(seed).spawn(n):
+        hasil = MODEL(seed=s)
+        nilai.append([hasil.W, hasil.Wq])
+    return np.array(nilai)
+
+
+def test_welford_sama_dengan_rumus_langsung():
+    stats = pytest.importorskip("scipy.stats")
+    ringkasan = run_replications(MODEL, METRICS, replications=12, seed=5, workers=1)
+    nilai = _replikasi_manual(5, 12)
+    assert ringkasan.replications == 12 and ringkasan.converged
+    for i, nama in enumerate(METRICS):
+        assert ringkasan.mean[nama] == pytest.approx(nilai[:, i].mean(), rel=1e-12)
+        assert ringkasan.std[nama] == pytest.approx(nilai[:, i].std(ddof=1), rel=1e-10)
+        hw = stats.t.ppf(0.975, 11) * nilai[:, i].std(ddof=1) / np.sqrt(12)
+        assert ringkasan.half_width[nama] == pytest.approx(hw, rel=1e-3)
+
+
+def test_hasil_tidak_bergantung_jumlah_pekerja():
+    kw = dict(replications=40, seed=11, rel_precision=0.05, min_replications=5)
+    satu = run_replications(MODEL, METRICS, workers=1, **kw)
+    banyak = run_replications(MODEL, METRICS, workers=3, **kw)
+    assert satu.replications == banyak.replications
+    assert satu.mean == banyak.mean and satu.half_width == banyak.half_width
+
+
+def test_berhenti_awal_saat_presisi_tercapai():
+    dipanggil = []
+    ringkasan = run_replications(MODEL, METRICS, replications=200, seed=3, workers=1, rel_precision=0.1,
+                                 min_replications=5, progress=lambda k, n: dipanggil.append((k, n)))
+    assert ringkasan.converged and ringkasan.replications < 200
+    assert dipanggil == [(k, 200) for k in range(1, ringkasan.replications + 1)]
+    for nama in METRICS:
+        assert ringkasan.half_width[nama] <= 0.1 * abs(ringkasan.mean[nama])
+    # satu replikasi sebelumnya presisi belum tercapai (atau belum min_replications)
+    sebelum = run_replications(MODEL, METRICS, replications=ringkasan.replications - 1, seed=3,
+                               workers=1, rel_precision=0.1, min_replications=5)
+    assert not sebelum.converged or ringkasan.replications - 1 < 5
+
+
+def test_tanpa_target_tidak_konvergen_jika_dihentikan():
+    ringkasan = run_replications(MODEL, METRICS, replications=4, seed=1, workers=1, abs_precision=1e-9)
+    assert ringkasan.replications == 4 and not ringkasan.converged
+    with pytest.raises(ValueError):
+        run_replications(MODEL, METRICS, replications=1)
+    with pytest.raises(ValueError):
+        run_replications(MODEL, (), replications=5)
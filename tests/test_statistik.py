@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from statistik import (GAMMA_SHAPE_WH, erfc, gamma_cdf, gamma_loss, gamma_pdf, gamma_ppf, gammaln,
+                       norm_cdf, norm_loss, norm_pdf, norm_ppf, norm_sf, t_ppf)
+
+special = pytest.importorskip("scipy.special")
+stats = pytest.importorskip("scipy.stats")
+
+
+# =============== NORMAL ===============
+def test_normal_cocok_dengan_scipy():
+    z = np.linspace(-8, 8, 2001)
+    np.testing.assert_allclose(erfc(z), special.erfc(z), rtol=1.2e-7)
+    np.testing.assert_allclose(norm_pdf(z), stats.norm.pdf(z), rtol=1e-13)
+    np.testing.assert_allclose(norm_cdf(z), stats.norm.cdf(z), rtol=1.2e-7)
+    # ekor kanan tetap presisi relatif, bukan hanya absolut
+    np.testing.assert_allclose(norm_sf(z), stats.norm.sf(z), rtol=1.2e-7)
+    # pdf - z sf saling menghapus di ekor: galat relatif erfc diperbesar ~z^2
+    ref = stats.norm.pdf(z) - z * stats.norm.sf(z)
+    assert np.all(np.abs(norm_loss(z) - ref) <= 1.2e-7 * (1 + z * z) * ref)
+
+
+def test_norm_ppf_cocok_dengan_scipy():
+    p = np.concatenate([np.logspace(-15, -1, 300), np.linspace(0.1, 0.9, 301), 1 - np.logspace(-12, -1, 300)])
+    np.testing.assert_allclose(norm_ppf(p), stats.norm.ppf(p), rtol=1.2e-9, atol=1e-12)
+    np.testing.assert_array_equal(norm_ppf([0.0, 1.0]), [-np.inf, np.inf])
+    assert np.isnan(norm_ppf([-0.1, 1.1, np.nan])).all()
+
+
+# =============== STUDENT-T ===============
+@pytest.mark.parametrize("df, rtol", [(1, 1e-12), (2, 1e-12), (3, 1e-2), (4, 1e-2), (5, 1e-3),
+                                      (9, 1e-3), (30, 1e-3), (1000, 1e-3)])
+def test_t_ppf_cocok_dengan_scipy(df, rtol):
+    p = np.concatenate([np.linspace(0.005, 0.45, 90), np.linspace(0.55, 0.995, 90)])
+    np.testing.assert_allclose(t_ppf(p, df), stats.t.ppf(p, df), rtol=rtol)
+
+
+def test_t_ppf_kasus_batas():
+    np.testing.assert_allclose(t_ppf(0.975, np.inf), stats.norm.ppf(0.975), rtol=1.2e-9)
+    np.testing.assert_array_equal(t_ppf([0.0, 1.0], 7), [-np.inf, np.inf])
+    assert np.isnan(t_ppf([0.5, 1.2], [0, 5])).all()
+
+
+# =============== GAMMA ===============
+def test_gammaln_cocok_dengan_scipy():
+    a = np.logspace(-3, 6, 500)
+    np.testing.assert_allclose(gammaln(a), special.gammaln(a), rtol=1e-10, atol=2e-10)
+
+
+def _acak_gamma(n, seed=0):
+    rng = np.random.default_rng(seed)
+    a = np.exp(rng.uniform(np.log(0.02), np.log(GAMMA_SHAPE_WH * 0.99), n))
+    skala = np.exp(rng.uniform(-3, 5, n))
+    x = a * skala * np.exp(rng.uniform(-3, 1.5, n))
+    return a, skala, x
+
+
+def test_gamma_cdf_pdf_cocok_dengan_scipy():
+    a, skala, x = _acak_gamma(20000)
+    np.testing.assert_allclose(gamma_cdf(x, a, skala), special.gammainc(a, x / skala), atol=1e-12)
+    np.testing.assert_allclose(gamma_pdf(x, a, skala), stats.gamma.pdf(x, a, scale=skala), rtol=1e-8,
+                               atol=1e-300)
+    np.testing.assert_array_equal(gamma_cdf([-1.0, 0.0], 2.0), [0.0, 0.0])
+
+
+def test_gamma_cdf_wilson_hilferty_untuk_shape_besar():
+    a = np.full(200, 4 * GAMMA_SHAPE_WH)
+    x = a * np.linspace(0.97, 1.03, 200)
+    np.testing.assert_allclose(gamma_cdf(x, a), special.gammainc(a, x), atol=1e-6)
+
+
+def test_gamma_ppf_cocok_dengan_scipy():
+    a, skala, _ = _acak_gamma(5000, seed=1)
+    p = np.random.default_rng(2).uniform(1e-6, 1 - 1e-6, a.size)
+    np.testing.assert_allclose(gamma_ppf(p, a, skala), stats.gamma.ppf(p, a, scale=skala), rtol=1e-9)
+    np.testing.assert_array_equal(gamma_ppf([0.0, 1.0], 3.0), [0.0, np.inf])
+
+
+def test_gamma_loss_cocok_dengan_scipy():
+    a, skala, x = _acak_gamma(20000, seed=3)
+    mean = a * skala
+    ref = mean * special.gammaincc(a + 1, x / skala) - x * special.gammaincc(a, x / skala)
+    np.testing.assert_allclose(gamma_loss(x, a, skala), ref, atol=1e-10 * mean.max(), rtol=0)
+    np.testing.assert_allclose(gamma_loss(x, a, skala) / mean, ref / mean, atol=1e-10)
+    # s negatif: seluruh distribusi di atas s
+    np.testing.assert_allclose(gamma_loss(-2.0, 3.0, 2.0), 8.0)